@@ -1,17 +1,30 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import Optional
+from typing import Dict, Optional
 import asyncio
+import time
 from datetime import datetime
 
 from config.config import Config
 from services.message_parser import MessageParser
 from services.sheets_manager import SheetsManager
 from services.rank_manager import RankManager
-from services.wiseoldman_api import get_wise_old_man_summary
+from services.promotion_planner import plan_promotions, plan_to_promotions, format_plan
+from services.wiseoldman_api import WiseOldManAPI, get_wise_old_man_summary
+from services.event_store import EventStore
+from services.webhook_receiver import WebhookReceiver
+from services.promotion_journal import PromotionJournal
+from services.outbound import OutboundScheduler
+from services.job_runner import Job, JobRunner, ProgressMessage
+from services.pipeline import Pipeline
+from services.report_cache import ReportCache
+from services.report_export import export_report
+# Through the bot package, so the warmed cache is the one MessageParser's valuations read
+from bot.services.runescape_wiki_api import warm_price_cache
 from utils.logger import get_logger, log_command_usage, log_error_with_context, log_achievement_parsing, log_rank_promotions
-from utils.validators import validate_month, validate_channel_restriction, validate_user_permissions, validate_guild_setup, validate_bot_permissions
+from utils.dates import parse_report_period, month_name_to_number, month_key, month_date_range, resolve_year
+from utils.validators import validate_month, validate_report_period, validate_channel_restriction, validate_user_permissions, validate_guild_setup, validate_bot_permissions
 
 class EOMCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -22,6 +35,14 @@ class EOMCog(commands.Cog):
         self.sheets_manager = None
         self.message_parser = None
         self.rank_manager = None
+        self.event_store = None
+        self.webhook_receiver = None
+        self.promotion_journal = None
+        self.report_cache = None
+        self.outbound = OutboundScheduler()
+        # Long-lived so its pooled session and gains cache are shared across runs
+        self.wom_api = WiseOldManAPI()
+        self.jobs = JobRunner()
         
         # Initialize services after bot is ready
         bot.loop.create_task(self._initialize_services())
@@ -31,16 +52,35 @@ class EOMCog(commands.Cog):
         
         try:
             self.sheets_manager = SheetsManager()
-            self.message_parser = MessageParser(self.bot)
-            self.rank_manager = RankManager(self.bot, self.sheets_manager)
+            self.event_store = EventStore()
+            self.message_parser = MessageParser(self.bot, event_store=self.event_store, wom_api=self.wom_api)
+            self.promotion_journal = PromotionJournal()
+            self.report_cache = ReportCache()
+            self.rank_manager = RankManager(self.bot, self.sheets_manager, self.promotion_journal, self.outbound)
+            
+            if Config.WEBHOOK_RECEIVER_ENABLED:
+                self.webhook_receiver = WebhookReceiver(self.bot, self.event_store, self.outbound)
+                await self.webhook_receiver.start()
+            
             self.logger.info("EOM services initialized successfully")
         except Exception as e:
             log_error_with_context(e, "service_initialization")
             raise
     
+    async def cog_unload(self):
+        await self.jobs.shutdown()
+        if self.message_parser:
+            self.message_parser.shutdown()
+        if self.webhook_receiver:
+            await self.webhook_receiver.stop()
+        await self.wom_api.close()
+    
     @app_commands.command(name="eombot", description="Process end-of-month achievements and rank promotions")
-    @app_commands.describe(month="The month to process (e.g., 'January' or 'Jan')")
-    async def eombot_command(self, interaction: discord.Interaction, month: str):
+    @app_commands.describe(
+        month="The month to process (e.g., 'January' or 'Jan')",
+        dry_run="Show the promotion plan without writing to Sheets, roles or channels"
+    )
+    async def eombot_command(self, interaction: discord.Interaction, month: str, dry_run: bool = False):
         await interaction.response.defer(thinking=True)
         
         try:
@@ -48,7 +88,7 @@ class EOMCog(commands.Cog):
             log_command_usage(
                 interaction.user.id,
                 str(interaction.user),
-                f"eombot {month}",
+                f"eombot {month}" + (" (dry run)" if dry_run else ""),
                 interaction.guild.id,
                 interaction.guild.name
             )
@@ -91,51 +131,36 @@ class EOMCog(commands.Cog):
                 await interaction.followup.send(f"❌ **Bot Permission Issues:**\n{error_list}")
                 return
             
-            # Start processing
-            await interaction.followup.send(f"🔄 Processing {month.title()} achievements and promotions...")
-            
-            # Step 1: Parse achievements
-            self.logger.info(f"Starting achievement parsing for {month}")
-            achievements = await self.message_parser.parse_monthly_achievements(month.lower())
+            month_num = month_name_to_number(month)
+            year = resolve_year(month_num)
+            journal_key = month_key(year, month_num)
+            job_key = (interaction.guild.id, journal_key)
+            label = f"{month.title()} {year} EOM" + (" dry run" if dry_run else "")
             
-            if not achievements:
-                await interaction.followup.send(f"ℹ️ No achievements found for {month.title()}.")
+            # One run per guild and month; a second request points at the run already going
+            existing = self.jobs.get(job_key)
+            if existing:
+                await interaction.followup.send(self._job_in_progress_message(existing))
                 return
             
-            log_achievement_parsing(
-                month,
-                len(achievements),
-                sum(len(member_data['achievements']) for member_data in achievements.values())
-            )
-            
-            # Step 2: Process rank promotions
-            self.logger.info("Processing rank promotions")
-            members_with_achievements = list(achievements.keys())
-            promotions = await self.rank_manager.process_rank_promotions(
-                members_with_achievements,
-                interaction.guild
+            # Progress lives on a channel message because interaction tokens expire after 15 minutes
+            message = await self.outbound.send(interaction.channel, content=f"🔄 Starting {label}...")
+            job, created = self.jobs.submit(
+                job_key,
+                label,
+                str(interaction.user),
+                ProgressMessage(message, label),
+                lambda job: self._run_eom_job(job, interaction.guild, interaction.channel,
+                                              month.title(), month_num, year, journal_key, dry_run)
             )
             
-            log_rank_promotions(promotions)
-            
-            # Step 3: Get Wise Old Man monthly gains
-            self.logger.info("Fetching Wise Old Man monthly gains")
-            try:
-                wom_summary = await get_wise_old_man_summary(limit=3)
-            except Exception as e:
-                self.logger.error(f"Failed to fetch Wise Old Man gains: {e}")
-                wom_summary = "⚠️ Unable to fetch Wise Old Man gains data."
-            
-            # Step 4: Create and send summary
-            await self._send_completion_summary(
-                interaction,
-                month.title(),
-                achievements,
-                promotions,
-                wom_summary
-            )
+            if not created:
+                # Lost a race with another request for the same month while posting
+                await message.delete()
+                await interaction.followup.send(self._job_in_progress_message(job))
+                return
             
-            self.logger.info(f"EOM processing completed for {month}")
+            await interaction.followup.send(f"🔄 {label} started in the background. Progress: {message.jump_url}")
             
         except Exception as e:
             log_error_with_context(
@@ -153,61 +178,261 @@ class EOMCog(commands.Cog):
             except:
                 pass  # Interaction might have expired
     
-    async def _send_completion_summary(self, interaction: discord.Interaction, 
-                                     month: str, achievements: dict, promotions: dict, wom_summary: str = ""):
-        try:
-            # Create achievement summary
-            achievement_summary = self.message_parser.get_achievement_summary(achievements)
-            
-            # Create promotion summary
-            promotion_summary = self.rank_manager.get_promotion_summary(promotions)
-            
-            # Combine summaries
-            full_summary = f"✅ **{month} EOM Processing Complete**\n\n"
-            full_summary += f"{achievement_summary}\n\n"
-            
-            # Add Wise Old Man summary if available
-            if wom_summary and wom_summary.strip():
-                full_summary += f"{wom_summary}\n\n"
-            
-            full_summary += f"{promotion_summary}"
-            
-            # Split message if too long
-            if len(full_summary) <= 2000:
-                await interaction.followup.send(full_summary)
-            else:
-                # Send in parts
-                parts = self._split_message(full_summary)
-                for i, part in enumerate(parts):
-                    if i == 0:
-                        await interaction.followup.send(part)
-                    else:
-                        await interaction.followup.send(part)
-                        await asyncio.sleep(1)  # Brief delay between messages
+    @staticmethod
+    def _job_in_progress_message(job: Job) -> str:
+        return f"⏳ {job.label} is already running (started by {job.started_by}): {job.progress.message.jump_url}"
+    
+    async def _run_eom_job(self, job: Job, guild: discord.Guild, channel: discord.TextChannel, month: str,
+                           month_num: int, year: int, journal_key: str, dry_run: bool) -> None:
+        progress = job.progress
         
-        except Exception as e:
-            log_error_with_context(e, "send_completion_summary")
-            await interaction.followup.send("✅ Processing completed, but there was an error sending the summary.")
+        # A journaled run for this month is either finished or resumable; never rescan it
+        if not dry_run:
+            journal_state = self.promotion_journal.load(guild.id, journal_key)
+            if journal_state.has_plan:
+                await self._finish_journaled_run(job, guild, channel, month, journal_key, journal_state)
+                return
+        
+        # Taken before scanning so events arriving mid-scan mark the cached report stale
+        checkpoints = await self.message_parser.input_checkpoints(*month_date_range(month_num, year))
+        counts = {'scanned': 0}
+        scan, wom, prices = self._report_stages(job, month, month_num, year, counts)
+        
+        async def roster():
+            # gspread is blocking; read the sheet on a worker thread alongside the scan
+            try:
+                return await asyncio.to_thread(self.sheets_manager.get_roster_snapshot)
+            except Exception as e:
+                # Promotions retry the read themselves; don't cancel the scan over it
+                self.logger.error(f"Failed to read roster snapshot ahead of promotions: {e}")
+                return None
+        
+        async def promotions(scan, roster):
+            # Never journal a run that found nothing; the month can then be rerun later
+            if not scan:
+                return {}
+            
+            members_with_achievements = list(scan.keys())
+            if dry_run:
+                if roster is None:
+                    roster = await asyncio.to_thread(self.sheets_manager.get_roster_snapshot)
+                started = time.perf_counter()
+                plan = plan_promotions(roster, set(members_with_achievements))
+                return plan, (time.perf_counter() - started) * 1000, roster
+            
+            self.logger.info("Processing rank promotions")
+            return await self.rank_manager.process_rank_promotions(
+                members_with_achievements,
+                guild,
+                journal_key=journal_key,
+                snapshot=roster
+            )
+        
+        pipeline = self._progress_pipeline(job, dry_run)
+        pipeline.add('scan', scan).add('roster', roster).add('prices', prices)
+        if not dry_run:
+            pipeline.add('wom', wom)
+        pipeline.add('promotions', promotions, depends_on=('scan', 'roster'))
+        
+        results = await pipeline.run()
+        achievements = results['scan']
+        
+        if not achievements:
+            await progress.finish(f"ℹ️ No achievements found for {month}.")
+            return
+        
+        log_achievement_parsing(
+            month,
+            len(achievements),
+            sum(len(member_data['achievements']) for member_data in achievements.values())
+        )
+        
+        if dry_run:
+            # The snapshot the plan was made from, which may be a retry of the roster stage's read
+            plan, elapsed_ms, roster_snapshot = results['promotions']
+            dry_run_summary = (
+                f"🧪 **{month} Dry Run** - nothing has been written.\n"
+                f"{len(achievements)} members with achievements.\n\n"
+                f"{format_plan(plan, elapsed_ms)}"
+            )
+            if roster_snapshot is not None and roster_snapshot.ambiguous_dates:
+                dry_run_summary += "\n\n⚠️ Join dates are ambiguous between month/day and day/month; set `ADDED_DATE_ORDER` to confirm."
+            await self.outbound.send_text(channel, dry_run_summary)
+            await progress.finish(self._job_done_message(job, counts['scanned'], len(achievements)))
+            return
+        
+        promotions = results['promotions']
+        log_rank_promotions(promotions)
+        
+        progress.update(stage="Posting summary", promotions=len(promotions))
+        await self._send_completion_summary(
+            channel,
+            month,
+            achievements,
+            promotions,
+            results['wom']
+        )
+        
+        self.report_cache.save(guild.id, journal_key, achievements, promotions, results['wom'], checkpoints)
+        await progress.finish(self._job_done_message(job, counts['scanned'], len(achievements)))
+        self.logger.info(f"EOM processing completed for {month}")
+    
+    @staticmethod
+    def _progress_pipeline(job: Job, dry_run: bool = False) -> Pipeline:
+        """A pipeline that shows its running stages on the job's progress message"""
+        stage_names = {
+            'scan': "Scanning channels",
+            'roster': "Reading roster",
+            'wom': "Fetching Wise Old Man gains",
+            'prices': "Loading item prices",
+            'promotions': "Planning promotions" if dry_run else "Applying promotions"
+        }
+        return Pipeline(on_change=lambda running: job.progress.update(
+            stage=", ".join(stage_names[name] for name in stage_names if name in running) or "Finishing"
+        ))
+    
+    def _report_stages(self, job: Job, month: str, month_num: int, year: int, counts: Dict):
+        """Pipeline stages shared by full runs and report rebuilds: (scan, wom, prices)"""
+        progress = job.progress
+        
+        def on_message():
+            counts['scanned'] += 1
+            if counts['scanned'] % 100 == 0:
+                progress.update(messages_scanned=counts['scanned'])
+        
+        async def scan():
+            self.logger.info(f"Starting achievement parsing for {month}")
+            achievements = await self.message_parser.parse_monthly_achievements(month.lower(), year, on_message)
+            progress.update(messages_scanned=counts['scanned'], members=len(achievements))
+            return achievements
+        
+        async def wom():
+            self.logger.info("Fetching Wise Old Man monthly gains")
+            try:
+                return await get_wise_old_man_summary(limit=3, api=self.wom_api, month=month_num, year=year)
+            except Exception as e:
+                self.logger.error(f"Failed to fetch Wise Old Man gains: {e}")
+                return "⚠️ Unable to fetch Wise Old Man gains data."
+        
+        async def prices():
+            # Loot valuation during the scan waits on this fetch instead of starting its own
+            return await warm_price_cache()
+        
+        return scan, wom, prices
+    
+    async def _rebuild_report_job(self, job: Job, guild: discord.Guild, channel: discord.TextChannel,
+                                  month: str, month_num: int, year: int, journal_key: str) -> None:
+        """Rebuild a month's report without touching promotions, which come from the journal"""
+        checkpoints = await self.message_parser.input_checkpoints(*month_date_range(month_num, year))
+        counts = {'scanned': 0}
+        scan, wom, prices = self._report_stages(job, month, month_num, year, counts)
+        
+        results = await self._progress_pipeline(job).add('scan', scan).add('wom', wom).add('prices', prices).run()
+        
+        journal_state = self.promotion_journal.load(guild.id, journal_key)
+        promotions = plan_to_promotions(journal_state.plan) if journal_state.complete else {}
+        
+        await self._send_completion_summary(channel, month, results['scan'], promotions, results['wom'])
+        if not journal_state.complete:
+            await self.outbound.send(channel, content=f"ℹ️ {month} promotions have not been processed yet; run `/eombot {month}` to apply them.")
+        else:
+            self.report_cache.save(guild.id, journal_key, results['scan'], promotions, results['wom'], checkpoints)
+        
+        await job.progress.finish(self._job_done_message(job, counts['scanned'], len(results['scan'])))
+    
+    async def _range_report_job(self, job: Job, channel: discord.TextChannel, start_date: datetime,
+                                end_date: datetime, label: str) -> None:
+        progress = job.progress
+        counts = {'scanned': 0}
+        
+        def on_message():
+            counts['scanned'] += 1
+            if counts['scanned'] % 100 == 0:
+                progress.update(messages_scanned=counts['scanned'])
+        
+        async def scan():
+            # One history pass per channel over the whole range, bucketed by month
+            monthly = await self.message_parser.parse_range_achievements(start_date, end_date, on_message)
+            progress.update(messages_scanned=counts['scanned'], months=len(monthly))
+            return monthly
+        
+        async def prices():
+            return await warm_price_cache()
+        
+        results = await self._progress_pipeline(job).add('scan', scan).add('prices', prices).run()
+        monthly_achievements = results['scan']
+        
+        progress.update(stage="Posting report")
+        await self.outbound.send_long(channel, self.message_parser.get_range_summary(monthly_achievements, label))
+        
+        members = len({member for achievements in monthly_achievements.values() for member in achievements})
+        await progress.finish(self._job_done_message(job, counts['scanned'], members))
+        self.logger.info(f"EOM range report completed for {label}")
     
-    def _split_message(self, message: str, max_length: int = 2000) -> list[str]:
-        if len(message) <= max_length:
-            return [message]
+    @staticmethod
+    def _job_done_message(job: Job, scanned: int, members: int) -> str:
+        elapsed = time.time() - job.started_at
+        message = f"✅ **{job.label}** finished in {elapsed:.0f}s ({scanned:,} messages scanned, {members} members)."
+        # Where the time went, from the job's trace; the full trace is written to TRACE_DIR
+        timings = job.trace.summary()
+        return f"{message}\n{timings}" if timings else message
+    
+    async def _finish_journaled_run(self, job: Job, guild: discord.Guild, channel: discord.TextChannel,
+                                    month: str, journal_key: str, journal_state) -> None:
+        if journal_state.complete:
+            completed_on = datetime.fromtimestamp(journal_state.completed_at).strftime('%Y-%m-%d %H:%M')
+            promotions, _ = await self.rank_manager.resume_promotions(journal_key, guild)
+            message = (f"ℹ️ {month} promotions were already applied on {completed_on}. Nothing was changed.\n\n"
+                       f"{self.rank_manager.get_promotion_summary(promotions)}\n\n"
+                       f"Use `/eomrepost {month}` to post the full report again.")
+        else:
+            job.progress.update(stage=f"Resuming interrupted run ({len(journal_state.completed_steps)} steps already done)")
+            promotions, complete = await self.rank_manager.resume_promotions(journal_key, guild)
+            log_rank_promotions(promotions)
+            if not complete:
+                message = (f"⚠️ **{month} promotions resumed but not finished**: some sheet, role or announcement "
+                           f"steps failed (see logs). Run `/eombot {month}` again to retry the remaining steps.\n\n"
+                           f"{self.rank_manager.get_promotion_summary(promotions)}")
+                await self.outbound.send_text(channel, message)
+                await job.progress.finish(f"⚠️ **{job.label}** resumed from the promotion journal; some steps are still outstanding.")
+                return
+            message = f"✅ **{month} promotions resumed and completed**\n\n{self.rank_manager.get_promotion_summary(promotions)}"
+        
+        await self.outbound.send_text(channel, message)
+        await job.progress.finish(f"✅ **{job.label}** finished from the promotion journal.")
+    
+    def _render_summary(self, month: str, achievements: dict, promotions: dict, wom_summary: str = "") -> str:
+        # Create achievement summary
+        achievement_summary = self.message_parser.get_achievement_summary(achievements)
+        
+        # Create promotion summary
+        promotion_summary = self.rank_manager.get_promotion_summary(promotions)
         
-        parts = []
-        current_part = ""
+        # Combine summaries
+        full_summary = f"✅ **{month} EOM Processing Complete**\n\n"
+        full_summary += f"{achievement_summary}\n\n"
         
-        for line in message.split('\n'):
-            if len(current_part) + len(line) + 1 <= max_length:
-                current_part += line + '\n'
-            else:
-                if current_part:
-                    parts.append(current_part.rstrip())
-                current_part = line + '\n'
+        # Add Wise Old Man summary if available
+        if wom_summary and wom_summary.strip():
+            full_summary += f"{wom_summary}\n\n"
         
-        if current_part:
-            parts.append(current_part.rstrip())
+        full_summary += f"{promotion_summary}"
+        return full_summary
+    
+    async def _send_completion_summary(self, destination: discord.abc.Messageable,
+                                     month: str, achievements: dict, promotions: dict, wom_summary: str = ""):
+        try:
+            full_summary = self._render_summary(month, achievements, promotions, wom_summary)
+            
+            # One plain message if it fits, otherwise packed into as few embed messages as possible
+            await self.outbound.send_long(destination, full_summary)
+            
+            stats = self.outbound.stats()
+            self.logger.info(f"Summary sent | Queue latency p50: {stats['p50_ms']:.0f} ms, p95: {stats['p95_ms']:.0f} ms")
         
-        return parts
+        except Exception as e:
+            log_error_with_context(e, "send_completion_summary")
+            await destination.send("✅ Processing completed, but there was an error sending the summary.")
     
     @eombot_command.error
     async def eombot_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
@@ -230,6 +455,271 @@ class EOMCog(commands.Cog):
                     ephemeral=True
                 )
     
+    @app_commands.command(name="eomreport", description="Achievement leaderboards for a quarter, year or custom month range")
+    @app_commands.describe(period="Quarter ('Q1 2025'), year ('2025'), 'YTD', or month range ('Jan-Mar')")
+    async def eomreport_command(self, interaction: discord.Interaction, period: str):
+        await interaction.response.defer(thinking=True)
+        
+        try:
+            log_command_usage(
+                interaction.user.id,
+                str(interaction.user),
+                f"eomreport {period}",
+                interaction.guild.id,
+                interaction.guild.name
+            )
+            
+            if not self.message_parser:
+                await interaction.followup.send("❌ Bot services are still initializing. Please try again in a few moments.")
+                return
+            
+            is_valid_period, period_error = validate_report_period(period)
+            if not is_valid_period:
+                await interaction.followup.send(f"❌ {period_error}")
+                return
+            
+            is_valid_channel, channel_error = validate_channel_restriction(interaction.channel)
+            if not is_valid_channel:
+                await interaction.followup.send(f"❌ {channel_error}")
+                return
+            
+            is_authorized, auth_error = validate_user_permissions(interaction.user)
+            if not is_authorized:
+                await interaction.followup.send(f"❌ {auth_error}")
+                return
+            
+            start_date, end_date, label = parse_report_period(period)
+            job_key = (interaction.guild.id, f"report_{start_date:%Y-%m}_{end_date:%Y-%m}")
+            job_label = f"{label} EOM report"
+            
+            existing = self.jobs.get(job_key)
+            if existing:
+                await interaction.followup.send(self._job_in_progress_message(existing))
+                return
+            
+            # A quarter or year scans months of history; run it past the interaction token's lifetime
+            message = await self.outbound.send(interaction.channel, content=f"🔄 Starting {job_label}...")
+            job, created = self.jobs.submit(
+                job_key,
+                job_label,
+                str(interaction.user),
+                ProgressMessage(message, job_label),
+                lambda job: self._range_report_job(job, interaction.channel, start_date, end_date, label)
+            )
+            
+            if not created:
+                await message.delete()
+                await interaction.followup.send(self._job_in_progress_message(job))
+                return
+            
+            await interaction.followup.send(f"🔄 {job_label} started in the background. Progress: {message.jump_url}")
+            
+        except Exception as e:
+            log_error_with_context(
+                e,
+                "eomreport_command",
+                period=period,
+                user=str(interaction.user),
+                guild=str(interaction.guild)
+            )
+            
+            try:
+                await interaction.followup.send(
+                    "❌ An error occurred while building the report. Please check the logs and try again."
+                )
+            except:
+                pass  # Interaction might have expired
+    
+    @app_commands.command(name="eomcancel", description="Cancel a running EOM job for a month")
+    @app_commands.describe(month="The month whose run should be cancelled (e.g., 'January' or 'Jan')")
+    async def eomcancel_command(self, interaction: discord.Interaction, month: str):
+        await interaction.response.defer(ephemeral=True)
+        
+        try:
+            log_command_usage(
+                interaction.user.id,
+                str(interaction.user),
+                f"eomcancel {month}",
+                interaction.guild.id,
+                interaction.guild.name
+            )
+            
+            is_valid_month, month_error = validate_month(month)
+            if not is_valid_month:
+                await interaction.followup.send(f"❌ {month_error}")
+                return
+            
+            is_authorized, auth_error = validate_user_permissions(interaction.user)
+            if not is_authorized:
+                await interaction.followup.send(f"❌ {auth_error}")
+                return
+            
+            month_num = month_name_to_number(month)
+            job_key = (interaction.guild.id, month_key(resolve_year(month_num), month_num))
+            job = self.jobs.get(job_key)
+            
+            if not job or not self.jobs.cancel(job_key):
+                await interaction.followup.send(f"ℹ️ No EOM run is in progress for {month.title()}.")
+                return
+            
+            self.logger.info(f"{job.label} cancelled by {interaction.user}")
+            await interaction.followup.send(
+                f"🛑 Cancelling {job.label}. Promotion steps already applied are journaled; "
+                f"run `/eombot {month}` again to resume."
+            )
+            
+        except Exception as e:
+            log_error_with_context(e, "eomcancel_command", month=month, user=str(interaction.user))
+            await interaction.followup.send("❌ Error cancelling the run. Check logs for details.")
+    
+    @app_commands.command(name="eomrepost", description="Post a month's EOM report again from the saved results")
+    @app_commands.describe(month="The month to re-post (e.g., 'January' or 'Jan')")
+    async def eomrepost_command(self, interaction: discord.Interaction, month: str):
+        await interaction.response.defer(thinking=True)
+        
+        try:
+            log_command_usage(
+                interaction.user.id,
+                str(interaction.user),
+                f"eomrepost {month}",
+                interaction.guild.id,
+                interaction.guild.name
+            )
+            
+            if not all([self.message_parser, self.report_cache]):
+                await interaction.followup.send("❌ Bot services are still initializing. Please try again in a few moments.")
+                return
+            
+            is_valid_month, month_error = validate_month(month)
+            if not is_valid_month:
+                await interaction.followup.send(f"❌ {month_error}")
+                return
+            
+            is_valid_channel, channel_error = validate_channel_restriction(interaction.channel)
+            if not is_valid_channel:
+                await interaction.followup.send(f"❌ {channel_error}")
+                return
+            
+            is_authorized, auth_error = validate_user_permissions(interaction.user)
+            if not is_authorized:
+                await interaction.followup.send(f"❌ {auth_error}")
+                return
+            
+            month_num = month_name_to_number(month)
+            year = resolve_year(month_num)
+            journal_key = month_key(year, month_num)
+            job_key = (interaction.guild.id, journal_key)
+            
+            existing = self.jobs.get(job_key)
+            if existing:
+                await interaction.followup.send(self._job_in_progress_message(existing))
+                return
+            
+            # Re-rendered from saved results unless new events for the month have arrived since
+            checkpoints = await self.message_parser.input_checkpoints(*month_date_range(month_num, year))
+            report = self.report_cache.load_fresh(interaction.guild.id, journal_key, checkpoints)
+            if report:
+                summary = self._render_summary(month.title(), report['achievements'], report['promotions'],
+                                               report['wom_summary'])
+                await self.outbound.send_long(interaction.channel, summary)
+                await interaction.followup.send(f"♻️ Re-posted the {month.title()} {year} report from saved results.")
+                return
+            
+            label = f"{month.title()} {year} report rebuild"
+            message = await self.outbound.send(interaction.channel, content=f"🔄 Starting {label}...")
+            job, created = self.jobs.submit(
+                job_key,
+                label,
+                str(interaction.user),
+                ProgressMessage(message, label),
+                lambda job: self._rebuild_report_job(job, interaction.guild, interaction.channel,
+                                                     month.title(), month_num, year, journal_key)
+            )
+            
+            if not created:
+                await message.delete()
+                await interaction.followup.send(self._job_in_progress_message(job))
+                return
+            
+            await interaction.followup.send(
+                f"🔄 No up-to-date saved report for {month.title()} {year}; rebuilding it. Progress: {message.jump_url}"
+            )
+            
+        except Exception as e:
+            log_error_with_context(e, "eomrepost_command", month=month, user=str(interaction.user))
+            try:
+                await interaction.followup.send("❌ Error re-posting the report. Check logs for details.")
+            except:
+                pass  # Interaction might have expired
+    
+    @app_commands.command(name="eomexport", description="Download a month's full EOM results as CSV and JSON files")
+    @app_commands.describe(month="The month to export (e.g., 'January' or 'Jan')")
+    async def eomexport_command(self, interaction: discord.Interaction, month: str):
+        await interaction.response.defer(thinking=True)
+        
+        try:
+            log_command_usage(
+                interaction.user.id,
+                str(interaction.user),
+                f"eomexport {month}",
+                interaction.guild.id,
+                interaction.guild.name
+            )
+            
+            if not all([self.message_parser, self.report_cache]):
+                await interaction.followup.send("❌ Bot services are still initializing. Please try again in a few moments.")
+                return
+            
+            is_valid_month, month_error = validate_month(month)
+            if not is_valid_month:
+                await interaction.followup.send(f"❌ {month_error}")
+                return
+            
+            is_authorized, auth_error = validate_user_permissions(interaction.user)
+            if not is_authorized:
+                await interaction.followup.send(f"❌ {auth_error}")
+                return
+            
+            month_num = month_name_to_number(month)
+            year = resolve_year(month_num)
+            journal_key = month_key(year, month_num)
+            
+            report = self.report_cache.load(interaction.guild.id, journal_key)
+            if not report:
+                await interaction.followup.send(
+                    f"ℹ️ No saved report for {month.title()} {year}. Run `/eombot {month}` or `/eomrepost {month}` first."
+                )
+                return
+            
+            # Complete data, untruncated, instead of the summary split across many messages
+            csv_file, json_file = await export_report(journal_key, report['achievements'], report['promotions'])
+            files = []
+            skipped = []
+            for fp, filename in ((csv_file, f"eom_{journal_key}.csv"), (json_file, f"eom_{journal_key}.json")):
+                size = fp.seek(0, 2)
+                fp.seek(0)
+                if size > interaction.guild.filesize_limit:
+                    skipped.append(filename)
+                    fp.close()
+                else:
+                    files.append(discord.File(fp, filename=filename))
+            
+            content = f"📎 {month.title()} {year} EOM results ({len(report['achievements'])} members)"
+            checkpoints = await self.message_parser.input_checkpoints(*month_date_range(month_num, year))
+            if not self.report_cache.is_fresh(report, checkpoints):
+                content += f"\n⚠️ New events have arrived since this report was saved; run `/eomrepost {month}` to refresh it."
+            if skipped:
+                content += f"\n⚠️ Too large to upload here: {', '.join(skipped)}"
+            
+            await interaction.followup.send(content, files=files)
+            
+        except Exception as e:
+            log_error_with_context(e, "eomexport_command", month=month, user=str(interaction.user))
+            try:
+                await interaction.followup.send("❌ Error exporting the report. Check logs for details.")
+            except:
+                pass  # Interaction might have expired
+    
     # Debug/Admin commands (you can remove these in production)
     @app_commands.command(name="eom-status", description="Check EOMBot configuration status")
     @app_commands.default_permissions(manage_guild=True)
@@ -260,6 +750,17 @@ class EOMCog(commands.Cog):
                 emoji = "✅" if status else "❌"
                 status_msg += f"{emoji} {service}\n"
             
+            # Outbound queue status
+            stats = self.outbound.stats()
+            status_msg += (f"\n**Outbound Queue:** {stats['sent']} sent, {stats['failed']} failed | "
+                           f"latency p50 {stats['p50_ms']:.0f} ms, p95 {stats['p95_ms']:.0f} ms\n")
+            
+            # Background jobs
+            jobs = self.jobs.active(interaction.guild.id)
+            status_msg += f"\n**Running Jobs:** {len(jobs)}\n"
+            for job in jobs:
+                status_msg += f"  • {job.label} (started by {job.started_by}): {job.progress.message.jump_url}\n"
+            
             # Guild setup status
             status_msg += f"\n**Guild Setup:** {'✅ Valid' if is_setup_valid else '❌ Issues Found'}\n"
             if setup_errors:
@@ -27,6 +27,8 @@ class Config:
     RANK_COLUMN = os.getenv('RANK_COLUMN', 'C')
     CAREER_COUNTER_COLUMN = os.getenv('CAREER_COUNTER_COLUMN', 'D')
     ADDED_DATE_COLUMN = os.getenv('ADDED_DATE_COLUMN', 'E')
+    # Order of slash dates in the added-date column: auto, mdy or dmy
+    ADDED_DATE_ORDER = os.getenv('ADDED_DATE_ORDER', 'auto').lower()
     
     # Rank Promotion Thresholds
     SAGE_PROMOTION_THRESHOLD = int(os.getenv('SAGE_PROMOTION_THRESHOLD', 5))
@@ -36,6 +38,56 @@ class Config:
     
     # Wise Old Man API Configuration
     WISE_OLD_MAN_GROUP_ID = int(os.getenv('WISE_OLD_MAN_GROUP_ID', 0))
+    WOM_API_KEY = os.getenv('WOM_API_KEY', '')
+    WOM_MAX_CONCURRENCY = int(os.getenv('WOM_MAX_CONCURRENCY', 4))
+    WOM_CACHE_TTL_SECONDS = int(os.getenv('WOM_CACHE_TTL_SECONDS', 300))
+    WOM_PAGE_SIZE = int(os.getenv('WOM_PAGE_SIZE', 50))  # Members per page when walking the whole group
+    WOM_CACHE_DIR = os.getenv('WOM_CACHE_DIR', 'data/wom')  # Gains for months that have ended
+    # Opt-in: read level/EHP milestones from WOM's group achievements instead of the WOM channel
+    WOM_ACHIEVEMENTS_SOURCE = os.getenv('WOM_ACHIEVEMENTS_SOURCE', 'false').lower() == 'true'
+    # Extra skills, bosses or activities to show leaderboards for in the EOM summary
+    WOM_LEADERBOARD_METRICS = [
+        value.strip().lower() for value in os.getenv('WOM_LEADERBOARD_METRICS', '').split(',') if value.strip()
+    ]
+    
+    # Message Parser Configuration
+    PARSER_PROCESS_POOL = os.getenv('PARSER_PROCESS_POOL', 'false').lower() == 'true'
+    PARSER_WORKERS = int(os.getenv('PARSER_WORKERS', 0))  # 0 = one worker per CPU core
+    PARSER_BATCH_SIZE = int(os.getenv('PARSER_BATCH_SIZE', 2000))
+    
+    # Webhook or application IDs of loot notifier plugins whose messages are parsed from embeds
+    NOTIFIER_WEBHOOK_IDS = {
+        int(value) for value in os.getenv('NOTIFIER_WEBHOOK_IDS', '').split(',') if value.strip()
+    }
+    
+    # Minimum seconds between edits of a running job's progress message
+    JOB_PROGRESS_INTERVAL_SECONDS = float(os.getenv('JOB_PROGRESS_INTERVAL_SECONDS', 3))
+    
+    # Saved EOM reports, re-posted by /eomrepost without rescanning
+    REPORT_CACHE_DIR = os.getenv('REPORT_CACHE_DIR', 'data/reports')
+    
+    # Days of rotated (gzipped) log files to keep
+    LOG_RETENTION_DAYS = int(os.getenv('LOG_RETENTION_DAYS', 14))
+    
+    # Per-run traces of background EOM jobs (stage timings, item and API call counts)
+    TRACE_DIR = os.getenv('TRACE_DIR', 'data/traces')
+    
+    # Promotion journal (crash recovery for /eombot runs)
+    JOURNAL_DIR = os.getenv('JOURNAL_DIR', 'data/journal')
+    
+    # Duplicate drop detection (0 disables)
+    DEDUPE_WINDOW_SECONDS = int(os.getenv('DEDUPE_WINDOW_SECONDS', 300))
+    DEDUPE_MAX_ENTRIES = int(os.getenv('DEDUPE_MAX_ENTRIES', 10000))
+    
+    # Event Store / Webhook Receiver Configuration
+    EVENT_STORE_DIR = os.getenv('EVENT_STORE_DIR', 'data/events')
+    WEBHOOK_RECEIVER_ENABLED = os.getenv('WEBHOOK_RECEIVER_ENABLED', 'false').lower() == 'true'
+    WEBHOOK_HOST = os.getenv('WEBHOOK_HOST', '0.0.0.0')
+    WEBHOOK_PORT = int(os.getenv('WEBHOOK_PORT', 8080))
+    WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET', '')
+    # Channel the received notifications are attributed to when parsing
+    WEBHOOK_CHANNEL_ID = int(os.getenv('WEBHOOK_CHANNEL_ID') or LOOT_NOTIFICATIONS_CHANNEL_ID)
+    WEBHOOK_RELAY_CHANNEL_ID = int(os.getenv('WEBHOOK_RELAY_CHANNEL_ID', 0))
     
     # Achievement Channels List
     ACHIEVEMENT_CHANNELS = [
@@ -69,4 +121,7 @@ class Config:
         if missing_vars:
             raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
         
+        if cls.WEBHOOK_RECEIVER_ENABLED and not cls.WEBHOOK_SECRET:
+            raise ValueError("WEBHOOK_SECRET is required when WEBHOOK_RECEIVER_ENABLED is true")
+        
         return True
\ No newline at end of file
@@ -26,7 +26,7 @@ class EOMBot(commands.Bot):
         )
         
         # Set up logging
-        self.logger = setup_logger('eombot', 'INFO')
+        self.logger = setup_logger('eombot', 'INFO', Config.LOG_RETENTION_DAYS)
         
     async def setup_hook(self):
         try:
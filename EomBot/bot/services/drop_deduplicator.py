@@ -0,0 +1,82 @@
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import logging
+from bot.config.config import Config
+
+logger = logging.getLogger(__name__)
+
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+QUANTITY_PATTERN = re.compile(r'^(\d[\d,]*)\s*x\s*(.+)$', re.IGNORECASE)
+
+def _normalize_text(text: str) -> str:
+    return NON_ALNUM_PATTERN.sub(' ', text.lower()).strip()
+
+def _normalize_item(item: str) -> str:
+    # "1 x Avernic treads" and "1x avernic treads." normalize to "1 avernic treads"
+    match = QUANTITY_PATTERN.match(item.strip())
+    if match:
+        return f"{match.group(1).replace(',', '')} {_normalize_text(match.group(2))}"
+    return f"1 {_normalize_text(item)}"
+
+def achievement_key(record: Dict) -> Tuple[str, str]:
+    """Time-independent identity of an achievement, for matching the same one across sources"""
+    return _normalize_text(record['member']), _normalize_text(record['achievement'])
+
+class DropDeduplicator:
+    """Drops repeat notifications of the same drop seen within a sliding time window
+
+    The same drop is often posted to both the loot and log channels, arrives via
+    the webhook receiver as well, or gets reposted. Records are keyed on a hash of
+    (normalized member, normalized items, time bucket); records without loot fall
+    back to their normalized achievement text. Records must be fed in timestamp order.
+    """
+
+    def __init__(self, window_seconds: Optional[int] = None, max_entries: Optional[int] = None):
+        self.window_seconds = Config.DEDUPE_WINDOW_SECONDS if window_seconds is None else window_seconds
+        self.max_entries = Config.DEDUPE_MAX_ENTRIES if max_entries is None else max_entries
+        self._seen = OrderedDict()  # digest -> timestamp, oldest first
+        self.duplicates_dropped = 0
+
+    def _digest(self, record: Dict, bucket: int) -> bytes:
+        member = _normalize_text(record['member'])
+        if record['loot_items']:
+            content = '|'.join(sorted(_normalize_item(item) for item in record['loot_items']))
+        else:
+            content = _normalize_text(record['achievement'])
+        return hashlib.blake2b(f"{member}\0{content}\0{bucket}".encode('utf-8'), digest_size=12).digest()
+
+    def _evict(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._seen:
+            digest, timestamp = next(iter(self._seen.items()))
+            if timestamp >= cutoff and len(self._seen) <= self.max_entries:
+                break
+            self._seen.popitem(last=False)
+
+    def is_duplicate(self, record: Dict) -> bool:
+        if self.window_seconds <= 0:
+            return False
+
+        timestamp = record['timestamp']
+        self._evict(timestamp)
+
+        # Check the neighbouring bucket too so copies straddling a bucket edge still match
+        bucket = int(timestamp // self.window_seconds)
+        digest = self._digest(record, bucket)
+        if digest in self._seen or self._digest(record, bucket - 1) in self._seen:
+            self.duplicates_dropped += 1
+            return True
+
+        self._seen[digest] = timestamp
+        return False
+
+    def filter(self, records: List[Dict]) -> List[Dict]:
+        """Return records in timestamp order with duplicates removed"""
+        unique = [record for record in sorted(records, key=lambda r: r['timestamp'])
+                  if not self.is_duplicate(record)]
+
+        if self.duplicates_dropped:
+            logger.info(f"Dropped {self.duplicates_dropped} duplicate notifications")
+        return unique
@@ -0,0 +1,75 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, List
+import logging
+from bot.config.config import Config
+from bot.utils.dates import month_key, month_key_for_timestamp
+
+logger = logging.getLogger(__name__)
+
+class EventStore:
+    """Append-only store of parsed achievement records, one JSON Lines file per month
+
+    Records have the same shape MessageParser produces from channel history, so
+    stored events merge straight into monthly and range reports.
+    """
+
+    def __init__(self, base_dir: str = None):
+        self.base_dir = base_dir or Config.EVENT_STORE_DIR
+        os.makedirs(self.base_dir, exist_ok=True)
+
+    def _month_path(self, key: str) -> str:
+        return os.path.join(self.base_dir, f"{key}.jsonl")
+
+    def append(self, record: Dict) -> str:
+        """Append a record and return the month key it was filed under"""
+        key = month_key_for_timestamp(record['timestamp'])
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False)
+
+        with open(self._month_path(key), 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+        logger.debug("Stored event for %s in %s", record['member'], key)
+        return key
+
+    def load_month(self, key: str) -> List[Dict]:
+        path = self._month_path(key)
+        if not os.path.exists(path):
+            return []
+
+        records = []
+        with open(path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt event on line {line_number} of {path}")
+
+        return records
+
+    def load_range(self, start_date: datetime, end_date: datetime) -> List[Dict]:
+        """Load stored records with start_date <= timestamp < end_date"""
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
+        records = []
+
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            for record in self.load_month(month_key(year, month)):
+                if start_ts <= record['timestamp'] < end_ts:
+                    records.append(record)
+
+            month += 1
+            if month > 12:
+                year, month = year + 1, 1
+
+        return records
+
+    def checkpoint(self, key: str) -> int:
+        """Size of a month's file; it grows whenever an event for that month is stored"""
+        path = self._month_path(key)
+        return os.path.getsize(path) if os.path.exists(path) else 0
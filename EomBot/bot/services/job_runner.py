@@ -0,0 +1,159 @@
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import logging
+import discord
+from bot.config.config import Config
+from bot.utils.tracing import Trace
+
+logger = logging.getLogger(__name__)
+
+JobKey = Tuple[int, str]  # (guild_id, 'YYYY-MM') or (guild_id, 'report_YYYY-MM_YYYY-MM')
+
+class ProgressMessage:
+    """A channel message edited in place with a job's live progress
+
+    Updates are cheap and can be made as often as convenient; edits are
+    coalesced so the message changes at most once per `min_interval` seconds.
+    """
+
+    def __init__(self, message: discord.Message, title: str, min_interval: float = None):
+        self.message = message
+        self.title = title
+        self.min_interval = Config.JOB_PROGRESS_INTERVAL_SECONDS if min_interval is None else min_interval
+        self.fields: Dict[str, object] = {}
+        self.started = time.monotonic()
+        self._last_edit = 0.0
+        self._dirty = False
+        self._pending: Optional[asyncio.Task] = None
+
+    def update(self, **fields) -> None:
+        self.fields.update(fields)
+        self._dirty = True
+        if self._pending is None:
+            self._pending = asyncio.create_task(self._edit_soon())
+
+    def render(self) -> str:
+        elapsed = time.monotonic() - self.started
+        lines = [f"🔄 **{self.title}** ({elapsed:.0f}s)"]
+        for name, value in self.fields.items():
+            name = name.replace('_', ' ').capitalize()
+            lines.append(f"**{name}:** {value:,}" if isinstance(value, int) else f"**{name}:** {value}")
+        return "\n".join(lines)
+
+    async def _edit_soon(self) -> None:
+        try:
+            # Keep editing while updates arrive during the previous edit
+            while self._dirty:
+                await asyncio.sleep(max(0.0, self._last_edit + self.min_interval - time.monotonic()))
+                self._dirty = False
+                self._last_edit = time.monotonic()
+                await self.message.edit(content=self.render())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Progress is best effort; never let it fail the job
+            logger.debug(f"Could not update progress message: {e}")
+        finally:
+            self._pending = None
+
+    async def finish(self, content: str) -> None:
+        # Stop any in-flight edit first so it cannot land after the final content
+        if self._pending is not None:
+            self._pending.cancel()
+            await asyncio.gather(self._pending, return_exceptions=True)
+        try:
+            await self.message.edit(content=content)
+        except Exception as e:
+            logger.debug(f"Could not finalize progress message: {e}")
+
+class Job:
+    def __init__(self, key: JobKey, label: str, started_by: str, progress: ProgressMessage):
+        self.key = key
+        self.label = label
+        self.started_by = started_by
+        self.progress = progress
+        self.started_at = time.time()
+        self.trace = Trace(label)
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+class JobRunner:
+    """Runs EOM pipelines in the background, at most one per (guild, month)
+
+    Submitting a key that already has a running job returns that job instead of
+    starting a second one, so concurrent requests for the same month never
+    process promotions twice.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[JobKey, Job] = {}
+
+    def get(self, key: JobKey) -> Optional[Job]:
+        job = self._jobs.get(key)
+        return job if job and job.running else None
+
+    def active(self, guild_id: Optional[int] = None) -> List[Job]:
+        return [job for job in self._jobs.values()
+                if job.running and (guild_id is None or job.key[0] == guild_id)]
+
+    def submit(self, key: JobKey, label: str, started_by: str, progress: ProgressMessage,
+               run: Callable[[Job], Awaitable[None]]) -> Tuple[Job, bool]:
+        """Start `run(job)` in the background; returns (job, created)"""
+        existing = self.get(key)
+        if existing:
+            return existing, False
+
+        job = Job(key, label, started_by, progress)
+        self._jobs[key] = job
+        job.task = asyncio.create_task(self._run(job, run))
+        logger.info(f"Started job {label} for guild {key[0]} (requested by {started_by})")
+        return job, True
+
+    async def _run(self, job: Job, run: Callable[[Job], Awaitable[None]]) -> None:
+        # Everything the job does, including tasks it starts, records into its trace
+        job.trace.activate()
+        outcome = 'failed'
+        try:
+            await run(job)
+            outcome = 'completed'
+        except asyncio.CancelledError:
+            outcome = 'cancelled'
+            logger.info(f"Job {job.label} for guild {job.key[0]} was cancelled")
+            await job.progress.finish(f"🛑 **{job.label}** was cancelled.")
+        except Exception as e:
+            logger.error(f"Job {job.label} for guild {job.key[0]} failed: {e}", exc_info=True)
+            await job.progress.finish(f"❌ **{job.label}** failed. Please check the logs and try again.")
+        finally:
+            job.trace.finish(outcome)
+            self._save_trace(job)
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+    
+    def _save_trace(self, job: Job) -> None:
+        started = datetime.fromtimestamp(job.started_at).strftime('%Y%m%d-%H%M%S')
+        path = os.path.join(Config.TRACE_DIR, f"trace_{job.key[0]}_{job.key[1]}_{started}.json")
+        try:
+            job.trace.save(path)
+        except OSError as e:
+            logger.warning(f"Could not write trace for job {job.label}: {e}")
+            return
+        logger.info(f"Job {job.label} {job.trace.outcome} in {job.trace.duration:.1f}s; trace written to {path}")
+
+    def cancel(self, key: JobKey) -> bool:
+        job = self.get(key)
+        if not job:
+            return False
+        job.task.cancel()
+        return True
+
+    async def shutdown(self) -> None:
+        tasks = [job.task for job in self._jobs.values() if job.running]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,27 +1,39 @@
 import discord
-import re
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Set, Tuple, Optional
-import calendar
+from typing import Callable, List, Dict, Set, Tuple, Optional
 import logging
 from bot.config.config import Config
 from bot.services.runescape_wiki_api import get_loot_value
+from bot.services.event_store import EventStore
+from bot.services.drop_deduplicator import DropDeduplicator, achievement_key
+from bot.services.wiseoldman_api import WiseOldManAPI
+from bot.services.parser_worker import ACHIEVEMENT_PATTERN, LOOT_PATTERN, parse_payload, parse_batch
+from bot.utils.dates import month_name_to_number, month_date_range, month_key, month_key_for_timestamp, month_label, resolve_year
+from bot.utils.tracing import count_items, span
 
 logger = logging.getLogger(__name__)
 
 class MessageParser:
-    def __init__(self, bot: discord.Client):
+    def __init__(self, bot: discord.Client, use_process_pool: Optional[bool] = None,
+                 event_store: Optional[EventStore] = None, wom_api: Optional[WiseOldManAPI] = None):
         self.bot = bot
+        self.event_store = event_store
+        self.wom_api = wom_api
         
         # Regex patterns for different message types
-        self.achievement_pattern = r"^(.+?)\s*-\s*:.+?:\s*\d+\s*.+"
-        self.loot_pattern = r"^(.+?):"
-        self.log_pattern = r"^(.+?):"
-    
-    async def parse_monthly_achievements(self, month: str, year: int = None) -> Dict[str, Dict]:
-        if year is None:
-            year = datetime.now().year
+        self.achievement_pattern = ACHIEVEMENT_PATTERN.pattern
+        self.loot_pattern = LOOT_PATTERN.pattern
+        self.log_pattern = LOOT_PATTERN.pattern
         
+        # Opt-in process pool for CPU-heavy backfills; created lazily on first use
+        self.use_process_pool = Config.PARSER_PROCESS_POOL if use_process_pool is None else use_process_pool
+        self._executor = None
+    
+    async def parse_monthly_achievements(self, month: str, year: int = None,
+                                         on_message: Optional[Callable[[], None]] = None) -> Dict[str, Dict]:
+        """Parse a month's achievements; `on_message` is called for every history message scanned"""
         try:
             # Convert month name to number
             month_num = self._month_name_to_number(month)
@@ -29,49 +41,19 @@ class MessageParser:
                 logger.error(f"Invalid month name: {month}")
                 return {}
             
+            if year is None:
+                year = resolve_year(month_num)
+            
             # Get date range for the month
             start_date, end_date = self._get_month_date_range(month_num, year)
             
-            achievements = {}
-            
-            # Parse messages from all achievement channels
-            for channel_id in Config.ACHIEVEMENT_CHANNELS:
-                if channel_id == 0:  # Skip if not configured
-                    continue
-                    
-                try:
-                    channel = self.bot.get_channel(channel_id)
-                    if not channel:
-                        logger.warning(f"Channel {channel_id} not found")
-                        continue
-                    
-                    channel_achievements = await self._parse_channel_messages(
-                        channel, start_date, end_date
-                    )
-                    
-                    # Merge achievements
-                    for member, member_data in channel_achievements.items():
-                        if member not in achievements:
-                            achievements[member] = {
-                                'achievements': [],
-                                'loot_items': [],
-                                'total_loot_value': 0
-                            }
-                        
-                        achievements[member]['achievements'].extend(member_data['achievements'])
-                        achievements[member]['loot_items'].extend(member_data['loot_items'])
-                        achievements[member]['total_loot_value'] += member_data['total_loot_value']
-                    
-                    logger.info(f"Parsed {len(channel_achievements)} members from #{channel.name}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to parse channel {channel_id}: {e}")
-                    continue
+            records = await self._collect_records(start_date, end_date, on_message)
+            achievements = await self._aggregate_records(records)
             
             # Remove duplicates and clean up
             for member in achievements:
                 achievements[member]['achievements'] = list(set(achievements[member]['achievements']))
-                # Note: keeping loot_items as is since duplicates might be legitimate
+                # loot_items are kept as is: copies of the same drop were already removed by DropDeduplicator
             
             logger.info(f"Total achievements parsed for {month} {year}: {len(achievements)} members")
             return achievements
@@ -80,249 +62,300 @@ class MessageParser:
             logger.error(f"Failed to parse monthly achievements: {e}")
             return {}
     
-    async def _parse_channel_messages(self, channel: discord.TextChannel, 
-                                    start_date: datetime, end_date: datetime) -> Dict[str, Dict]:
-        achievements = {}
-        
+    async def parse_range_achievements(self, start_date: datetime, end_date: datetime,
+                                       on_message: Optional[Callable[[], None]] = None) -> Dict[str, Dict[str, Dict]]:
+        """Scan each channel once over [start_date, end_date) and bucket results by month
+
+        Returns {'YYYY-MM': {member: member_data}} in chronological order.
+        """
         try:
-            async for message in channel.history(
-                after=start_date, 
-                before=end_date, 
-                limit=None
-            ):
-                # Skip bot messages
-                if message.author.bot:
+            monthly_records = {}
+            for record in await self._collect_records(start_date, end_date, on_message):
+                key = month_key_for_timestamp(record['timestamp'])
+                monthly_records.setdefault(key, []).append(record)
+            
+            monthly_achievements = {}
+            for key in sorted(monthly_records):
+                achievements = await self._aggregate_records(monthly_records[key])
+                for member in achievements:
+                    achievements[member]['achievements'] = list(set(achievements[member]['achievements']))
+                monthly_achievements[key] = achievements
+            
+            logger.info(f"Range achievements parsed for {start_date:%Y-%m-%d} to {end_date:%Y-%m-%d}: "
+                        f"{len(monthly_achievements)} months")
+            return monthly_achievements
+            
+        except Exception as e:
+            logger.error(f"Failed to parse range achievements: {e}")
+            return {}
+    
+    async def _collect_records(self, start_date: datetime, end_date: datetime,
+                               on_message: Optional[Callable[[], None]] = None) -> List[Dict]:
+        """Records from every achievement channel, WOM and the event store, deduplicated across sources"""
+        records = []
+        
+        # Level/EHP milestones come structured from WOM, replacing a scan of its channel
+        wom_records = None
+        if self.wom_api and Config.WOM_ACHIEVEMENTS_SOURCE:
+            with span('wom achievements'):
+                wom_records = await self.wom_api.get_group_achievements(start_date, end_date)
+                count_items(achievements=len(wom_records or []))
+            if wom_records is None:
+                logger.warning("Wise Old Man achievements unavailable; scanning the achievements channel instead")
+        
+        # Parse messages from all achievement channels
+        for channel_id in Config.ACHIEVEMENT_CHANNELS:
+            if channel_id == 0:  # Skip if not configured
+                continue
+            if wom_records is not None and channel_id == Config.WISE_OLD_MAN_CHANNEL_ID:
+                continue
+            
+            try:
+                channel = self.bot.get_channel(channel_id)
+                if not channel:
+                    logger.warning(f"Channel {channel_id} not found")
                     continue
                 
-                # Skip empty messages
-                if not message.content.strip():
-                    continue
+                scanned = 0
                 
-                # Parse the message based on channel type
-                parsed_data = await self._parse_single_message(message, channel)
+                def on_channel_message():
+                    nonlocal scanned
+                    scanned += 1
+                    if on_message:
+                        on_message()
                 
-                if parsed_data:
-                    member_name, achievement, loot_items, loot_value = parsed_data
-                    
-                    # Clean up member name
-                    member_name = self._clean_member_name(member_name)
-                    
-                    if member_name not in achievements:
-                        achievements[member_name] = {
-                            'achievements': [],
-                            'loot_items': [],
-                            'total_loot_value': 0
-                        }
+                with span(f"history #{channel.name}"):
+                    channel_records = await self._collect_channel_records(channel, start_date, end_date, on_channel_message)
+                    count_items(messages=scanned, records=len(channel_records))
+                records.extend(channel_records)
+                
+                logger.info(f"Parsed {len(channel_records)} messages from #{channel.name}")
+                
+            except Exception as e:
+                logger.error(f"Failed to parse channel {channel_id}: {e}")
+                continue
+        
+        # Merge events received directly (e.g. via the webhook receiver)
+        if self.event_store:
+            stored_records = self.event_store.load_range(start_date, end_date)
+            records.extend(stored_records)
+            logger.info(f"Merged {len(stored_records)} stored events")
+        
+        if wom_records:
+            # WOM timestamps are when the milestone was reached, not when it was posted,
+            # so match against channel-parsed copies by content rather than time
+            known = {achievement_key(record) for record in records if not record['loot_items']}
+            new_records = [record for record in wom_records if achievement_key(record) not in known]
+            records.extend(new_records)
+            logger.info(f"Merged {len(new_records)} Wise Old Man achievements "
+                        f"({len(wom_records) - len(new_records)} already seen in channels)")
+        
+        # Drop cross-channel copies and reposts before any loot gets valued
+        return DropDeduplicator().filter(records)
+    
+    async def input_checkpoints(self, start_date: datetime, end_date: datetime) -> Dict:
+        """Markers that change when new events for [start_date, end_date) could have arrived
+
+        Stored event files grow when the webhook receiver files an event. While
+        the range is still open, the newest message in each scanned channel is
+        recorded too, and so is the group's newest WOM achievement when milestones
+        come from WOM; once it has ended (plus a day for late posts) these are
+        fixed and left out. The range's end is kept so a report saved while it
+        was open can be checked against it.
+        """
+        checkpoints = {'range_end': end_date.timestamp()}
+        
+        if self.event_store:
+            checkpoints['events'] = {}
+            year, month = start_date.year, start_date.month
+            while datetime(year, month, 1) < end_date:
+                key = month_key(year, month)
+                checkpoints['events'][key] = self.event_store.checkpoint(key)
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        
+        if datetime.now() < end_date + timedelta(days=1):
+            wom_source = self.wom_api and Config.WOM_ACHIEVEMENTS_SOURCE
+            checkpoints['channels'] = {}
+            for channel_id in Config.ACHIEVEMENT_CHANNELS:
+                # Milestones come from WOM rather than its channel, so posts there don't change the report
+                if wom_source and channel_id == Config.WISE_OLD_MAN_CHANNEL_ID:
+                    continue
+                channel = self.bot.get_channel(channel_id) if channel_id else None
+                if channel:
+                    checkpoints['channels'][str(channel_id)] = channel.last_message_id
+            if wom_source:
+                checkpoints['wom_achievements'] = await self.wom_api.latest_achievement()
+        
+        return checkpoints
+    
+    def merge_achievements(self, monthly_achievements: Dict[str, Dict[str, Dict]]) -> Dict[str, Dict]:
+        """Combine per-month results into cumulative per-member totals"""
+        cumulative = {}
+        for achievements in monthly_achievements.values():
+            for member, member_data in achievements.items():
+                if member not in cumulative:
+                    cumulative[member] = {
+                        'achievements': [],
+                        'loot_items': [],
+                        'total_loot_value': 0
+                    }
+                cumulative[member]['achievements'].extend(member_data['achievements'])
+                cumulative[member]['loot_items'].extend(member_data['loot_items'])
+                cumulative[member]['total_loot_value'] += member_data['total_loot_value']
+        return cumulative
+    
+    async def _collect_channel_records(self, channel: discord.TextChannel,
+                                       start_date: datetime, end_date: datetime,
+                                       on_message: Optional[Callable[[], None]] = None) -> List[Dict]:
+        records = []
+        
+        try:
+            if self.use_process_pool:
+                await self._collect_records_pooled(channel, start_date, end_date, records, on_message)
+            else:
+                async for message in channel.history(
+                    after=start_date, 
+                    before=end_date, 
+                    limit=None
+                ):
+                    if on_message:
+                        on_message()
+                    payload = self._message_to_payload(message)
+                    if not payload:
+                        continue
                     
-                    achievements[member_name]['achievements'].append(achievement)
-                    achievements[member_name]['loot_items'].extend(loot_items)
-                    achievements[member_name]['total_loot_value'] += loot_value
+                    record = parse_payload(payload)
+                    if record:
+                        records.append(record)
         
         except discord.errors.Forbidden:
             logger.error(f"No permission to read messages in #{channel.name}")
         except Exception as e:
             logger.error(f"Error parsing messages in #{channel.name}: {e}")
         
-        return achievements
+        return records
     
-    async def _parse_single_message(self, message: discord.Message, 
-                            channel: discord.TextChannel) -> Optional[Tuple[str, str, List[str], int]]:
-        content = message.content.strip()
-        
-        # Skip messages that start with common bot patterns
-        if any(content.startswith(prefix) for prefix in ['!', '/', '<@', 'http']):
-            return None
+    async def _collect_records_pooled(self, channel: discord.TextChannel, start_date: datetime,
+                                      end_date: datetime, records: List[Dict],
+                                      on_message: Optional[Callable[[], None]] = None) -> None:
+        """Page through channel history while worker processes parse earlier batches
+
+        Workers only turn payloads into per-message records. Deduplication across
+        channels, WOM and stored events, loot valuation and per-member aggregation
+        need every source's records and the price table, so they stay in this process.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        pending = []
+        batch = []
         
         try:
-            # Achievement messages (e.g., "NMZ WARRI0R - :defence: 99 Defence")
-            if channel.id == Config.WISE_OLD_MAN_CHANNEL_ID:
-                return await self._parse_achievement_message(content)
-            
-            # Loot/Log notifications (e.g., "OhYaPapi:" followed by loot info)
-            elif channel.id in [Config.LOOT_NOTIFICATIONS_CHANNEL_ID, Config.LOG_NOTIFICATIONS_CHANNEL_ID]:
-                return await self._parse_notification_message(content)
-            
-            else:
-                # Generic parsing for unknown channel types
-                return await self._parse_generic_message(content)
-                
-        except Exception as e:
-            logger.debug(f"Failed to parse message: {content[:50]}... - {e}")
-            return None
-    
-    async def _parse_achievement_message(self, content: str) -> Optional[Tuple[str, str, List[str], int]]:
-        # Pattern: "NMZ WARRI0R - :defence: 99 Defence"
-        match = re.match(self.achievement_pattern, content)
-        if match:
-            member_name = match.group(1).strip()
-            achievement = content  # Store full achievement text
-            # Achievement messages don't have loot, so return empty loot data
-            return member_name, achievement, [], 0
-        
-        return None
-    
-    async def _parse_notification_message(self, content: str) -> Optional[Tuple[str, str, List[str], int]]:
-        # Pattern: "OhYaPapi:" followed by loot/log info
-        lines = content.split('\n')
-        first_line = lines[0].strip()
-        
-        # Check if first line ends with ':'
-        if first_line.endswith(':'):
-            member_name = first_line[:-1].strip()  # Remove the colon
-            
-            # Get the rest of the message as achievement description
-            if len(lines) > 1:
-                achievement_details = '\n'.join(lines[1:]).strip()
-                achievement = f"{first_line} {achievement_details}"
-                
-                # Extract loot items from the details
-                loot_items = self._extract_loot_items(achievement_details)
+            async for message in channel.history(
+                after=start_date, 
+                before=end_date, 
+                limit=None
+            ):
+                if on_message:
+                    on_message()
+                payload = self._message_to_payload(message)
+                if not payload:
+                    continue
                 
-                # Calculate loot value
-                if loot_items:
-                    total_value, formatted_value = await get_loot_value(loot_items)
-                    logger.debug(f"Calculated loot value for {member_name}: {formatted_value}")
-                    return member_name, achievement, loot_items, total_value
-                else:
-                    return member_name, achievement, [], 0
-            else:
-                achievement = first_line
-                return member_name, achievement, [], 0
-        
-        # Fallback pattern matching
-        match = re.match(self.loot_pattern, first_line)
-        if match:
-            member_name = match.group(1).strip()
-            achievement = content
+                batch.append(payload)
+                if len(batch) >= Config.PARSER_BATCH_SIZE:
+                    pending.append(loop.run_in_executor(executor, parse_batch, batch))
+                    batch = []
             
-            # Try to extract loot items from the full content
-            loot_items = self._extract_loot_items(content)
-            if loot_items:
-                total_value, formatted_value = await get_loot_value(loot_items)
-                return member_name, achievement, loot_items, total_value
-            else:
-                return member_name, achievement, [], 0
+            if batch:
+                pending.append(loop.run_in_executor(executor, parse_batch, batch))
         
-        return None
-    
-    async def _parse_generic_message(self, content: str) -> Optional[Tuple[str, str, List[str], int]]:
-        # Try both patterns as fallback
-        
-        # Try achievement pattern first
-        match = re.match(self.achievement_pattern, content)
-        if match:
-            member_name = match.group(1).strip()
-            return member_name, content, [], 0
-        
-        # Try notification pattern
-        match = re.match(self.loot_pattern, content)
-        if match:
-            member_name = match.group(1).strip()
+        finally:
+            # Merge partial results from every submitted batch, in submission order
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for batch_records in results:
+                if isinstance(batch_records, Exception):
+                    logger.error(f"Parser worker failed on a batch from #{channel.name}: {batch_records}")
+                    continue
+                records.extend(batch_records)
             
-            # Try to extract loot items
-            loot_items = self._extract_loot_items(content)
-            if loot_items:
-                total_value, formatted_value = await get_loot_value(loot_items)
-                return member_name, content, loot_items, total_value
-            else:
-                return member_name, content, [], 0
-        
-        return None
+            logger.debug(f"Merged {len(pending)} parser batches from #{channel.name}")
     
-    def _clean_member_name(self, name: str) -> str:
-        # Remove common prefixes/suffixes and clean up the name
-        name = name.strip()
-        
-        # Remove mentions
-        name = re.sub(r'<@!?\d+>', '', name)
+    def _message_to_payload(self, message: discord.Message) -> Optional[Dict]:
+        # Structured notifier messages (webhooks/apps) are read from their embeds
+        if message.embeds and self._is_structured_notifier(message):
+            return {
+                'content': message.content,
+                'author': message.author.display_name,
+                'channel_id': message.channel.id,
+                'timestamp': message.created_at.timestamp(),
+                'embeds': [embed.to_dict() for embed in message.embeds]
+            }
         
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
+        # Skip bot messages
+        if message.author.bot:
+            return None
         
-        # Remove trailing punctuation except for names that might legitimately end with it
-        name = name.rstrip('.,!?;')
+        # Skip empty messages
+        if not message.content.strip():
+            return None
         
-        return name
+        return {
+            'content': message.content,
+            'author': str(message.author),
+            'channel_id': message.channel.id,
+            'timestamp': message.created_at.timestamp()
+        }
     
-    def _extract_loot_items(self, text: str) -> List[str]:
-        """Extract loot items from message text
-        
-        Examples:
-        "1 x Avernic treads" -> ["1 x Avernic treads"]
-        "Dragon claws\n50 x Dragon bones" -> ["Dragon claws", "50 x Dragon bones"]
-        """
-        if not text.strip():
-            return []
+    def _is_structured_notifier(self, message: discord.Message) -> bool:
+        ids = Config.NOTIFIER_WEBHOOK_IDS
+        return bool(ids) and (message.webhook_id in ids or message.application_id in ids)
+    
+    async def _aggregate_records(self, records: List[Dict]) -> Dict[str, Dict]:
+        achievements = {}
         
-        loot_items = []
-        lines = text.split('\n')
+        with span('loot valuation', drops=sum(1 for record in records if record['loot_items'])):
+            for record in records:
+                member_name = record['member']
+                loot_items = record['loot_items']
+                loot_value = 0
+                
+                # Calculate loot value
+                if loot_items:
+                    loot_value, formatted_value = await get_loot_value(loot_items)
+                    # Per record: lazy formatting so it costs nothing unless debug logging is on
+                    logger.debug("Calculated loot value for %s: %s", member_name, formatted_value)
+                
+                if member_name not in achievements:
+                    achievements[member_name] = {
+                        'achievements': [],
+                        'loot_items': [],
+                        'total_loot_value': 0
+                    }
+                
+                achievements[member_name]['achievements'].append(record['achievement'])
+                achievements[member_name]['loot_items'].extend(loot_items)
+                achievements[member_name]['total_loot_value'] += loot_value
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Skip common non-loot lines
-            skip_patterns = [
-                r'^Total value:',
-                r'^Loot from',
-                r'^Drops from',
-                r'has received',
-                r'has gained',
-                r'^\d+:\d+',  # Time stamps
-                r'^Image$',   # Image indicators
-                r'^-+$',      # Separator lines
-            ]
-            
-            if any(re.match(pattern, line, re.IGNORECASE) for pattern in skip_patterns):
-                continue
-            
-            # Look for item patterns
-            # Pattern 1: "1 x Item name" or "50x Item name"
-            if re.match(r'^\d+\s*x\s*.+', line, re.IGNORECASE):
-                loot_items.append(line)
-                continue
-            
-            # Pattern 2: Just item names (assume quantity 1)
-            # Filter out very short or obviously non-item text
-            if len(line) > 3 and not line.isdigit():
-                # Check if it looks like an item name (contains letters)
-                if re.search(r'[a-zA-Z]', line):
-                    # Don't include lines that are too long (likely descriptions)
-                    if len(line) <= 50:
-                        loot_items.append(line)
-        
-        return loot_items
+        return achievements
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=Config.PARSER_WORKERS or None)
+            logger.info(f"Started parser process pool ({self._executor._max_workers} workers)")
+        return self._executor
+    
+    def shutdown(self) -> None:
+        """Stop the parser process pool if one was started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
     
     def _month_name_to_number(self, month_name: str) -> int:
-        try:
-            # Handle both full names and abbreviations
-            month_name = month_name.strip().lower()
-            
-            # Full month names
-            month_mapping = {
-                'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                'september': 9, 'october': 10, 'november': 11, 'december': 12,
-                'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
-                'jun': 6, 'jul': 7, 'aug': 8, 'sep': 9,
-                'oct': 10, 'nov': 11, 'dec': 12
-            }
-            
-            return month_mapping.get(month_name)
-            
-        except Exception:
-            return None
+        return month_name_to_number(month_name)
     
     def _get_month_date_range(self, month: int, year: int) -> tuple[datetime, datetime]:
-        # Get first day of the month
-        start_date = datetime(year, month, 1)
-        
-        # Get last day of the month
-        last_day = calendar.monthrange(year, month)[1]
-        end_date = datetime(year, month, last_day, 23, 59, 59)
-        
-        return start_date, end_date
+        # End is the first instant of the next month; history(before=...) is exclusive
+        return month_date_range(month, year)
     
     def get_unique_members_with_achievements(self, achievements: Dict[str, Dict]) -> Set[str]:
         return set(achievements.keys())
@@ -345,15 +378,7 @@ class MessageParser:
             member_loot_value = member_data['total_loot_value']
             
             # Format loot value
-            if member_loot_value > 0:
-                if member_loot_value >= 1_000_000:
-                    loot_str = f", {member_loot_value / 1_000_000:.1f}M gp in loot"
-                elif member_loot_value >= 1_000:
-                    loot_str = f", {member_loot_value / 1_000:.1f}K gp in loot"
-                else:
-                    loot_str = f", {member_loot_value:,} gp in loot"
-            else:
-                loot_str = ""
+            loot_str = f", {self._format_gp(member_loot_value)} in loot" if member_loot_value > 0 else ""
             
             summary_lines.append(f"**{member}** ({len(member_achievements)} achievements{loot_str})")
             
@@ -370,13 +395,54 @@ class MessageParser:
         
         # Add total loot value summary if there's any loot
         if total_loot_value > 0:
-            if total_loot_value >= 1_000_000:
-                total_loot_str = f"{total_loot_value / 1_000_000:.1f}M gp"
-            elif total_loot_value >= 1_000:
-                total_loot_str = f"{total_loot_value / 1_000:.1f}K gp"
-            else:
-                total_loot_str = f"{total_loot_value:,} gp"
-            
-            summary_lines.append(f"**Total Loot Value: {total_loot_str}**")
+            summary_lines.append(f"**Total Loot Value: {self._format_gp(total_loot_value)}**")
+        
+        return "\n".join(summary_lines)
+    
+    def get_range_summary(self, monthly_achievements: Dict[str, Dict[str, Dict]], label: str,
+                          top_n: int = 5) -> str:
+        """Per-month leaderboards followed by a cumulative leaderboard for the whole range"""
+        if not any(monthly_achievements.values()):
+            return f"No achievements found for {label}."
+        
+        summary_lines = [f"📅 **EOM Report: {label}**\n"]
+        
+        for key, achievements in monthly_achievements.items():
+            if not achievements:
+                continue
+            summary_lines.append(f"__**{month_label(key)}**__")
+            summary_lines.extend(self._leaderboard_lines(achievements, top_n))
+            summary_lines.append("")
         
-        return "\n".join(summary_lines)
\ No newline at end of file
+        cumulative = self.merge_achievements(monthly_achievements)
+        summary_lines.append(f"🏆 __**Cumulative ({len(monthly_achievements)} months)**__")
+        summary_lines.extend(self._leaderboard_lines(cumulative, top_n * 2))
+        
+        return "\n".join(summary_lines)
+    
+    def _leaderboard_lines(self, achievements: Dict[str, Dict], top_n: int) -> List[str]:
+        total_achievements = sum(len(member_data['achievements']) for member_data in achievements.values())
+        total_loot_value = sum(member_data['total_loot_value'] for member_data in achievements.values())
+        
+        lines = [f"{len(achievements)} members, {total_achievements} achievements, "
+                 f"{self._format_gp(total_loot_value)} in loot"]
+        
+        sorted_members = sorted(
+            achievements.items(),
+            key=lambda x: (len(x[1]['achievements']), x[1]['total_loot_value']),
+            reverse=True
+        )
+        for i, (member, member_data) in enumerate(sorted_members[:top_n], 1):
+            loot_value = member_data['total_loot_value']
+            loot_str = f" - {self._format_gp(loot_value)}" if loot_value > 0 else ""
+            lines.append(f"{i}. **{member}** - {len(member_data['achievements'])} achievements{loot_str}")
+        
+        return lines
+    
+    @staticmethod
+    def _format_gp(value: int) -> str:
+        if value >= 1_000_000:
+            return f"{value / 1_000_000:.1f}M gp"
+        elif value >= 1_000:
+            return f"{value / 1_000:.1f}K gp"
+        return f"{value:,} gp"
\ No newline at end of file
@@ -0,0 +1,177 @@
+import asyncio
+import time
+from collections import deque
+from typing import Dict, List, Optional
+import logging
+import discord
+from bot.utils.tracing import api_call
+
+logger = logging.getLogger(__name__)
+
+# Discord limits
+MESSAGE_CHAR_LIMIT = 2000
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBED_TOTAL_CHAR_LIMIT = 6000
+EMBEDS_PER_MESSAGE = 10
+
+def pack_text(content: str, limit: int = MESSAGE_CHAR_LIMIT) -> List[str]:
+    """Greedily pack lines into as few chunks of at most `limit` characters as possible"""
+    if len(content) <= limit:
+        return [content] if content else []
+
+    chunks = []
+    current = ""
+
+    for line in content.split('\n'):
+        # Hard-split any single line that cannot fit on its own
+        while len(line) > limit:
+            if current:
+                chunks.append(current.rstrip())
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+
+        if len(current) + len(line) + 1 <= limit:
+            current += line + '\n'
+        else:
+            chunks.append(current.rstrip())
+            current = line + '\n'
+
+    if current.strip():
+        chunks.append(current.rstrip())
+
+    return [chunk for chunk in chunks if chunk]
+
+def pack_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """Group embeds into as few messages as Discord's per-message embed limits allow"""
+    groups = []
+    current = []
+    current_size = 0
+
+    for embed in embeds:
+        size = len(embed)
+        if current and (len(current) >= EMBEDS_PER_MESSAGE or current_size + size > EMBED_TOTAL_CHAR_LIMIT):
+            groups.append(current)
+            current, current_size = [], 0
+        current.append(embed)
+        current_size += size
+
+    if current:
+        groups.append(current)
+
+    return groups
+
+def text_to_embeds(content: str, color: int = 0x0099FF) -> List[discord.Embed]:
+    """Pack long text into embed descriptions, ~3x denser per message than plain content"""
+    embeds = []
+    # Leave headroom under the per-message total so each group fits one message
+    for group in pack_text(content, EMBED_TOTAL_CHAR_LIMIT - 100):
+        for description in pack_text(group, EMBED_DESCRIPTION_LIMIT):
+            embeds.append(discord.Embed(description=description, color=color))
+    return embeds
+
+class RateLimitBucket:
+    """Token bucket for one destination: `capacity` sends per `period` seconds"""
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.period = period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.capacity / self.period)
+            self.updated = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self.tokens) * self.period / self.capacity)
+
+class OutboundScheduler:
+    """Shared send queue for channels and interaction followups
+
+    Sends to the same destination go out in order (asyncio.Lock is FIFO) and are
+    paced by that destination's rate-limit bucket instead of fixed sleeps; sends to
+    different destinations proceed concurrently. Queue latency (request to send)
+    is recorded for reporting.
+    """
+
+    def __init__(self, rate: int = 5, per: float = 5.0):
+        self.rate = rate
+        self.per = per
+        self._buckets: Dict[object, RateLimitBucket] = {}
+        self._locks: Dict[object, asyncio.Lock] = {}
+        self._latencies = deque(maxlen=500)
+        self.sent = 0
+        self.failed = 0
+
+    def _key(self, destination):
+        # Interaction followups share the application's webhook id but are limited per token
+        return getattr(destination, 'token', None) or getattr(destination, 'id', None) or id(destination)
+
+    def _prune(self):
+        # One-off destinations (expired interaction tokens) would otherwise accumulate forever
+        for key in [key for key, lock in self._locks.items() if not lock.locked()]:
+            del self._locks[key]
+            self._buckets.pop(key, None)
+
+    async def send(self, destination, content: Optional[str] = None,
+                   embeds: Optional[List[discord.Embed]] = None, **kwargs):
+        """Queue one message; returns the sent message"""
+        key = self._key(destination)
+        if len(self._locks) > 256:
+            self._prune()
+        bucket = self._buckets.setdefault(key, RateLimitBucket(self.rate, self.per))
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        queued_at = time.monotonic()
+
+        async with lock:
+            await bucket.acquire()
+            latency = time.monotonic() - queued_at
+            self._latencies.append(latency)
+
+            if embeds:
+                kwargs['embeds'] = embeds
+            try:
+                with api_call('discord.send'):
+                    message = await destination.send(content=content, **kwargs)
+                self.sent += 1
+                logger.debug("Sent message to %s after %.0f ms in queue", getattr(destination, 'id', None), latency * 1000)
+                return message
+            except Exception:
+                self.failed += 1
+                raise
+
+    async def send_text(self, destination, content: str, **kwargs) -> list:
+        """Send text in the fewest messages that fit the content limit"""
+        return [await self.send(destination, content=chunk, **kwargs) for chunk in pack_text(content)]
+
+    async def send_embeds(self, destination, embeds: List[discord.Embed], **kwargs) -> list:
+        """Send embeds grouped into the fewest messages"""
+        return [await self.send(destination, embeds=group, **kwargs) for group in pack_embeds(embeds)]
+
+    async def send_long(self, destination, content: str, **kwargs) -> list:
+        """Plain message when it fits, otherwise embed-packed to minimise message count"""
+        if len(content) <= MESSAGE_CHAR_LIMIT:
+            return [await self.send(destination, content=content, **kwargs)]
+        return await self.send_embeds(destination, text_to_embeds(content), **kwargs)
+
+    def stats(self) -> Dict:
+        latencies = sorted(self._latencies)
+        if not latencies:
+            return {'sent': self.sent, 'failed': self.failed, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        return {
+            'sent': self.sent,
+            'failed': self.failed,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'max_ms': latencies[-1] * 1000
+        }
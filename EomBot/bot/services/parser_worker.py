@@ -0,0 +1,246 @@
+"""Pure message parsing helpers shared by MessageParser and its process-pool workers.
+
+Everything in this module works on plain payload dicts so it can be pickled
+across process boundaries and never touches Discord or the network.
+
+Payload shape:
+    {'content': str, 'author': str, 'channel_id': int, 'timestamp': float}
+    Messages from configured notifier webhooks also carry 'embeds': [embed.to_dict(), ...]
+
+Record shape (one per parsed message):
+    {'member': str, 'achievement': str, 'loot_items': [str], 'channel_id': int, 'timestamp': float}
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+from bot.config.config import Config
+
+ACHIEVEMENT_PATTERN = re.compile(r"^(.+?)\s*-\s*:.+?:\s*\d+\s*.+")
+LOOT_PATTERN = re.compile(r"^(.+?):")
+
+# Messages starting with these are commands, mentions or links rather than notifications
+SKIP_PREFIXES = ('!', '/', '<@', 'http')
+
+# Common non-loot lines found in notification bodies
+SKIP_LINE_PATTERN = re.compile(
+    r'^Total value:|^Loot from|^Drops from|has received|has gained'
+    r'|^\d+:\d+'   # Time stamps
+    r'|^Image$'    # Image indicators
+    r'|^-+$',      # Separator lines
+    re.IGNORECASE
+)
+QUANTITY_ITEM_PATTERN = re.compile(r'^\d+\s*x\s*.+', re.IGNORECASE)
+HAS_LETTER_PATTERN = re.compile(r'[a-zA-Z]')
+MENTION_PATTERN = re.compile(r'<@!?\d+>')
+MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\([^)]*\)')
+# "1 x Avernic treads (12.5M)" once markdown links are stripped
+EMBED_ITEM_PATTERN = re.compile(r'^(\d[\d,]*)\s*x\s*(.+?)(?:\s*\([^)]*\))?$', re.IGNORECASE)
+EMBED_SOURCE_FIELDS = ('source', 'from', 'npc', 'boss')
+EMBED_PLAYER_FIELDS = ('player', 'rsn', 'account')
+# "Zezima has received a drop", "Zezima reached 99 Attack" when the embed has no author
+EMBED_TITLE_PLAYER_PATTERN = re.compile(
+    r'^(.+?)\s+(?:has\s+)?(?:received|gained|reached|achieved|completed|unlocked)\b', re.IGNORECASE
+)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def clean_member_name(name: str) -> str:
+    # Remove common prefixes/suffixes and clean up the name
+    name = name.strip()
+
+    # Remove mentions
+    name = MENTION_PATTERN.sub('', name)
+
+    # Remove extra whitespace
+    name = WHITESPACE_PATTERN.sub(' ', name).strip()
+
+    # Remove trailing punctuation except for names that might legitimately end with it
+    name = name.rstrip('.,!?;')
+
+    return name
+
+def extract_loot_items(text: str) -> List[str]:
+    """Extract loot items from message text
+
+    Examples:
+    "1 x Avernic treads" -> ["1 x Avernic treads"]
+    "Dragon claws\n50 x Dragon bones" -> ["Dragon claws", "50 x Dragon bones"]
+    """
+    if not text.strip():
+        return []
+
+    loot_items = []
+
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+
+        if SKIP_LINE_PATTERN.match(line):
+            continue
+
+        # Pattern 1: "1 x Item name" or "50x Item name"
+        if QUANTITY_ITEM_PATTERN.match(line):
+            loot_items.append(line)
+            continue
+
+        # Pattern 2: Just item names (assume quantity 1)
+        # Filter out very short, non-alphabetic or overly long (likely description) lines
+        if 3 < len(line) <= 50 and not line.isdigit() and HAS_LETTER_PATTERN.search(line):
+            loot_items.append(line)
+
+    return loot_items
+
+def _parse_achievement_content(content: str) -> Optional[Tuple[str, str, List[str]]]:
+    # Pattern: "NMZ WARRI0R - :defence: 99 Defence"
+    match = ACHIEVEMENT_PATTERN.match(content)
+    if match:
+        # Achievement messages don't have loot
+        return match.group(1).strip(), content, []
+
+    return None
+
+def _parse_notification_content(content: str) -> Optional[Tuple[str, str, List[str]]]:
+    # Pattern: "OhYaPapi:" followed by loot/log info
+    lines = content.split('\n')
+    first_line = lines[0].strip()
+
+    if first_line.endswith(':'):
+        member_name = first_line[:-1].strip()
+
+        if len(lines) > 1:
+            achievement_details = '\n'.join(lines[1:]).strip()
+            achievement = f"{first_line} {achievement_details}"
+            return member_name, achievement, extract_loot_items(achievement_details)
+
+        return member_name, first_line, []
+
+    # Fallback pattern matching
+    match = LOOT_PATTERN.match(first_line)
+    if match:
+        return match.group(1).strip(), content, extract_loot_items(content)
+
+    return None
+
+def _parse_generic_content(content: str) -> Optional[Tuple[str, str, List[str]]]:
+    # Try achievement pattern first
+    match = ACHIEVEMENT_PATTERN.match(content)
+    if match:
+        return match.group(1).strip(), content, []
+
+    # Try notification pattern
+    match = LOOT_PATTERN.match(content)
+    if match:
+        return match.group(1).strip(), content, extract_loot_items(content)
+
+    return None
+
+def _embed_item_lines(text: str) -> List[str]:
+    items = []
+    for line in text.split('\n'):
+        line = MARKDOWN_LINK_PATTERN.sub(r'\1', line).strip().strip('`*')
+        match = EMBED_ITEM_PATTERN.match(line)
+        if match:
+            quantity = match.group(1).replace(',', '')
+            items.append(f"{quantity} x {match.group(2).strip()}")
+    return items
+
+def parse_embeds(embeds: List[Dict]) -> Optional[Tuple[str, str, List[str]]]:
+    """Read member, achievement and loot straight from notifier embeds (e.g. RuneLite webhook plugins)
+
+    Only the embed description and field values are scanned for "N x Item" lines; the
+    member comes from the embed author, a player field or the embed title, and the
+    achievement from the embed title. Embeds naming no player return None rather than
+    crediting the webhook that posted them.
+    """
+    member_name = None
+    title = None
+    source = None
+    loot_items = []
+
+    for embed in embeds:
+        if not member_name:
+            member_name = (embed.get('author') or {}).get('name')
+        if not title and embed.get('title'):
+            title = embed['title'].strip()
+
+        description = embed.get('description')
+        if description:
+            loot_items.extend(_embed_item_lines(description))
+
+        for field in embed.get('fields', ()):
+            field_name = field.get('name', '').strip()
+            field_value = field.get('value', '')
+            if not source and field_name.lower() in EMBED_SOURCE_FIELDS:
+                source = MARKDOWN_LINK_PATTERN.sub(r'\1', field_value).strip().strip('`*')
+                continue
+            if field_name.lower() in EMBED_PLAYER_FIELDS:
+                if not member_name:
+                    member_name = MARKDOWN_LINK_PATTERN.sub(r'\1', field_value).strip().strip('`*')
+                continue
+            loot_items.extend(_embed_item_lines(field_value))
+
+    if not title and not loot_items:
+        return None
+
+    if not member_name and title:
+        match = EMBED_TITLE_PLAYER_PATTERN.match(title)
+        if match:
+            member_name = match.group(1).strip()
+    if not member_name:
+        return None
+
+    achievement = title or "Loot"
+    if source:
+        achievement += f" ({source})"
+    if loot_items:
+        achievement += ": " + ", ".join(loot_items)
+
+    return member_name, achievement, loot_items
+
+def parse_content(content: str, channel_id: int) -> Optional[Tuple[str, str, List[str]]]:
+    """Parse message content into (member_name, achievement, loot_items) based on channel type"""
+    content = content.strip()
+    if not content or content.startswith(SKIP_PREFIXES):
+        return None
+
+    # Achievement messages (e.g., "NMZ WARRI0R - :defence: 99 Defence")
+    if channel_id == Config.WISE_OLD_MAN_CHANNEL_ID:
+        return _parse_achievement_content(content)
+
+    # Loot/Log notifications (e.g., "OhYaPapi:" followed by loot info)
+    if channel_id in (Config.LOOT_NOTIFICATIONS_CHANNEL_ID, Config.LOG_NOTIFICATIONS_CHANNEL_ID):
+        return _parse_notification_content(content)
+
+    # Generic parsing for unknown channel types
+    return _parse_generic_content(content)
+
+def parse_payload(payload: Dict) -> Optional[Dict]:
+    """Parse a single raw message payload into a record"""
+    try:
+        parsed = None
+        if payload.get('embeds'):
+            parsed = parse_embeds(payload['embeds'])
+        if not parsed:
+            parsed = parse_content(payload['content'], payload['channel_id'])
+    except Exception:
+        return None
+
+    if not parsed:
+        return None
+
+    member_name, achievement, loot_items = parsed
+    return {
+        'member': clean_member_name(member_name),
+        'achievement': achievement,
+        'loot_items': loot_items,
+        'channel_id': payload['channel_id'],
+        'timestamp': payload['timestamp']
+    }
+
+def parse_batch(payloads: List[Dict]) -> List[Dict]:
+    """Process-pool entry point: parse a batch of payloads into records, preserving order"""
+    records = []
+    for payload in payloads:
+        record = parse_payload(payload)
+        if record:
+            records.append(record)
+    return records
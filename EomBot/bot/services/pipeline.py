@@ -0,0 +1,74 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+import logging
+from bot.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+class Pipeline:
+    """A small dependency graph of async stages
+
+    Every stage starts as soon as the stages it depends on have finished, so
+    independent stages run concurrently and end-to-end time is the critical
+    path rather than the sum. A stage is called with its dependencies' results
+    as keyword arguments. If any stage fails, the rest are cancelled.
+    """
+
+    def __init__(self, on_change: Optional[Callable[[Set[str]], None]] = None):
+        self._stages: Dict[str, Tuple[Callable[..., Awaitable[Any]], Tuple[str, ...]]] = {}
+        self.on_change = on_change
+        self.running: Set[str] = set()
+        self.timings: Dict[str, float] = {}
+
+    def add(self, name: str, stage: Callable[..., Awaitable[Any]], depends_on: Iterable[str] = ()) -> 'Pipeline':
+        depends_on = tuple(depends_on)
+        unknown = [dependency for dependency in depends_on if dependency not in self._stages]
+        if unknown:
+            # Dependencies must be added first, which also rules out cycles
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {', '.join(unknown)}")
+        self._stages[name] = (stage, depends_on)
+        return self
+
+    def _set_running(self, name: str, running: bool) -> None:
+        if running:
+            self.running.add(name)
+        else:
+            self.running.discard(name)
+        if self.on_change:
+            self.on_change(set(self.running))
+
+    async def _run_stage(self, name: str, dependencies: List[asyncio.Task]) -> Any:
+        stage, depends_on = self._stages[name]
+        results = await asyncio.gather(*dependencies)
+
+        started = time.perf_counter()
+        self._set_running(name, True)
+        try:
+            with span(name):
+                return await stage(**dict(zip(depends_on, results)))
+        finally:
+            self.timings[name] = time.perf_counter() - started
+            self._set_running(name, False)
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every stage and return {stage name: result}"""
+        tasks: Dict[str, asyncio.Task] = {}
+        started = time.perf_counter()
+
+        # Stages were added in dependency order, so dependencies already have tasks
+        for name, (_, depends_on) in self._stages.items():
+            tasks[name] = asyncio.create_task(self._run_stage(name, [tasks[dependency] for dependency in depends_on]))
+
+        try:
+            results = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        total = time.perf_counter() - started
+        stage_times = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in self.timings.items())
+        logger.info(f"Pipeline finished in {total:.1f}s (sum of stages {sum(self.timings.values()):.1f}s: {stage_times})")
+        return dict(zip(tasks.keys(), results))
@@ -0,0 +1,105 @@
+import json
+import os
+import time
+from typing import Dict, List, Optional, Set
+import logging
+from bot.config.config import Config
+
+logger = logging.getLogger(__name__)
+
+class JournalState:
+    """Replayed state of one month's promotion journal"""
+
+    def __init__(self):
+        self.plan: Optional[List[Dict]] = None
+        self.planned_at: Optional[float] = None
+        self.completed_steps: Set[str] = set()
+        self.complete = False
+        self.completed_at: Optional[float] = None
+
+    @property
+    def has_plan(self) -> bool:
+        return self.plan is not None
+
+class PromotionJournal:
+    """Append-only journal of planned and completed promotion steps, one file per guild and month
+
+    A run records its plan before touching anything, then one entry per completed
+    step ('sheets', 'role:<member>', 'announce:<chunk>'), then 'complete'. Replaying
+    the file after a restart tells a rerun exactly which steps are still outstanding.
+    """
+
+    def __init__(self, base_dir: str = None):
+        self.base_dir = base_dir or Config.JOURNAL_DIR
+        os.makedirs(self.base_dir, exist_ok=True)
+
+    def _path(self, guild_id: int, key: str) -> str:
+        return os.path.join(self.base_dir, f"promotions_{guild_id}_{key}.jsonl")
+
+    def _migrate_legacy(self, guild_id: int, key: str) -> None:
+        """Move a journal from before files were per guild to this guild's name, if it was this guild's"""
+        legacy = os.path.join(self.base_dir, f"promotions_{key}.jsonl")
+        if os.path.exists(self._path(guild_id, key)) or not os.path.exists(legacy):
+            return
+        try:
+            with open(legacy, encoding='utf-8') as f:
+                first = json.loads(f.readline())
+        except (OSError, json.JSONDecodeError):
+            return
+        if first.get('guild_id') == guild_id:
+            os.replace(legacy, self._path(guild_id, key))
+            logger.info(f"Moved promotion journal {legacy} to guild {guild_id}")
+
+    def _append(self, guild_id: int, key: str, entry: Dict) -> None:
+        entry['ts'] = time.time()
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+        with open(self._path(guild_id, key), 'a+b') as f:
+            # A crash mid-write leaves a torn last line; end it so this entry isn't fused onto it
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    line = '\n' + line
+            f.write(line.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def load(self, guild_id: int, key: str) -> JournalState:
+        self._migrate_legacy(guild_id, key)
+        state = JournalState()
+        path = self._path(guild_id, key)
+        if not os.path.exists(path):
+            return state
+
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write; everything before it is intact
+                    logger.warning(f"Ignoring incomplete journal entry in {path}")
+                    continue
+
+                if entry['type'] == 'plan':
+                    state.plan = entry['plan']
+                    state.planned_at = entry['ts']
+                elif entry['type'] == 'step':
+                    state.completed_steps.add(entry['step'])
+                elif entry['type'] == 'complete':
+                    state.complete = True
+                    state.completed_at = entry['ts']
+
+        return state
+
+    def record_plan(self, guild_id: int, key: str, plan: List[Dict]) -> None:
+        self._append(guild_id, key, {'type': 'plan', 'guild_id': guild_id, 'plan': plan})
+        logger.info(f"Journaled promotion plan for guild {guild_id} {key} ({len(plan)} promotions)")
+
+    def record_step(self, guild_id: int, key: str, step: str) -> None:
+        self._append(guild_id, key, {'type': 'step', 'step': step})
+
+    def record_complete(self, guild_id: int, key: str) -> None:
+        self._append(guild_id, key, {'type': 'complete'})
+        logger.info(f"Promotion journal for guild {guild_id} {key} marked complete")
@@ -0,0 +1,110 @@
+"""Pure promotion planning: no Discord, Sheets or network access.
+
+The planner works on a columnar snapshot of the roster sheet and evaluates every
+eligibility rule column-wise across all members at once, so a plan can be shown
+(dry run) before anything is written and executed separately afterwards.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+import logging
+from bot.data.rank_data import RankData
+from bot.utils.dates import epoch_days
+
+logger = logging.getLogger(__name__)
+
+class RosterSnapshot:
+    """Columnar view of the roster sheet; index i of every column is the same member"""
+
+    __slots__ = ('rows', 'names', 'discord_ids', 'ranks', 'career_counters', 'added_dates',
+                 'added_days', 'ambiguous_dates')
+
+    def __init__(self, rows: List[int], names: List[str], discord_ids: List[str], ranks: List[str],
+                 career_counters: List[int], added_dates: List[str], added_days: List[Optional[int]],
+                 ambiguous_dates: bool = False):
+        self.rows = rows                        # 1-indexed sheet row of each member
+        self.names = names
+        self.discord_ids = discord_ids
+        self.ranks = ranks
+        self.career_counters = career_counters
+        self.added_dates = added_dates          # Raw sheet values, for display
+        self.added_days = added_days            # Epoch days, None when missing/unparseable
+        self.ambiguous_dates = ambiguous_dates
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+def plan_promotions(snapshot: RosterSnapshot, achievers: Set[str],
+                    now: Optional[datetime] = None) -> List[Dict]:
+    """Return the promotions due for members who had achievements, in sheet order
+
+    Each entry: {'name', 'row', 'discord_id', 'old_rank', 'new_rank',
+                 'career_counter', 'new_career_counter', 'reason'}
+    """
+    today = epoch_days((now or datetime.now()).date())
+
+    # Per-rank lookup tables, evaluated once rather than per member
+    next_rank_of = {rank: RankData.get_next_rank(rank) for rank in set(snapshot.ranks)}
+    threshold_of = {rank: RankData.get_promotion_threshold(rank) for rank in RankData.RANK_HIERARCHY}
+    time_requirement_of = RankData.TIME_REQUIREMENTS
+
+    # Column-wise masks and values across the whole roster
+    candidate = [name in achievers and RankData.is_promotable_rank(rank)
+                 for name, rank in zip(snapshot.names, snapshot.ranks)]
+    next_ranks = [next_rank_of[rank] if is_candidate else None
+                  for rank, is_candidate in zip(snapshot.ranks, candidate)]
+    time_based = [rank in time_requirement_of for rank in snapshot.ranks]
+    days_since_added = [today - added if added is not None else None for added in snapshot.added_days]
+
+    eligible = [
+        next_rank is not None and (
+            days is not None and days >= time_requirement_of[rank] if is_time
+            else counter >= threshold_of.get(next_rank, 0)
+        )
+        for next_rank, rank, is_time, days, counter
+        in zip(next_ranks, snapshot.ranks, time_based, days_since_added, snapshot.career_counters)
+    ]
+
+    plan = []
+    for i in (i for i, is_eligible in enumerate(eligible) if is_eligible):
+        plan.append({
+            'name': snapshot.names[i],
+            'row': snapshot.rows[i],
+            'discord_id': snapshot.discord_ids[i],
+            'old_rank': snapshot.ranks[i],
+            'new_rank': next_ranks[i],
+            'career_counter': snapshot.career_counters[i],
+            'new_career_counter': snapshot.career_counters[i] + 1,
+            'reason': 'time' if time_based[i] else 'counter'
+        })
+
+    logger.info(f"Planned {len(plan)} promotions from {sum(candidate)} candidates ({len(snapshot)} members)")
+    return plan
+
+def plan_to_promotions(plan: List[Dict]) -> Dict[str, Dict]:
+    """Convert a plan to the {name: {'old_rank', 'new_rank', 'discord_id'}} shape used for reporting"""
+    return {
+        step['name']: {
+            'old_rank': step['old_rank'],
+            'new_rank': step['new_rank'],
+            'discord_id': step['discord_id']
+        }
+        for step in plan
+    }
+
+def format_plan(plan: List[Dict], elapsed_ms: float = None) -> str:
+    if not plan:
+        return "No rank promotions would be made."
+
+    header = f"**Promotion Plan ({len(plan)} promotions"
+    if elapsed_ms is not None:
+        header += f", planned in {elapsed_ms:.1f} ms"
+    lines = [header + ")**\n"]
+
+    for step in plan:
+        if step['reason'] == 'time':
+            detail = "time in rank"
+        else:
+            detail = f"counter {step['career_counter']} >= {RankData.get_promotion_threshold(step['new_rank'])}"
+        lines.append(f"**{step['name']}**: {step['old_rank']} → {step['new_rank']} ({detail})")
+
+    return "\n".join(lines)
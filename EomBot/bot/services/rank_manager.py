@@ -1,49 +1,38 @@
+import asyncio
 import discord
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import logging
 from bot.config.config import Config
 from bot.data.rank_data import RankData
 from bot.services.sheets_manager import SheetsManager
+from bot.services.promotion_planner import RosterSnapshot, plan_promotions, plan_to_promotions
+from bot.services.promotion_journal import PromotionJournal
+from bot.services.outbound import OutboundScheduler, pack_text
+from bot.utils.tracing import api_call, count_items, span
 
 logger = logging.getLogger(__name__)
 
 class RankManager:
-    def __init__(self, bot: discord.Client, sheets_manager: SheetsManager):
+    def __init__(self, bot: discord.Client, sheets_manager: SheetsManager,
+                 journal: Optional[PromotionJournal] = None, outbound: Optional[OutboundScheduler] = None):
         self.bot = bot
         self.sheets_manager = sheets_manager
+        self.journal = journal
+        self.outbound = outbound or OutboundScheduler()
     
     async def process_rank_promotions(self, members_with_achievements: List[str], 
-                                    guild: discord.Guild) -> Dict[str, str]:
-        promotions = {}
-        
+                                    guild: discord.Guild, journal_key: Optional[str] = None,
+                                    snapshot: Optional[RosterSnapshot] = None) -> Dict[str, str]:
         try:
-            # Get all members from sheets
-            all_members = self.sheets_manager.get_all_members()
-            
-            # Filter to only members who had achievements and are eligible for promotion
-            eligible_members = []
-            for member in all_members:
-                if (member['name'] in members_with_achievements and 
-                    RankData.is_promotable_rank(member['rank'])):
-                    eligible_members.append(member)
-            
-            logger.info(f"Processing {len(eligible_members)} members for potential promotion")
+            plan = self.plan_promotions(members_with_achievements, snapshot)
+            promotions = plan_to_promotions(plan)
             
-            # Check each eligible member for promotion
-            for member in eligible_members:
-                promotion_result = await self._check_member_promotion(member, guild)
-                if promotion_result:
-                    old_rank, new_rank = promotion_result
-                    promotions[member['name']] = {
-                        'old_rank': old_rank,
-                        'new_rank': new_rank,
-                        'discord_id': member['discord_id']
-                    }
+            # Journal the plan before anything is written so a crash can be resumed
+            if self.journal and journal_key:
+                self.journal.record_plan(guild.id, journal_key, plan)
             
             # Process the promotions in batch
-            if promotions:
-                await self._execute_promotions(promotions, guild)
+            await self._execute_journaled(plan, guild, journal_key, set())
             
             logger.info(f"Completed rank promotion processing. {len(promotions)} promotions made.")
             return promotions
@@ -52,208 +41,196 @@ class RankManager:
             logger.error(f"Failed to process rank promotions: {e}")
             return {}
     
-    async def _check_member_promotion(self, member: Dict, guild: discord.Guild) -> Optional[Tuple[str, str]]:
-        current_rank = member['rank']
-        career_counter = member['career_counter']
-        added_date_str = member['added_date']
+    async def resume_promotions(self, journal_key: str, guild: discord.Guild) -> Tuple[Dict[str, str], bool]:
+        """Finish an interrupted run from its journal without rescanning or replanning
+
+        Returns (promotions, complete); complete is False while steps are still outstanding.
+        """
+        state = self.journal.load(guild.id, journal_key)
+        if not state.has_plan:
+            return {}, True
         
-        try:
-            # Check if member is eligible for promotion
-            if not RankData.is_promotable_rank(current_rank):
-                return None
-            
-            next_rank = RankData.get_next_rank(current_rank)
-            if not next_rank:
-                return None
-            
-            # Handle time-based promotion (Mediator)
-            if RankData.is_time_based_promotion(current_rank):
-                if self._check_time_based_promotion(added_date_str, current_rank):
-                    logger.info(f"{member['name']}: Time-based promotion {current_rank} -> {next_rank}")
-                    return current_rank, next_rank
-            
-            # Handle career counter-based promotion
-            else:
-                threshold = RankData.get_promotion_threshold(next_rank)
-                if career_counter >= threshold:
-                    logger.info(f"{member['name']}: Counter-based promotion {current_rank} -> {next_rank} ({career_counter} >= {threshold})")
-                    return current_rank, next_rank
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error checking promotion for {member['name']}: {e}")
-            return None
+        remaining = "all done" if state.complete else f"{len(state.completed_steps)} steps already completed"
+        logger.info(f"Resuming promotions for {journal_key} ({remaining})")
+        
+        complete = state.complete
+        if not complete:
+            complete = await self._execute_journaled(state.plan, guild, journal_key, state.completed_steps)
+        
+        return plan_to_promotions(state.plan), complete
+    
+    async def _execute_journaled(self, plan: List[Dict], guild: discord.Guild,
+                                 journal_key: Optional[str], completed_steps: Set[str]) -> bool:
+        journaled = self.journal is not None and journal_key is not None
+        on_step_complete = (lambda step: self.journal.record_step(guild.id, journal_key, step)) if journaled else None
+        
+        success = await self.execute_plan(plan, guild, completed_steps, on_step_complete) if plan else True
+        
+        if journaled and success:
+            self.journal.record_complete(guild.id, journal_key)
+        return success
+    
+    def plan_promotions(self, members_with_achievements: List[str],
+                        snapshot: Optional[RosterSnapshot] = None) -> List[Dict]:
+        """Plan promotions without writing anything, reading a roster snapshot unless one is given"""
+        snapshot = snapshot or self.sheets_manager.get_roster_snapshot()
+        return plan_promotions(snapshot, set(members_with_achievements))
     
-    def _check_time_based_promotion(self, added_date_str: str, current_rank: str) -> bool:
+    async def execute_plan(self, plan: List[Dict], guild: discord.Guild,
+                           completed_steps: Optional[Set[str]] = None,
+                           on_step_complete: Optional[Callable[[str], None]] = None) -> bool:
+        """Apply a plan step by step, skipping steps already completed by an earlier run
+
+        Steps are 'sheets', 'role:<member>' and 'announce:<chunk>'. on_step_complete is
+        called after each one succeeds. Returns True only when every step is done.
+        """
+        completed_steps = completed_steps or set()
+        
+        def mark(step: str) -> None:
+            if on_step_complete:
+                on_step_complete(step)
+        
         try:
-            # Parse the added date (assuming format like "2023-01-15" or similar)
-            # You may need to adjust the date format based on your sheet format
-            if not added_date_str:
-                logger.warning("No added date found for time-based promotion check")
-                return False
-            
-            # Try different date formats
-            date_formats = ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S']
-            added_date = None
+            # Write planned ranks and counters to the rows captured in the snapshot.
+            # Values are absolute, so repeating this step never double-increments.
+            if 'sheets' not in completed_steps:
+                with span('sheets write', rows=len(plan)):
+                    # gspread is blocking; write on a worker thread so the gateway and progress edits keep running
+                    success = await asyncio.to_thread(self.sheets_manager.apply_promotion_plan, plan)
+                if not success:
+                    logger.error("Failed to update Google Sheets with promotions")
+                    return False
+                mark('sheets')
             
-            for fmt in date_formats:
-                try:
-                    added_date = datetime.strptime(added_date_str, fmt)
-                    break
-                except ValueError:
-                    continue
+            promotions = plan_to_promotions(plan)
+            all_done = True
             
-            if not added_date:
-                logger.warning(f"Could not parse date: {added_date_str}")
-                return False
+            # Update Discord roles
+            with span('role updates'):
+                for member_name, promotion_info in promotions.items():
+                    step = f"role:{member_name}"
+                    if step in completed_steps:
+                        continue
+                    if await self._update_member_roles(member_name, promotion_info, guild):
+                        mark(step)
+                    else:
+                        all_done = False
+                    count_items(members=1)
             
-            # Calculate days since added
-            days_since_added = (datetime.now() - added_date).days
-            required_days = RankData.get_time_requirement(current_rank)
+            # Post promotion notifications
+            with span('announcements'):
+                if not await self._post_promotion_notifications(promotions, guild, completed_steps, mark):
+                    all_done = False
             
-            return days_since_added >= required_days
+            return all_done
             
         except Exception as e:
-            logger.error(f"Error in time-based promotion check: {e}")
+            logger.error(f"Failed to execute promotions: {e}")
             return False
     
-    async def _execute_promotions(self, promotions: Dict, guild: discord.Guild) -> bool:
+    async def _update_member_roles(self, member_name: str, promotion_info: Dict, guild: discord.Guild) -> bool:
+        """Swap a member's rank role; True when there is nothing left to retry"""
         try:
-            # Prepare batch updates for sheets
-            sheet_updates = []
+            discord_id = promotion_info['discord_id']
+            old_rank = promotion_info['old_rank']
+            new_rank = promotion_info['new_rank']
             
-            for member_name, promotion_info in promotions.items():
-                # Add to sheet update batch
-                sheet_updates.append({
-                    'name': member_name,
-                    'new_rank': promotion_info['new_rank'],
-                    'increment_counter': True  # Increment career counter for promotion
-                })
+            # Get Discord member
+            if not discord_id or discord_id == '':
+                logger.warning(f"No Discord ID found for {member_name}")
+                return True
             
-            # Execute sheet updates
-            if sheet_updates:
-                success = self.sheets_manager.batch_update_members(sheet_updates)
-                if not success:
-                    logger.error("Failed to update Google Sheets with promotions")
-                    return False
+            try:
+                discord_member = guild.get_member(int(discord_id))
+                if not discord_member:
+                    logger.warning(f"Discord member not found: {discord_id} ({member_name})")
+                    return True
+            except ValueError:
+                logger.warning(f"Invalid Discord ID format: {discord_id} ({member_name})")
+                return True
+            
+            # Get role objects
+            old_role_id = RankData.get_rank_role_id(old_rank)
+            new_role_id = RankData.get_rank_role_id(new_rank)
+            
+            old_role = guild.get_role(old_role_id) if old_role_id else None
+            new_role = guild.get_role(new_role_id) if new_role_id else None
+            
+            # Remove old role if it exists
+            if old_role and old_role in discord_member.roles:
+                with api_call('discord.roles'):
+                    await discord_member.remove_roles(old_role, reason=f"EOMBot promotion: {old_rank} -> {new_rank}")
+                logger.info(f"Removed {old_rank} role from {member_name}")
             
-            # Update Discord roles
-            await self._update_discord_roles(promotions, guild)
+            # Add new role if it exists
+            if new_role and new_role not in discord_member.roles:
+                with api_call('discord.roles'):
+                    await discord_member.add_roles(new_role, reason=f"EOMBot promotion: {old_rank} -> {new_rank}")
+                logger.info(f"Added {new_rank} role to {member_name}")
             
-            # Post promotion notifications
-            await self._post_promotion_notifications(promotions, guild)
+            if not old_role and not new_role:
+                logger.warning(f"No roles found for promotion: {member_name} ({old_rank} -> {new_rank})")
             
             return True
             
+        except discord.errors.Forbidden:
+            logger.error(f"No permission to update roles for {member_name}")
+            return False
         except Exception as e:
-            logger.error(f"Failed to execute promotions: {e}")
+            logger.error(f"Failed to update Discord roles for {member_name}: {e}")
             return False
     
-    async def _update_discord_roles(self, promotions: Dict, guild: discord.Guild) -> None:
+    def _build_promotion_messages(self, promotions: Dict) -> List[str]:
+        # Create promotion message
+        promotion_lines = []
+        promotion_lines.append("🎉 **Rank Promotions** 🎉\n")
+        
         for member_name, promotion_info in promotions.items():
-            try:
-                discord_id = promotion_info['discord_id']
-                old_rank = promotion_info['old_rank']
-                new_rank = promotion_info['new_rank']
-                
-                # Get Discord member
-                if not discord_id or discord_id == '':
-                    logger.warning(f"No Discord ID found for {member_name}")
-                    continue
-                
+            old_rank = promotion_info['old_rank']
+            new_rank = promotion_info['new_rank']
+            discord_id = promotion_info['discord_id']
+            
+            # Try to mention the user if we have their Discord ID
+            if discord_id:
                 try:
-                    discord_member = guild.get_member(int(discord_id))
-                    if not discord_member:
-                        logger.warning(f"Discord member not found: {discord_id} ({member_name})")
-                        continue
+                    mention = f"<@{int(discord_id)}>"
                 except ValueError:
-                    logger.warning(f"Invalid Discord ID format: {discord_id} ({member_name})")
-                    continue
-                
-                # Get role objects
-                old_role_id = RankData.get_rank_role_id(old_rank)
-                new_role_id = RankData.get_rank_role_id(new_rank)
-                
-                old_role = guild.get_role(old_role_id) if old_role_id else None
-                new_role = guild.get_role(new_role_id) if new_role_id else None
-                
-                # Remove old role if it exists
-                if old_role and old_role in discord_member.roles:
-                    await discord_member.remove_roles(old_role, reason=f"EOMBot promotion: {old_rank} -> {new_rank}")
-                    logger.info(f"Removed {old_rank} role from {member_name}")
-                
-                # Add new role if it exists
-                if new_role and new_role not in discord_member.roles:
-                    await discord_member.add_roles(new_role, reason=f"EOMBot promotion: {old_rank} -> {new_rank}")
-                    logger.info(f"Added {new_rank} role to {member_name}")
-                
-                if not old_role and not new_role:
-                    logger.warning(f"No roles found for promotion: {member_name} ({old_rank} -> {new_rank})")
-                
-            except discord.errors.Forbidden:
-                logger.error(f"No permission to update roles for {member_name}")
-            except Exception as e:
-                logger.error(f"Failed to update Discord roles for {member_name}: {e}")
+                    mention = member_name
+            else:
+                mention = member_name
+            
+            promotion_lines.append(f"**{mention}** has been promoted from **{old_rank}** to **{new_rank}**!")
+        
+        # Plain content (not embeds) so mentions notify; packed into the fewest 2000-char messages
+        return pack_text("\n".join(promotion_lines))
     
-    async def _post_promotion_notifications(self, promotions: Dict, guild: discord.Guild) -> None:
+    async def _post_promotion_notifications(self, promotions: Dict, guild: discord.Guild,
+                                            completed_steps: Set[str],
+                                            mark: Callable[[str], None]) -> bool:
         try:
             if not promotions:
-                return
+                return True
             
             # Get rank change channel
             rank_channel = guild.get_channel(Config.RANK_CHANGE_CHANNEL_ID)
             if not rank_channel:
                 logger.warning("Rank change channel not found")
-                return
-            
-            # Create promotion message
-            promotion_lines = []
-            promotion_lines.append("🎉 **Rank Promotions** 🎉\n")
-            
-            for member_name, promotion_info in promotions.items():
-                old_rank = promotion_info['old_rank']
-                new_rank = promotion_info['new_rank']
-                discord_id = promotion_info['discord_id']
-                
-                # Try to mention the user if we have their Discord ID
-                if discord_id:
-                    try:
-                        mention = f"<@{int(discord_id)}>"
-                    except ValueError:
-                        mention = member_name
-                else:
-                    mention = member_name
-                
-                promotion_lines.append(f"**{mention}** has been promoted from **{old_rank}** to **{new_rank}**!")
-            
-            message_content = "\n".join(promotion_lines)
+                return False
             
-            # Split message if too long (Discord 2000 char limit)
-            if len(message_content) > 2000:
-                # Send in chunks
-                chunks = []
-                current_chunk = "🎉 **Rank Promotions** 🎉\n"
-                
-                for line in promotion_lines[1:]:  # Skip the header
-                    if len(current_chunk + line + "\n") > 1900:  # Leave some buffer
-                        chunks.append(current_chunk)
-                        current_chunk = line + "\n"
-                    else:
-                        current_chunk += line + "\n"
-                
-                if current_chunk.strip():
-                    chunks.append(current_chunk)
-                
-                for chunk in chunks:
-                    await rank_channel.send(chunk)
-            else:
-                await rank_channel.send(message_content)
+            # Chunks are deterministic for a given plan, so a resumed run skips exactly those already posted
+            for i, chunk in enumerate(self._build_promotion_messages(promotions)):
+                step = f"announce:{i}"
+                if step in completed_steps:
+                    continue
+                await self.outbound.send(rank_channel, content=chunk)
+                mark(step)
             
             logger.info(f"Posted promotion notifications for {len(promotions)} members")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to post promotion notifications: {e}")
+            return False
     
     def get_promotion_summary(self, promotions: Dict) -> str:
         if not promotions:
@@ -0,0 +1,91 @@
+import gzip
+import json
+import os
+import time
+from typing import Dict, Optional
+import logging
+import discord
+from bot.config.config import Config
+
+logger = logging.getLogger(__name__)
+
+class ReportCache:
+    """Computed EOM reports per (guild, month), stored as gzipped JSON
+
+    A report keeps the parsed achievements, the promotions and the WOM summary
+    rather than rendered text, so it can be re-rendered with current formatting.
+    It also keeps the input checkpoints it was built from; it stays valid until
+    those change, i.e. until new events for the month arrive.
+    """
+
+    def __init__(self, base_dir: str = None):
+        self.base_dir = base_dir or Config.REPORT_CACHE_DIR
+        os.makedirs(self.base_dir, exist_ok=True)
+
+    def _path(self, guild_id: int, key: str) -> str:
+        return os.path.join(self.base_dir, f"report_{guild_id}_{key}.json.gz")
+
+    def save(self, guild_id: int, key: str, achievements: Dict, promotions: Dict,
+             wom_summary: str, checkpoints: Dict) -> None:
+        report = {
+            'guild_id': guild_id,
+            'month_key': key,
+            'created_at': time.time(),
+            'checkpoints': checkpoints,
+            'achievements': achievements,
+            'promotions': promotions,
+            'wom_summary': wom_summary
+        }
+
+        # Write-then-rename so a crash never leaves a truncated report behind
+        path = self._path(guild_id, key)
+        with gzip.open(path + '.tmp', 'wt', encoding='utf-8') as f:
+            json.dump(report, f, separators=(',', ':'), ensure_ascii=False)
+        os.replace(path + '.tmp', path)
+
+        logger.info(f"Cached EOM report for guild {guild_id} {key} ({len(achievements)} members)")
+
+    def load(self, guild_id: int, key: str) -> Optional[Dict]:
+        path = self._path(guild_id, key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, EOFError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cached report {path}: {e}")
+            return None
+
+    @staticmethod
+    def is_fresh(report: Dict, checkpoints: Dict) -> bool:
+        """Whether a report was built from the inputs described by the current checkpoints"""
+        saved = report['checkpoints']
+        if saved.get('events') != checkpoints.get('events'):
+            return False
+        if 'channels' in checkpoints:
+            return (saved.get('channels') == checkpoints['channels']
+                    and saved.get('wom_achievements') == checkpoints.get('wom_achievements'))
+
+        # The range has closed, so live inputs are no longer compared. A report saved while it
+        # was open is complete only if every channel and WOM had already moved past its end.
+        range_end = checkpoints.get('range_end')
+        latest = [discord.utils.snowflake_time(message_id).timestamp() if message_id is not None else None
+                  for message_id in (saved.get('channels') or {}).values()]
+        if 'wom_achievements' in saved:
+            latest.append((saved['wom_achievements'] or {}).get('timestamp'))
+        return all(
+            timestamp is not None and range_end is not None and timestamp >= range_end
+            for timestamp in latest
+        )
+
+    def load_fresh(self, guild_id: int, key: str, checkpoints: Dict) -> Optional[Dict]:
+        """The cached report, or None if there is none or new events have arrived since"""
+        report = self.load(guild_id, key)
+        if report is None:
+            return None
+
+        if not self.is_fresh(report, checkpoints):
+            logger.info(f"Cached EOM report for guild {guild_id} {key} is stale; new events have arrived")
+            return None
+        return report
@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+import tempfile
+import time
+from typing import AsyncIterator, BinaryIO, Dict, Tuple
+import logging
+from bot.services.runescape_wiki_api import RuneScapeWikiAPI
+
+logger = logging.getLogger(__name__)
+
+CSV_FIELDS = ['member', 'type', 'detail', 'value_gp']
+
+async def iter_member_exports(achievements: Dict[str, Dict], promotions: Dict[str, Dict]) -> AsyncIterator[Dict]:
+    """Every member's complete data, one member at a time, in report order
+
+    Loot lines are valued individually against the shared price table, so
+    each line carries its own value next to the member's total.
+    """
+    members = sorted(achievements, key=lambda member: len(achievements[member]['achievements']), reverse=True)
+    # Promoted members always have achievements, but never drop one if a saved report disagrees
+    members += [member for member in promotions if member not in achievements]
+
+    async with RuneScapeWikiAPI() as api:
+        for member in members:
+            member_data = achievements.get(member, {'achievements': [], 'loot_items': [], 'total_loot_value': 0})
+            loot = []
+            if member_data['loot_items']:
+                _, item_values = await api.calculate_loot_value(member_data['loot_items'])
+                loot = [{'item': item, 'value_gp': value} for item, value in item_values]
+
+            promotion = promotions.get(member)
+            yield {
+                'member': member,
+                'achievements': member_data['achievements'],
+                'loot': loot,
+                'total_loot_value': member_data['total_loot_value'],
+                'promotion': {'old_rank': promotion['old_rank'], 'new_rank': promotion['new_rank']} if promotion else None
+            }
+
+def _csv_rows(entry: Dict):
+    member = entry['member']
+    for achievement in entry['achievements']:
+        yield [member, 'achievement', achievement, '']
+    for line in entry['loot']:
+        yield [member, 'loot', line['item'], line['value_gp']]
+    if entry['total_loot_value']:
+        yield [member, 'loot_total', '', entry['total_loot_value']]
+    if entry['promotion']:
+        yield [member, 'promotion', f"{entry['promotion']['old_rank']} -> {entry['promotion']['new_rank']}", '']
+
+async def export_report(month_key: str, achievements: Dict[str, Dict],
+                        promotions: Dict[str, Dict]) -> Tuple[BinaryIO, BinaryIO]:
+    """Write a month's full report as CSV and JSON; returns both files rewound for upload
+
+    Both files are written in one pass, member by member, into temporary
+    files, so the report is never held in memory as one large string.
+    """
+    csv_file = tempfile.TemporaryFile()
+    json_file = tempfile.TemporaryFile()
+    csv_text = io.TextIOWrapper(csv_file, encoding='utf-8', newline='')
+    json_text = io.TextIOWrapper(json_file, encoding='utf-8')
+
+    writer = csv.writer(csv_text)
+    writer.writerow(CSV_FIELDS)
+    json_text.write(f'{{"month": {json.dumps(month_key)}, "generated_at": {time.time():.0f}, "members": [')
+
+    members = 0
+    async for entry in iter_member_exports(achievements, promotions):
+        writer.writerows(_csv_rows(entry))
+        json_text.write((",\n" if members else "\n") + json.dumps(entry, ensure_ascii=False))
+        members += 1
+
+    json_text.write("\n]}\n")
+
+    files = []
+    for text in (csv_text, json_text):
+        text.flush()
+        raw = text.detach()
+        raw.seek(0)
+        files.append(raw)
+
+    logger.info(f"Exported EOM report for {month_key}: {members} members")
+    return files[0], files[1]
@@ -5,15 +5,20 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from fuzzywuzzy import fuzz
 import logging
+from bot.utils.tracing import api_call
 
 logger = logging.getLogger(__name__)
 
 class RuneScapeWikiAPI:
+    # The price table is shared by every instance, so the short-lived clients
+    # created per lookup (and a warmup at the start of a run) all reuse one fetch
+    _price_cache: Dict = {}
+    _cache_timestamp: Optional[datetime] = None
+    _refresh_lock = asyncio.Lock()
+    
     def __init__(self):
         self.base_url = "https://prices.runescape.wiki/api/v1/osrs"
         self.session = None
-        self._price_cache = {}
-        self._cache_timestamp = None
         self.cache_duration = timedelta(hours=1)  # Cache prices for 1 hour
         
     async def __aenter__(self):
@@ -30,42 +35,53 @@ class RuneScapeWikiAPI:
         if self.session:
             await self.session.close()
     
+    def _cache_is_fresh(self) -> bool:
+        return bool(self._price_cache and 
+                    self._cache_timestamp and 
+                    datetime.now() - self._cache_timestamp < self.cache_duration)
+    
     async def get_latest_prices(self, force_refresh: bool = False) -> Dict:
         """Get all current item prices from RuneScape Wiki API"""
         try:
             # Check if we have cached data that's still valid
-            if (not force_refresh and 
-                self._price_cache and 
-                self._cache_timestamp and 
-                datetime.now() - self._cache_timestamp < self.cache_duration):
+            if not force_refresh and self._cache_is_fresh():
                 logger.debug("Using cached price data")
                 return self._price_cache
             
             if not self.session:
                 raise RuntimeError("RuneScapeWikiAPI must be used as async context manager")
             
-            url = f"{self.base_url}/latest"
-            
+            # Concurrent callers wait for one refresh instead of each fetching the table
+            async with RuneScapeWikiAPI._refresh_lock:
+                if not force_refresh and self._cache_is_fresh():
+                    return self._price_cache
+                return await self._fetch_latest_prices()
+                    
+        except asyncio.TimeoutError:
+            logger.error("RuneScape Wiki API timeout")
+            return self._price_cache or {}
+        except Exception as e:
+            logger.error(f"Error fetching prices: {e}")
+            return self._price_cache or {}
+    
+    async def _fetch_latest_prices(self) -> Dict:
+        url = f"{self.base_url}/latest"
+        
+        with api_call('wiki') as call:
             async with self.session.get(url) as response:
                 if response.status == 200:
                     data = await response.json()
                     
                     # Cache the data
-                    self._price_cache = data.get('data', {})
-                    self._cache_timestamp = datetime.now()
+                    RuneScapeWikiAPI._price_cache = data.get('data', {})
+                    RuneScapeWikiAPI._cache_timestamp = datetime.now()
                     
                     logger.info(f"Retrieved price data for {len(self._price_cache)} items")
                     return self._price_cache
                 else:
+                    call.fail()
                     logger.error(f"RuneScape Wiki API error: {response.status}")
                     return self._price_cache or {}
-                    
-        except asyncio.TimeoutError:
-            logger.error("RuneScape Wiki API timeout")
-            return self._price_cache or {}
-        except Exception as e:
-            logger.error(f"Error fetching prices: {e}")
-            return self._price_cache or {}
     
     async def find_item_price(self, item_name: str) -> Optional[Tuple[str, int, int]]:
         """Find price for a specific item name
@@ -234,7 +250,7 @@ class RuneScapeWikiAPI:
                     item_value = price * quantity
                     total_value += item_value
                     item_values.append((f"{quantity}x {matched_name}", item_value))
-                    logger.debug(f"Valued {quantity}x {matched_name} at {item_value:,} gp")
+                    logger.debug("Valued %sx %s at %d gp", quantity, matched_name, item_value)
                 else:
                     # If we can't find the price, still record it
                     item_values.append((item_desc, 0))
@@ -294,6 +310,11 @@ async def get_loot_value(loot_items: List[str]) -> Tuple[int, str]:
         else:
             return 0, "Unknown value"
 
+async def warm_price_cache() -> int:
+    """Fetch the price table ahead of loot valuation; returns the number of items priced"""
+    async with RuneScapeWikiAPI() as api:
+        return len(await api.get_latest_prices())
+
 async def get_single_item_price(item_name: str) -> Optional[str]:
     """Get formatted price for a single item"""
     async with RuneScapeWikiAPI() as api:
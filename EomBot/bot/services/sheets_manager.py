@@ -4,6 +4,9 @@ from typing import Dict, List, Optional, Tuple
 import logging
 from datetime import datetime
 from bot.config.config import Config
+from bot.services.promotion_planner import RosterSnapshot
+from bot.utils.dates import parse_date_column
+from bot.utils.tracing import api_call
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +33,8 @@ class SheetsManager:
     
     def get_all_members(self) -> List[Dict[str, str]]:
         try:
-            all_records = self.sheet.get_all_records()
+            with api_call('sheets'):
+                all_records = self.sheet.get_all_records()
             members = []
             
             for record in all_records:
@@ -58,6 +62,70 @@ class SheetsManager:
             logger.error(f"Failed to get members from Google Sheets: {e}")
             raise
     
+    def get_roster_snapshot(self) -> RosterSnapshot:
+        """Read the whole sheet in one request into a columnar snapshot"""
+        try:
+            with api_call('sheets'):
+                values = self.sheet.get_all_values()
+            data_rows = values[1:]  # Skip header
+            
+            def column(column_letter: str) -> List[str]:
+                index = ord(column_letter.upper()) - ord('A')
+                return [row[index].strip() if index < len(row) else '' for row in data_rows]
+            
+            career_counters = []
+            for value in column(Config.CAREER_COUNTER_COLUMN):
+                try:
+                    career_counters.append(int(value) if value else 0)
+                except ValueError:
+                    career_counters.append(0)
+            
+            # Detect the added-date format once and parse the column in one pass
+            added_dates = column(Config.ADDED_DATE_COLUMN)
+            added_days, date_order, ambiguous_dates = parse_date_column(added_dates, Config.ADDED_DATE_ORDER)
+            
+            snapshot = RosterSnapshot(
+                rows=list(range(2, len(data_rows) + 2)),
+                names=column(Config.MEMBER_NAME_COLUMN),
+                discord_ids=column(Config.DISCORD_ID_COLUMN),
+                ranks=column(Config.RANK_COLUMN),
+                career_counters=career_counters,
+                added_dates=added_dates,
+                added_days=added_days,
+                ambiguous_dates=ambiguous_dates
+            )
+            
+            logger.info(f"Read roster snapshot of {len(snapshot)} members from Google Sheets")
+            return snapshot
+            
+        except Exception as e:
+            logger.error(f"Failed to read roster snapshot from Google Sheets: {e}")
+            raise
+    
+    def apply_promotion_plan(self, plan: List[Dict]) -> bool:
+        """Write planned ranks and career counters to their snapshot rows in one batch"""
+        try:
+            batch_updates = []
+            for step in plan:
+                batch_updates.append({
+                    'range': f"{Config.RANK_COLUMN}{step['row']}",
+                    'values': [[step['new_rank']]]
+                })
+                batch_updates.append({
+                    'range': f"{Config.CAREER_COUNTER_COLUMN}{step['row']}",
+                    'values': [[step['new_career_counter']]]
+                })
+            
+            if batch_updates:
+                with api_call('sheets'):
+                    self.sheet.batch_update(batch_updates)
+                logger.info(f"Applied promotion plan: {len(batch_updates)} cells for {len(plan)} members")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to apply promotion plan: {e}")
+            return False
+    
     def find_member_by_name(self, name: str) -> Optional[Dict[str, str]]:
         try:
             members = self.get_all_members()
@@ -0,0 +1,143 @@
+import asyncio
+import hmac
+import json
+import time
+from typing import Dict, Optional, Set, Tuple
+import logging
+import discord
+from aiohttp import web
+from bot.config.config import Config
+from bot.services.event_store import EventStore
+from bot.services.outbound import OutboundScheduler
+from bot.services.parser_worker import parse_payload
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_SIZE = 8 * 1024 * 1024  # Notifier plugins may attach a screenshot
+MAX_CONTENT_LENGTH = 2000
+MAX_EMBEDS = 10
+
+class WebhookReceiver:
+    """Local HTTP endpoint accepting Discord-webhook-style payloads from RuneLite notifier plugins
+
+    Point the plugin's webhook URL at http://<host>:<port>/webhook/<WEBHOOK_SECRET>.
+    Valid notifications are parsed and appended to the event store; optionally
+    they are relayed to a Discord channel by the bot.
+    """
+
+    def __init__(self, bot: discord.Client, event_store: EventStore, outbound: OutboundScheduler):
+        self.bot = bot
+        self.event_store = event_store
+        self.outbound = outbound
+        self.runner = None
+        # Held so relays aren't garbage-collected mid-send and can be awaited on shutdown
+        self._relays: Set[asyncio.Task] = set()
+        self.app = web.Application(client_max_size=MAX_BODY_SIZE)
+        self.app.router.add_get('/health', self._handle_health)
+        self.app.router.add_post('/webhook/{token}', self._handle_webhook)
+
+    async def start(self) -> None:
+        # Without a secret any client able to reach the port could inject events
+        if not Config.WEBHOOK_SECRET:
+            raise ValueError("WEBHOOK_SECRET must be set to start the webhook receiver")
+        self.runner = web.AppRunner(self.app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, Config.WEBHOOK_HOST, Config.WEBHOOK_PORT)
+        await site.start()
+        logger.info(f"Webhook receiver listening on {Config.WEBHOOK_HOST}:{Config.WEBHOOK_PORT}")
+
+    async def stop(self) -> None:
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+            logger.info("Webhook receiver stopped")
+        if self._relays:
+            await asyncio.gather(*self._relays, return_exceptions=True)
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        return web.json_response({'status': 'ok'})
+
+    async def _handle_webhook(self, request: web.Request) -> web.Response:
+        token = request.match_info['token']
+        if not Config.WEBHOOK_SECRET or not hmac.compare_digest(token, Config.WEBHOOK_SECRET):
+            return web.json_response({'error': 'unauthorized'}, status=401)
+
+        try:
+            body = await self._read_body(request)
+        except (ValueError, json.JSONDecodeError) as e:
+            return web.json_response({'error': f'invalid payload: {e}'}, status=400)
+
+        is_valid, error = self._validate_body(body)
+        if not is_valid:
+            return web.json_response({'error': error}, status=400)
+
+        payload = {
+            'content': body.get('content') or '',
+            'author': body.get('username') or '',
+            'channel_id': Config.WEBHOOK_CHANNEL_ID,
+            'timestamp': time.time(),
+            'embeds': body.get('embeds') or []
+        }
+
+        record = parse_payload(payload)
+        if not record:
+            logger.debug("Webhook payload did not contain a recognisable notification")
+            return web.json_response({'stored': False}, status=422)
+
+        record['source'] = 'webhook'
+        month = self.event_store.append(record)
+        logger.info(f"Stored webhook event for {record['member']} ({month})")
+
+        if Config.WEBHOOK_RELAY_CHANNEL_ID:
+            relay = asyncio.create_task(self._relay(body))
+            self._relays.add(relay)
+            relay.add_done_callback(self._relays.discard)
+
+        return web.json_response({'stored': True, 'member': record['member'], 'month': month})
+
+    async def _read_body(self, request: web.Request) -> Dict:
+        # Plugins send multipart/form-data with a payload_json part when attaching screenshots
+        if request.content_type.startswith('multipart/'):
+            form = await request.post()
+            raw = form.get('payload_json')
+            if raw is None:
+                raise ValueError("missing payload_json field")
+            return json.loads(raw)
+
+        return await request.json()
+
+    def _validate_body(self, body) -> Tuple[bool, Optional[str]]:
+        if not isinstance(body, dict):
+            return False, "payload must be a JSON object"
+
+        content = body.get('content')
+        embeds = body.get('embeds')
+
+        if content is not None and not isinstance(content, str):
+            return False, "content must be a string"
+        if content and len(content) > MAX_CONTENT_LENGTH:
+            return False, f"content exceeds {MAX_CONTENT_LENGTH} characters"
+
+        if embeds is not None:
+            if not isinstance(embeds, list) or not all(isinstance(embed, dict) for embed in embeds):
+                return False, "embeds must be a list of objects"
+            if len(embeds) > MAX_EMBEDS:
+                return False, f"at most {MAX_EMBEDS} embeds are allowed"
+
+        if not content and not embeds:
+            return False, "payload has no content or embeds"
+
+        return True, None
+
+    async def _relay(self, body: Dict) -> None:
+        try:
+            channel = self.bot.get_channel(Config.WEBHOOK_RELAY_CHANNEL_ID)
+            if not channel:
+                logger.warning(f"Webhook relay channel {Config.WEBHOOK_RELAY_CHANNEL_ID} not found")
+                return
+
+            embeds = [discord.Embed.from_dict(embed) for embed in body.get('embeds') or []]
+            await self.outbound.send(channel, content=body.get('content') or None, embeds=embeds)
+
+        except Exception as e:
+            logger.error(f"Failed to relay webhook notification: {e}")
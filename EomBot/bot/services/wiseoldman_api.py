@@ -1,168 +1,454 @@
 import aiohttp
 import asyncio
-from typing import Dict, List, Optional, Tuple
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote
 import logging
 from bot.config.config import Config
+from bot.utils.dates import month_date_range
+from bot.utils.tracing import api_call
 
 logger = logging.getLogger(__name__)
 
+# Metrics measured in hours rather than XP, kills or score
+HOUR_METRICS = {'ehp', 'ehb'}
+
+# How long after a range ends before its gains are treated as final; members
+# who were not updated right at the boundary are still being picked up
+SETTLE_PERIOD = timedelta(days=1)
+
+class WOMRequestError(Exception):
+    """A Wise Old Man request failed, so the data it would have returned is incomplete"""
+
+class GainRecord(NamedTuple):
+    """One member's gain, decoded from a group gains entry without keeping the raw JSON"""
+    player_id: int
+    username: str
+    display_name: str
+    gained: float
+    start: float
+    end: float
+
+class GainsArchive:
+    """Persisted WOM responses for date ranges that have ended, one file per request
+
+    Gains over a closed range never change, so once stored they are served
+    from disk instead of the API. Each range gets a directory holding one JSON
+    file per request, so storing a page writes only that page and nothing is
+    kept in memory between calls.
+    """
+
+    def __init__(self, base_dir: str = None):
+        self.base_dir = base_dir or Config.WOM_CACHE_DIR
+        os.makedirs(self.base_dir, exist_ok=True)
+
+    @staticmethod
+    def range_key(start_date: datetime, end_date: datetime) -> str:
+        return f"{start_date:%Y%m%dT%H%M}_{end_date:%Y%m%dT%H%M}"
+
+    def _path(self, key: str, request: str) -> str:
+        # Percent-encoded so each request maps to a distinct, filesystem-safe name
+        return os.path.join(self.base_dir, f"gains_{key}", f"{quote(request, safe='')}.json")
+
+    def get(self, key: str, request: str) -> Optional[List[Dict]]:
+        path = self._path(key, request)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable WOM cache file {path}: {e}")
+            return None
+
+    def put(self, key: str, request: str, entries: List[Dict]) -> None:
+        path = self._path(key, request)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write-then-rename so a crash never leaves a half-written file behind
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(entries, f, separators=(',', ':'))
+        os.replace(path + '.tmp', path)
+
 class WiseOldManAPI:
     def __init__(self):
         self.base_url = "https://api.wiseoldman.net/v2"
         self.group_id = Config.WISE_OLD_MAN_GROUP_ID
         self.session = None
-        
+        self.cache_ttl = Config.WOM_CACHE_TTL_SECONDS
+        # (metric, period) -> (expires_at, limit, entries)
+        self._cache: Dict[Tuple[str, str], Tuple[float, int, List[Dict]]] = {}
+        self._semaphore = asyncio.Semaphore(Config.WOM_MAX_CONCURRENCY)
+        self.archive = GainsArchive()
+
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'Content-Type': 'application/json'}
-        )
+        self._get_session()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """One pooled session per client, reused across every request"""
+        if self.session is None or self.session.closed:
+            headers = {'Content-Type': 'application/json'}
+            if Config.WOM_API_KEY:
+                headers['x-api-key'] = Config.WOM_API_KEY
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers=headers,
+                connector=aiohttp.TCPConnector(limit=Config.WOM_MAX_CONCURRENCY)
+            )
+        return self.session
+
+    async def close(self):
+        if self.session and not self.session.closed:
             await self.session.close()
-    
-    async def get_monthly_ehp_gains(self, limit: int = 3) -> List[Dict]:
-        """Get top monthly EHP gains for the group"""
-        try:
-            url = f"{self.base_url}/groups/{self.group_id}/gained"
-            params = {
-                'metric': 'ehp',
-                'period': 'month',
-                'limit': limit
+        self.session = None
+
+    @staticmethod
+    def _period_key(period: str, start_date: Optional[datetime], end_date: Optional[datetime]) -> str:
+        if start_date and end_date:
+            return f"{start_date.isoformat()}/{end_date.isoformat()}"
+        return period
+
+    def _archive_key(self, start_date: Optional[datetime], end_date: Optional[datetime]) -> Optional[str]:
+        """Archive key for a settled date range, None while gains over it can still change"""
+        if start_date and end_date and end_date + SETTLE_PERIOD <= datetime.now():
+            return GainsArchive.range_key(start_date, end_date)
+        return None
+
+    @staticmethod
+    def _range_params(period: str, start_date: Optional[datetime], end_date: Optional[datetime]) -> Dict:
+        if start_date and end_date:
+            # Ranges are naive local times; WOM reads offset-less dates as UTC, so send the UTC instants
+            return {
+                'startDate': start_date.astimezone(timezone.utc).isoformat(),
+                'endDate': end_date.astimezone(timezone.utc).isoformat()
             }
-            
-            if not self.session:
-                raise RuntimeError("WiseOldManAPI must be used as async context manager")
-            
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Retrieved {len(data)} EHP gains from Wise Old Man API")
-                    return data
-                else:
-                    logger.error(f"Wise Old Man API error for EHP gains: {response.status}")
-                    return []
-                    
+        return {'period': period}
+
+    async def _fetch_gains(self, metric: str, params: Dict, archive_key: Optional[str] = None) -> Optional[List[Dict]]:
+        """One gains response; None if the request failed"""
+        url = f"{self.base_url}/groups/{self.group_id}/gained"
+        request = f"{metric}?" + "&".join(f"{name}={params[name]}" for name in sorted(params))
+
+        if archive_key:
+            archived = self.archive.get(archive_key, request)
+            if archived is not None:
+                return archived
+
+        try:
+            async with self._semaphore:
+                with api_call('wom') as call:
+                    async with self._get_session().get(url, params={'metric': metric, **params}) as response:
+                        if response.status == 200:
+                            data = await response.json()
+                            logger.info(f"Retrieved {len(data)} {metric} gains from Wise Old Man API")
+                            if archive_key:
+                                self.archive.put(archive_key, request, data)
+                            return data
+                        else:
+                            call.fail()
+                            logger.error(f"Wise Old Man API error for {metric} gains: {response.status}")
+                            return None
+
         except asyncio.TimeoutError:
-            logger.error("Wise Old Man API timeout for EHP gains")
-            return []
+            logger.error(f"Wise Old Man API timeout for {metric} gains")
+            return None
         except Exception as e:
-            logger.error(f"Error fetching EHP gains: {e}")
-            return []
-    
-    async def get_monthly_ehb_gains(self, limit: int = 3) -> List[Dict]:
-        """Get top monthly EHB gains for the group"""
+            logger.error(f"Error fetching {metric} gains: {e}")
+            return None
+
+    async def get_gains(self, metrics: Iterable[str], period: str = 'month', limit: int = 3,
+                        start_date: Optional[datetime] = None,
+                        end_date: Optional[datetime] = None) -> Dict[str, List[Dict]]:
+        """Top group gains for any skills, bosses or activities, fetched concurrently
+
+        Either a WOM period ('day', 'week', 'month', ...) or an explicit date range.
+        Results are cached per (metric, period) for WOM_CACHE_TTL_SECONDS; a cached
+        result fetched with a larger limit also serves smaller ones. Ranges that
+        have ended are also persisted to disk and never refetched.
+        """
+        metrics = list(dict.fromkeys(metric.lower() for metric in metrics))
+        period_key = self._period_key(period, start_date, end_date)
+        now = time.monotonic()
+
+        results = {}
+        missing = []
+        for metric in metrics:
+            cached = self._cache.get((metric, period_key))
+            if cached and cached[0] > now and cached[1] >= limit:
+                results[metric] = cached[2][:limit]
+            else:
+                missing.append(metric)
+
+        if missing:
+            params = {**self._range_params(period, start_date, end_date), 'limit': limit}
+            archive_key = self._archive_key(start_date, end_date)
+
+            fetched = await asyncio.gather(*(self._fetch_gains(metric, params, archive_key) for metric in missing))
+            for metric, entries in zip(missing, fetched):
+                # Leave failed requests uncached so the next call retries
+                if entries is not None:
+                    self._cache[(metric, period_key)] = (now + self.cache_ttl, limit, entries)
+                results[metric] = entries or []
+
+        logger.debug(f"WOM gains for {period_key}: {len(metrics) - len(missing)} cached, {len(missing)} fetched")
+        return {metric: results[metric] for metric in metrics}
+
+    def _decode_gain(self, entry: Dict, metric: str) -> GainRecord:
+        player = entry.get('player', {})
+        data = entry.get('data', {})
+        if 'gained' not in data:
+            data = data.get(metric, {})
+        return GainRecord(
+            player.get('id', 0),
+            player.get('username', ''),
+            player.get('displayName', 'Unknown'),
+            data.get('gained', 0),
+            data.get('start', 0),
+            data.get('end', 0)
+        )
+
+    async def iter_group_gains(self, metric: str, period: str = 'month',
+                               start_date: Optional[datetime] = None,
+                               end_date: Optional[datetime] = None,
+                               page_size: Optional[int] = None) -> AsyncIterator[GainRecord]:
+        """Stream every member's gains for a metric, highest first, one page at a time
+
+        The next page is requested while the current one is being consumed, and
+        each entry is decoded into a GainRecord as it is yielded. Stopping
+        iteration early cancels the outstanding prefetch. Raises WOMRequestError
+        if a page fails, rather than ending as if every member had been read.
+        """
+        page_size = page_size or Config.WOM_PAGE_SIZE
+        params = self._range_params(period, start_date, end_date)
+        archive_key = self._archive_key(start_date, end_date)
+
+        def fetch_page(offset: int) -> asyncio.Task:
+            page_params = {**params, 'limit': page_size, 'offset': offset}
+            return asyncio.create_task(self._fetch_gains(metric, page_params, archive_key))
+
+        offset = 0
+        next_page = fetch_page(offset)
         try:
-            url = f"{self.base_url}/groups/{self.group_id}/gained"
-            params = {
-                'metric': 'ehb',
-                'period': 'month', 
-                'limit': limit
-            }
-            
-            if not self.session:
-                raise RuntimeError("WiseOldManAPI must be used as async context manager")
-            
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Retrieved {len(data)} EHB gains from Wise Old Man API")
-                    return data
-                else:
-                    logger.error(f"Wise Old Man API error for EHB gains: {response.status}")
-                    return []
-                    
+            while next_page:
+                page = await next_page
+                if page is None:
+                    next_page = None
+                    raise WOMRequestError(f"Failed to fetch {metric} gains at offset {offset}")
+                offset += page_size
+                # A short page is the last one
+                next_page = fetch_page(offset) if len(page) == page_size else None
+
+                for entry in page:
+                    yield self._decode_gain(entry, metric)
+        finally:
+            if next_page and not next_page.done():
+                next_page.cancel()
+
+    async def summarize_group_gains(self, metric: str, **kwargs) -> Tuple[int, float]:
+        """(members with a gain, total gained) across the whole group
+
+        Raises WOMRequestError if any page could not be read.
+        """
+        active = 0
+        total = 0.0
+        records = self.iter_group_gains(metric, **kwargs)
+        try:
+            async for record in records:
+                # Entries are sorted by gain, so the first non-positive one ends the active members
+                if record.gained <= 0:
+                    break
+                active += 1
+                total += record.gained
+        finally:
+            # Close now rather than at garbage collection so the prefetch is cancelled immediately
+            await records.aclose()
+        return active, total
+
+    async def _fetch_achievements_page(self, offset: int, limit: int) -> Optional[List[Dict]]:
+        """One page of group achievements, newest first; None if the request failed"""
+        url = f"{self.base_url}/groups/{self.group_id}/achievements"
+
+        try:
+            async with self._semaphore:
+                with api_call('wom') as call:
+                    async with self._get_session().get(url, params={'limit': limit, 'offset': offset}) as response:
+                        if response.status == 200:
+                            return await response.json()
+                        call.fail()
+                        logger.error(f"Wise Old Man API error for group achievements: {response.status}")
+                        return None
+
         except asyncio.TimeoutError:
-            logger.error("Wise Old Man API timeout for EHB gains")
-            return []
+            logger.error("Wise Old Man API timeout for group achievements")
+            return None
         except Exception as e:
-            logger.error(f"Error fetching EHB gains: {e}")
-            return []
-    
+            logger.error(f"Error fetching group achievements: {e}")
+            return None
+
+    async def latest_achievement(self) -> Optional[Dict]:
+        """The group's newest achievement as {'timestamp', 'player', 'name'}; None if WOM could not be read"""
+        page = await self._fetch_achievements_page(0, 1)
+        if not page:
+            return None
+        entry = page[0]
+        try:
+            timestamp = datetime.fromisoformat(entry['createdAt'].replace('Z', '+00:00')).timestamp()
+        except (KeyError, ValueError, AttributeError):
+            return None
+        return {'timestamp': timestamp, 'player': entry.get('playerId'), 'name': entry.get('name')}
+
+    @staticmethod
+    def _achievement_to_record(entry: Dict, timestamp: float) -> Dict:
+        """Convert a WOM achievement into the record shape channel parsing produces"""
+        member = entry.get('player', {}).get('displayName') or entry.get('player', {}).get('username', 'Unknown')
+        metric = entry.get('metric', '')
+        return {
+            'member': member,
+            # Same text the WOM Discord bot posts, so both sources read (and dedupe) alike
+            'achievement': f"{member} - :{metric}: {entry.get('name', '')}",
+            'loot_items': [],
+            'channel_id': Config.WISE_OLD_MAN_CHANNEL_ID,
+            'timestamp': timestamp,
+            'source': 'wom'
+        }
+
+    async def get_group_achievements(self, start_date: datetime, end_date: datetime) -> Optional[List[Dict]]:
+        """Group achievements reached in [start_date, end_date) as achievement records
+
+        Pages back from the newest achievement, prefetching the next page, and
+        stops at the first one older than the range. Cached in memory for
+        WOM_CACHE_TTL_SECONDS and on disk once the range has settled. Returns
+        None if WOM could not be read, so callers can fall back to the channel.
+        """
+        period_key = self._period_key('achievements', start_date, end_date)
+        cached = self._cache.get(('achievements', period_key))
+        if cached and cached[0] > time.monotonic():
+            return cached[2]
+
+        archive_key = self._archive_key(start_date, end_date)
+        if archive_key:
+            archived = self.archive.get(archive_key, 'achievements')
+            if archived is not None:
+                return archived
+
+        start_ts, end_ts = start_date.timestamp(), end_date.timestamp()
+        page_size = Config.WOM_PAGE_SIZE
+        records = []
+        offset = 0
+        reached_start = False
+        next_page = asyncio.create_task(self._fetch_achievements_page(offset, page_size))
+
+        try:
+            while next_page and not reached_start:
+                page = await next_page
+                if page is None:
+                    return None
+
+                offset += page_size
+                next_page = (asyncio.create_task(self._fetch_achievements_page(offset, page_size))
+                             if len(page) == page_size else None)
+
+                for entry in page:
+                    try:
+                        timestamp = datetime.fromisoformat(entry['createdAt'].replace('Z', '+00:00')).timestamp()
+                    except (KeyError, ValueError, AttributeError):
+                        continue
+                    if timestamp >= end_ts:
+                        continue
+                    if timestamp < start_ts:
+                        # Everything after this is older still; the prefetch is cancelled below
+                        reached_start = True
+                        break
+                    records.append(self._achievement_to_record(entry, timestamp))
+        finally:
+            if next_page and not next_page.done():
+                next_page.cancel()
+
+        logger.info(f"Retrieved {len(records)} group achievements from Wise Old Man API for {period_key}")
+        self._cache[('achievements', period_key)] = (time.monotonic() + self.cache_ttl, len(records), records)
+        if archive_key:
+            self.archive.put(archive_key, 'achievements', records)
+        return records
+
+    async def get_monthly_ehp_gains(self, limit: int = 3) -> List[Dict]:
+        """Get top monthly EHP gains for the group"""
+        return (await self.get_gains(['ehp'], 'month', limit))['ehp']
+
+    async def get_monthly_ehb_gains(self, limit: int = 3) -> List[Dict]:
+        """Get top monthly EHB gains for the group"""
+        return (await self.get_gains(['ehb'], 'month', limit))['ehb']
+
     async def get_monthly_gains_summary(self, limit: int = 3) -> Tuple[List[Dict], List[Dict]]:
         """Get both EHP and EHB gains in one call"""
-        try:
-            # Make both API calls concurrently
-            ehp_task = asyncio.create_task(self.get_monthly_ehp_gains(limit))
-            ehb_task = asyncio.create_task(self.get_monthly_ehb_gains(limit))
-            
-            ehp_gains, ehb_gains = await asyncio.gather(ehp_task, ehb_task, return_exceptions=True)
-            
-            # Handle any exceptions in the results
-            if isinstance(ehp_gains, Exception):
-                logger.error(f"EHP gains task failed: {ehp_gains}")
-                ehp_gains = []
-            
-            if isinstance(ehb_gains, Exception):
-                logger.error(f"EHB gains task failed: {ehb_gains}")
-                ehb_gains = []
-            
-            return ehp_gains, ehb_gains
-            
-        except Exception as e:
-            logger.error(f"Error fetching monthly gains summary: {e}")
-            return [], []
-    
+        gains = await self.get_gains(['ehp', 'ehb'], 'month', limit)
+        return gains['ehp'], gains['ehb']
+
+    @staticmethod
+    def _gained_value(entry: Dict, metric: str) -> float:
+        data = entry.get('data', {})
+        if 'gained' in data:
+            return data['gained']
+        return data.get(metric, {}).get('gained', 0)
+
+    @staticmethod
+    def _format_gained(metric: str, gained: float) -> str:
+        if metric in HOUR_METRICS:
+            value = f"{gained:.1f}" if gained >= 1 else f"{gained:.2f}"
+            return f"{value} {metric.upper()}"
+        return f"{int(gained):,}"
+
+    @staticmethod
+    def _metric_label(metric: str) -> str:
+        return metric.replace('_', ' ').title()
+
+    def _format_section(self, title: str, metric: str, entries: List[Dict]) -> List[str]:
+        lines = [title]
+        if not entries:
+            lines.append(f"No {metric.upper() if metric in HOUR_METRICS else self._metric_label(metric)} data available")
+            return lines
+
+        for i, entry in enumerate(entries, 1):
+            try:
+                player_name = entry.get('player', {}).get('displayName', 'Unknown')
+                gained = self._gained_value(entry, metric)
+                lines.append(f"{i}. **{player_name}** - {self._format_gained(metric, gained)}")
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Error formatting {metric} entry {i}: {e}")
+                continue
+        return lines
+
     def format_gains_summary(self, ehp_gains: List[Dict], ehb_gains: List[Dict]) -> str:
         """Format the gains data into a readable summary"""
         if not ehp_gains and not ehb_gains:
             return "ℹ️ No Wise Old Man gains data available for this month."
-        
+
         summary_lines = []
         summary_lines.append("🏆 **Top Monthly Gains**\n")
-        
-        # Format EHP gains
-        if ehp_gains:
-            summary_lines.append("**🧠 EHP (Efficient Hours Played):**")
-            for i, entry in enumerate(ehp_gains, 1):
-                try:
-                    player_name = entry.get('player', {}).get('displayName', 'Unknown')
-                    ehp_gained = entry.get('data', {}).get('ehp', {}).get('gained', 0)
-                    
-                    # Format the EHP value nicely
-                    if ehp_gained >= 1:
-                        ehp_str = f"{ehp_gained:.1f}"
-                    else:
-                        ehp_str = f"{ehp_gained:.2f}"
-                    
-                    summary_lines.append(f"{i}. **{player_name}** - {ehp_str} EHP")
-                    
-                except (KeyError, TypeError) as e:
-                    logger.warning(f"Error formatting EHP entry {i}: {e}")
-                    continue
-        else:
-            summary_lines.append("**🧠 EHP (Efficient Hours Played):**")
-            summary_lines.append("No EHP data available")
-        
+        summary_lines.extend(self._format_section("**🧠 EHP (Efficient Hours Played):**", 'ehp', ehp_gains))
         summary_lines.append("")  # Empty line between sections
-        
-        # Format EHB gains  
-        if ehb_gains:
-            summary_lines.append("**⚔️ EHB (Efficient Hours Bossing):**")
-            for i, entry in enumerate(ehb_gains, 1):
-                try:
-                    player_name = entry.get('player', {}).get('displayName', 'Unknown')
-                    ehb_gained = entry.get('data', {}).get('ehb', {}).get('gained', 0)
-                    
-                    # Format the EHB value nicely
-                    if ehb_gained >= 1:
-                        ehb_str = f"{ehb_gained:.1f}"
-                    else:
-                        ehb_str = f"{ehb_gained:.2f}"
-                    
-                    summary_lines.append(f"{i}. **{player_name}** - {ehb_str} EHB")
-                    
-                except (KeyError, TypeError) as e:
-                    logger.warning(f"Error formatting EHB entry {i}: {e}")
-                    continue
-        else:
-            summary_lines.append("**⚔️ EHB (Efficient Hours Bossing):**")
-            summary_lines.append("No EHB data available")
-        
+        summary_lines.extend(self._format_section("**⚔️ EHB (Efficient Hours Bossing):**", 'ehb', ehb_gains))
+
         return "\n".join(summary_lines)
-    
+
+    def format_leaderboards(self, gains: Dict[str, List[Dict]]) -> str:
+        """Per-skill/boss/activity leaderboards; metrics with no gains are left out"""
+        sections = []
+        for metric, entries in gains.items():
+            entries = [entry for entry in entries if self._gained_value(entry, metric) > 0]
+            if entries:
+                sections.append("\n".join(self._format_section(f"**{self._metric_label(metric)}:**", metric, entries)))
+
+        if not sections:
+            return ""
+        return "📊 **Leaderboards**\n\n" + "\n\n".join(sections)
+
     def validate_group_id(self) -> bool:
         """Validate that group ID is configured"""
         if not self.group_id or self.group_id == 0:
@@ -171,11 +457,46 @@ class WiseOldManAPI:
         return True
 
 # Standalone functions for easy usage
-async def get_wise_old_man_summary(limit: int = 3) -> str:
-    """Convenience function to get formatted Wise Old Man gains summary"""
-    async with WiseOldManAPI() as api:
-        if not api.validate_group_id():
-            return "⚠️ Wise Old Man group ID not configured."
-        
-        ehp_gains, ehb_gains = await api.get_monthly_gains_summary(limit)
-        return api.format_gains_summary(ehp_gains, ehb_gains)
\ No newline at end of file
+async def get_wise_old_man_summary(limit: int = 3, api: Optional[WiseOldManAPI] = None,
+                                   month: Optional[int] = None, year: Optional[int] = None) -> str:
+    """Convenience function to get formatted Wise Old Man gains summary
+
+    With `month` and `year` the gains cover exactly that calendar month;
+    otherwise WOM's rolling 'month' period (the last 30 days). Pass a
+    long-lived `api` to reuse its session and cache; otherwise a temporary
+    client is opened and closed for this call.
+    """
+    if api is None:
+        async with WiseOldManAPI() as api:
+            return await get_wise_old_man_summary(limit, api, month, year)
+
+    if not api.validate_group_id():
+        return "⚠️ Wise Old Man group ID not configured."
+
+    date_range = {}
+    if month and year:
+        date_range['start_date'], date_range['end_date'] = month_date_range(month, year)
+
+    async def group_totals() -> Optional[Tuple[int, float]]:
+        try:
+            return await api.summarize_group_gains('ehp', period='month', **date_range)
+        except WOMRequestError as e:
+            logger.warning(f"Group EHP totals unavailable: {e}")
+            return None
+
+    leaderboard_metrics = Config.WOM_LEADERBOARD_METRICS
+    gains, totals = await asyncio.gather(
+        api.get_gains(['ehp', 'ehb', *leaderboard_metrics], 'month', limit, **date_range),
+        group_totals()
+    )
+
+    summary = api.format_gains_summary(gains['ehp'], gains['ehb'])
+    if totals is None:
+        summary += "\n\n⚠️ Group EHP totals unavailable; Wise Old Man could not be read in full."
+    elif totals[0]:
+        summary += f"\n\n📈 {totals[0]} members gained {totals[1]:,.1f} EHP in total"
+    leaderboards = api.format_leaderboards({metric: gains[metric] for metric in leaderboard_metrics
+                                            if metric not in ('ehp', 'ehb')})
+    if leaderboards:
+        summary += f"\n\n{leaderboards}"
+    return summary
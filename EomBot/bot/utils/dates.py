@@ -0,0 +1,219 @@
+import re
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+MONTH_MAPPING = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
+    'jun': 6, 'jul': 7, 'aug': 8, 'sep': 9,
+    'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Join date formats accepted in the roster sheet
+DATE_FORMATS = [
+    '%Y-%m-%d',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%Y-%m-%d %H:%M:%S',
+    '%m/%d/%Y %H:%M:%S'
+]
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+ISO_DATE_PATTERN = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})')
+SLASH_DATE_PATTERN = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})')
+
+def month_name_to_number(month_name: str) -> Optional[int]:
+    if not month_name:
+        return None
+    return MONTH_MAPPING.get(month_name.strip().lower())
+
+def resolve_year(month: int, now: Optional[datetime] = None) -> int:
+    """Year of the most recent occurrence of a month.
+
+    A month later than the current one refers to last year, so running
+    `/eombot december` in January reports on the December just gone.
+    """
+    now = now or datetime.now()
+    return now.year - 1 if month > now.month else now.year
+
+def month_date_range(month: int, year: int) -> Tuple[datetime, datetime]:
+    """Return [start, end) for a month; end is the first instant of the next month"""
+    start_date = datetime(year, month, 1)
+    if month == 12:
+        end_date = datetime(year + 1, 1, 1)
+    else:
+        end_date = datetime(year, month + 1, 1)
+    return start_date, end_date
+
+def month_key(year: int, month: int) -> str:
+    return f"{year:04d}-{month:02d}"
+
+def month_key_for_timestamp(timestamp: float) -> str:
+    dt = datetime.fromtimestamp(timestamp)
+    return month_key(dt.year, dt.month)
+
+def month_label(key: str) -> str:
+    """'2025-01' -> 'January 2025'"""
+    return datetime.strptime(key, '%Y-%m').strftime('%B %Y')
+
+def _parse_month_year(text: str) -> Optional[Tuple[int, Optional[int]]]:
+    match = re.fullmatch(r'([a-z]+)(?:\s+(\d{4}))?', text.strip())
+    if not match:
+        return None
+    month = month_name_to_number(match.group(1))
+    if month is None:
+        return None
+    year = int(match.group(2)) if match.group(2) else None
+    return month, year
+
+def parse_report_period(period: str, now: Optional[datetime] = None) -> Optional[Tuple[datetime, datetime, str]]:
+    """Parse a report period into ([start, end), label)
+
+    Supported forms:
+        "ytd"                       -> start of this year to end of this month
+        "2025"                      -> the whole calendar year
+        "q1", "q1 2025", "2025 q1"  -> a calendar quarter
+        "jan-mar", "nov 2024 to feb 2025" -> a custom month range (inclusive)
+
+    Without a year, quarters and ranges both take the year in which their
+    first month most recently began.
+    """
+    if not period:
+        return None
+
+    now = now or datetime.now()
+    text = re.sub(r'\s+', ' ', period.strip().lower())
+
+    if text in ('ytd', 'year to date', 'year-to-date'):
+        start_date = datetime(now.year, 1, 1)
+        end_date = month_date_range(now.month, now.year)[1]
+        return start_date, end_date, f"{now.year} Year to Date"
+
+    match = re.fullmatch(r'\d{4}', text)
+    if match:
+        year = int(text)
+        return datetime(year, 1, 1), datetime(year + 1, 1, 1), str(year)
+
+    match = re.fullmatch(r'q([1-4])(?: (\d{4}))?', text) or re.fullmatch(r'(\d{4}) q([1-4])', text)
+    if match:
+        if text.startswith('q'):
+            quarter, year = int(match.group(1)), match.group(2)
+        else:
+            year, quarter = match.group(1), int(match.group(2))
+        first_month = (quarter - 1) * 3 + 1
+        year = int(year) if year else resolve_year(first_month, now)
+        start_date = datetime(year, first_month, 1)
+        end_date = month_date_range(first_month + 2, year)[1]
+        return start_date, end_date, f"Q{quarter} {year}"
+
+    parts = re.split(r'\s*-\s*|\s+to\s+', text)
+    if len(parts) != 2:
+        return None
+
+    start_part = _parse_month_year(parts[0])
+    end_part = _parse_month_year(parts[1])
+    if not start_part or not end_part:
+        return None
+
+    (start_month, start_year), (end_month, end_year) = start_part, end_part
+
+    # Fill in missing years relative to whichever side is known, wrapping across new year.
+    # With neither given, the range is the most recent one to have started, as for quarters.
+    if end_year is None and start_year is None:
+        start_year = resolve_year(start_month, now)
+    if start_year is None:
+        start_year = end_year if start_month <= end_month else end_year - 1
+    if end_year is None:
+        end_year = start_year if end_month >= start_month else start_year + 1
+
+    start_date = month_date_range(start_month, start_year)[0]
+    end_date = month_date_range(end_month, end_year)[1]
+    if start_date >= end_date:
+        return None
+
+    label = f"{start_date.strftime('%B %Y')} - {datetime(end_year, end_month, 1).strftime('%B %Y')}"
+    return start_date, end_date, label
+
+def epoch_days(when: date) -> int:
+    return when.toordinal() - EPOCH_ORDINAL
+
+def detect_slash_order(values: List[str]) -> Tuple[Optional[str], bool]:
+    """Decide once whether a column's slash dates are 'mdy' or 'dmy'
+
+    Returns (order, ambiguous). A column whose slash dates all fit both orders
+    (e.g. only 03/04/2024-style values), or that mixes dates only one order can
+    read with dates only the other can read, is ambiguous and defaults to 'mdy'.
+    """
+    mdy_possible = dmy_possible = True
+    seen_slash_date = False
+
+    for value in values:
+        match = SLASH_DATE_PATTERN.match(value.strip())
+        if not match:
+            continue
+        seen_slash_date = True
+        first, second = int(match.group(1)), int(match.group(2))
+        if first > 12:
+            mdy_possible = False
+        if second > 12:
+            dmy_possible = False
+
+    if not seen_slash_date:
+        return None, False
+    if mdy_possible != dmy_possible:
+        return ('mdy' if mdy_possible else 'dmy'), False
+    # Either every value fits both orders, or the column mixes both orders
+    return 'mdy', True
+
+def parse_date_column(values: List[str], order: str = 'auto') -> Tuple[List[Optional[int]], Optional[str], bool]:
+    """Parse a whole date column into epoch days in one pass
+
+    The slash-date order is detected once for the column (or forced with
+    order='mdy'/'dmy') so every row is read the same way; an ambiguous column
+    is flagged once rather than guessed at row by row. ISO dates, with or
+    without a time, are always accepted. Unparseable or empty cells become None.
+
+    Returns (epoch_days, slash_order, ambiguous).
+    """
+    ambiguous = False
+    if order in ('mdy', 'dmy'):
+        slash_order = order
+    else:
+        slash_order, ambiguous = detect_slash_order(values)
+
+    days = []
+    unparsed = 0
+    for value in values:
+        value = value.strip()
+        if not value:
+            days.append(None)
+            continue
+
+        try:
+            match = ISO_DATE_PATTERN.match(value)
+            if match:
+                year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+            else:
+                match = SLASH_DATE_PATTERN.match(value)
+                if not match:
+                    raise ValueError(value)
+                first, second, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
+                month, day = (first, second) if slash_order == 'mdy' else (second, first)
+
+            days.append(epoch_days(date(year, month, day)))
+        except ValueError:
+            days.append(None)
+            unparsed += 1
+
+    if ambiguous:
+        logger.warning(f"Date column is ambiguous between month/day and day/month; reading all values as "
+                       f"{slash_order}. Set ADDED_DATE_ORDER to choose the order")
+    if unparsed:
+        logger.warning(f"Could not parse {unparsed} date values")
+
+    return days, slash_order, ambiguous
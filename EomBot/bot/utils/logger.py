@@ -1,9 +1,31 @@
+import atexit
+import gzip
 import logging
-import sys
-from datetime import datetime
 import os
+import queue
+import shutil
+import sys
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import Optional
+
+# Writes log records to the console and files on a background thread
+_listener: Optional[QueueListener] = None
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
 
-def setup_logger(name: str = 'eombot', level: str = 'INFO') -> logging.Logger:
+def _daily_file_handler(path: str, level: int, formatter: logging.Formatter, retention_days: int) -> TimedRotatingFileHandler:
+    # Rolls over at midnight into <file>.YYYY-MM-DD.gz, keeping retention_days old files
+    handler = TimedRotatingFileHandler(path, when='midnight', backupCount=retention_days, encoding='utf-8', delay=True)
+    handler.namer = lambda name: name + '.gz'
+    handler.rotator = _gzip_rotator
+    handler.setLevel(level)
+    handler.setFormatter(formatter)
+    return handler
+
+def setup_logger(name: str = 'eombot', level: str = 'INFO', retention_days: int = 14) -> logging.Logger:
     # Create logs directory if it doesn't exist
     log_dir = 'logs'
     if not os.path.exists(log_dir):
@@ -14,11 +36,19 @@ def setup_logger(name: str = 'eombot', level: str = 'INFO') -> logging.Logger:
     
     # Clear existing handlers to avoid duplication
     logger.handlers.clear()
+    stop_logging()
     
     # Set level
     log_level = getattr(logging, level.upper(), logging.INFO)
     logger.setLevel(log_level)
     
+    # Services log under their module names (bot.services.*, services.*), so the queue
+    # goes on the root logger where every logger's records end up
+    root = logging.getLogger()
+    for handler in [handler for handler in root.handlers if isinstance(handler, QueueHandler)]:
+        root.removeHandler(handler)
+    root.setLevel(log_level)
+    
     # Create formatters
     detailed_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
@@ -31,10 +61,7 @@ def setup_logger(name: str = 'eombot', level: str = 'INFO') -> logging.Logger:
     )
     
     # File handler for detailed logs
-    today = datetime.now().strftime('%Y-%m-%d')
-    file_handler = logging.FileHandler(f'{log_dir}/eombot_{today}.log', encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(detailed_formatter)
+    file_handler = _daily_file_handler(f'{log_dir}/eombot.log', logging.DEBUG, detailed_formatter, retention_days)
     
     # Console handler for general output
     console_handler = logging.StreamHandler(sys.stdout)
@@ -42,17 +69,28 @@ def setup_logger(name: str = 'eombot', level: str = 'INFO') -> logging.Logger:
     console_handler.setFormatter(console_formatter)
     
     # Error file handler for errors only
-    error_handler = logging.FileHandler(f'{log_dir}/eombot_errors_{today}.log', encoding='utf-8')
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(detailed_formatter)
+    error_handler = _daily_file_handler(f'{log_dir}/eombot_errors.log', logging.ERROR, detailed_formatter, retention_days)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    logger.addHandler(error_handler)
+    # Loggers only enqueue records; formatting output and disk I/O happen on the
+    # listener thread, so logging never blocks the event loop
+    log_queue = queue.SimpleQueue()
+    global _listener
+    _listener = QueueListener(log_queue, file_handler, console_handler, error_handler, respect_handler_level=True)
+    _listener.start()
+    root.addHandler(QueueHandler(log_queue))
     
     return logger
 
+def stop_logging() -> None:
+    """Flush queued records and stop the background log writer"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+# Records still queued at exit are written rather than lost
+atexit.register(stop_logging)
+
 def get_logger(name: str = 'eombot') -> logging.Logger:
     return logging.getLogger(name)
 
@@ -0,0 +1,195 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+# The trace and innermost span of the running task. Tasks copy the context when
+# created, so pipeline stages and the calls they make attribute to the right span.
+_current_trace: ContextVar[Optional['Trace']] = ContextVar('eom_trace', default=None)
+_current_span: ContextVar[Optional['Span']] = ContextVar('eom_trace_span', default=None)
+
+class Span:
+    """One timed section of a trace, with item counts and external calls made inside it"""
+
+    def __init__(self, span_id: int, name: str, parent: Optional['Span'], start: float):
+        self.id = span_id
+        self.name = name
+        self.parent = parent
+        self.start = start
+        self.duration: Optional[float] = None
+        self.items: Dict[str, int] = {}
+        self.calls: Dict[str, int] = {}
+        self.error: Optional[str] = None
+
+    def count(self, **items: int) -> None:
+        for name, value in items.items():
+            self.items[name] = self.items.get(name, 0) + value
+
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'parent': self.parent.id if self.parent else None,
+            'name': self.name,
+            'start_s': round(self.start, 3),
+            'duration_s': round(self.duration, 3) if self.duration is not None else None,
+            'items': self.items,
+            'calls': self.calls,
+            'error': self.error
+        }
+
+class Trace:
+    """Spans and external call totals for one run
+
+    Tracing is opt-in per task: `span()` and `api_call()` do nothing unless a
+    trace has been activated in the current context, so services can be
+    instrumented unconditionally.
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started_at = time.time()
+        self.outcome: Optional[str] = None
+        self.duration: Optional[float] = None
+        self.spans: List[Span] = []
+        self.calls: Dict[str, Dict[str, float]] = {}
+        self._started = time.perf_counter()
+
+    def activate(self) -> None:
+        """Make this the trace for the current task and the tasks it creates"""
+        _current_trace.set(self)
+        _current_span.set(None)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def finish(self, outcome: str) -> None:
+        self.outcome = outcome
+        self.duration = self.elapsed()
+
+    def _open_span(self, name: str, parent: Optional[Span]) -> Span:
+        span = Span(len(self.spans) + 1, name, parent, self.elapsed())
+        self.spans.append(span)
+        return span
+
+    def record_call(self, api: str, seconds: float, ok: bool, span: Optional[Span]) -> None:
+        totals = self.calls.setdefault(api, {'count': 0, 'errors': 0, 'seconds': 0.0})
+        totals['count'] += 1
+        totals['seconds'] += seconds
+        if not ok:
+            totals['errors'] += 1
+        if span is not None:
+            span.calls[api] = span.calls.get(api, 0) + 1
+
+    def _subtree_totals(self, root: Span):
+        """Item and call counts of a span and every span nested inside it"""
+        items: Dict[str, int] = {}
+        calls: Dict[str, int] = {}
+        for span in self.spans:
+            ancestor = span
+            while ancestor is not None and ancestor is not root:
+                ancestor = ancestor.parent
+            if ancestor is None:
+                continue
+            for name, value in span.items.items():
+                items[name] = items.get(name, 0) + value
+            for api, count in span.calls.items():
+                calls[api] = calls.get(api, 0) + count
+        return items, calls
+
+    def summary(self) -> str:
+        """Top-level spans with their counts, then external call totals, for a chat message"""
+        stages = []
+        for span in self.spans:
+            if span.parent is not None or span.duration is None:
+                continue
+            items, calls = self._subtree_totals(span)
+            details = [f"{value:,} {name.replace('_', ' ')}" for name, value in items.items()]
+            details += [f"{count:,} {api} calls" for api, count in sorted(calls.items())]
+            stages.append(f"{span.name} {span.duration:.1f}s" + (f" ({', '.join(details)})" if details else ""))
+
+        lines = []
+        if stages:
+            lines.append("⏱️ " + " · ".join(stages))
+        if self.calls:
+            calls = []
+            for api, totals in sorted(self.calls.items()):
+                call = f"{api} {int(totals['count']):,} in {totals['seconds']:.1f}s"
+                if totals['errors']:
+                    call += f" ({int(totals['errors'])} failed)"
+                calls.append(call)
+            lines.append("🌐 " + " · ".join(calls))
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict:
+        return {
+            'label': self.label,
+            'started_at': self.started_at,
+            'outcome': self.outcome,
+            'duration_s': round(self.duration if self.duration is not None else self.elapsed(), 3),
+            'calls': {api: {**totals, 'seconds': round(totals['seconds'], 3)} for api, totals in self.calls.items()},
+            'spans': [span.to_dict() for span in self.spans]
+        }
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(path + '.tmp', path)
+
+@contextmanager
+def span(name: str, **items: int) -> Iterator[Optional[Span]]:
+    """Time a section of work as a child of the current span; yields None when not tracing"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    current = trace._open_span(name, _current_span.get())
+    current.count(**items)
+    token = _current_span.set(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        current.duration = time.perf_counter() - started
+        _current_span.reset(token)
+
+class ApiCall:
+    """Handle yielded by `api_call()`; a request that returned an error status calls `fail()`"""
+
+    def __init__(self):
+        self.ok = True
+
+    def fail(self) -> None:
+        self.ok = False
+
+@contextmanager
+def api_call(api: str) -> Iterator[ApiCall]:
+    """Time one external request, counted on the current span and in the trace totals
+
+    The call counts as failed if it raises or if the caller marks it with `fail()`.
+    """
+    call = ApiCall()
+    trace = _current_trace.get()
+    if trace is None:
+        yield call
+        return
+
+    started = time.perf_counter()
+    raised = True
+    try:
+        yield call
+        raised = False
+    finally:
+        trace.record_call(api, time.perf_counter() - started, call.ok and not raised, _current_span.get())
+
+def count_items(**items: int) -> None:
+    """Add item counts to the current span, if tracing"""
+    current = _current_span.get()
+    if current is not None and _current_trace.get() is not None:
+        current.count(**items)
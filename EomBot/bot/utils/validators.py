@@ -4,6 +4,7 @@ import calendar
 from typing import Optional
 import discord
 from bot.config.config import Config
+from bot.utils.dates import DATE_FORMATS, parse_report_period
 
 def validate_month(month: str) -> tuple[bool, Optional[str]]:
     if not month:
@@ -23,6 +24,16 @@ def validate_month(month: str) -> tuple[bool, Optional[str]]:
     
     return True, None
 
+def validate_report_period(period: str) -> tuple[bool, Optional[str]]:
+    if not period or not period.strip():
+        return False, "Period cannot be empty"
+    
+    if parse_report_period(period) is None:
+        return False, (f"Invalid period: {period}. Use a quarter ('Q1' or 'Q1 2025'), a year ('2025'), "
+                       f"'YTD', or a month range ('Jan-Mar' or 'Nov 2024 to Feb 2025')")
+    
+    return True, None
+
 def validate_channel_restriction(channel: discord.TextChannel) -> tuple[bool, Optional[str]]:
     if channel.id != Config.EOM_POST_CHANNEL_ID:
         return False, f"This command can only be used in <#{Config.EOM_POST_CHANNEL_ID}>"
@@ -127,16 +138,7 @@ def validate_date_format(date_str: str) -> tuple[bool, Optional[datetime]]:
     if not date_str:
         return False, None
     
-    # Common date formats to try
-    formats = [
-        '%Y-%m-%d',
-        '%m/%d/%Y',
-        '%d/%m/%Y',
-        '%Y-%m-%d %H:%M:%S',
-        '%m/%d/%Y %H:%M:%S'
-    ]
-    
-    for fmt in formats:
+    for fmt in DATE_FORMATS:
         try:
             parsed_date = datetime.strptime(date_str, fmt)
             return True, parsed_date
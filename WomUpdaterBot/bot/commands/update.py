@@ -1,18 +1,29 @@
 import discord
 from discord.ext import commands
+import asyncio
 import logging
-from bot.services.wiseoldman import WiseOldManAPI
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from bot.services.groups import WOMGroup
 
 class UpdateCommands(commands.Cog):
     """Commands for WiseOldMan updates"""
     
-    def __init__(self, bot: commands.Bot, wom_api: WiseOldManAPI):
+    def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.wom_api = wom_api
         self.logger = logging.getLogger("wom_bot.commands")
     
+    def _select_groups(self, name: Optional[str]) -> List[WOMGroup]:
+        """The named group, or every group when no name is given"""
+        if name is None:
+            return list(self.bot.groups.values())
+        group = self.bot.groups.get(name)
+        return [group] if group else []
+    
     @discord.app_commands.command(name="update", description="Manually trigger WiseOldMan group update")
-    async def manual_update(self, interaction: discord.Interaction):
+    @discord.app_commands.describe(group="Group to update (default: all groups)")
+    async def manual_update(self, interaction: discord.Interaction, group: Optional[str] = None):
         """Manual trigger for WiseOldMan group update"""
         
         # Defer response since API call might take time
@@ -20,46 +31,89 @@ class UpdateCommands(commands.Cog):
         
         self.logger.info(f"Manual update triggered by {interaction.user.name}")
         
+        groups = self._select_groups(group)
+        if not groups:
+            await self.bot.outbound.send(interaction.followup, content=f"❌ Unknown group `{group}`")
+            return
+        
         try:
-            # Call WiseOldMan API
-            result = await self.wom_api.update_all_members()
-            
-            if result["success"]:
-                embed = discord.Embed(
-                    title="✅ Update Successful",
-                    description="WiseOldMan group update has been triggered successfully!",
-                    color=0x00FF00
-                )
-                embed.add_field(
-                    name="Group ID", 
-                    value=self.wom_api.group_id, 
-                    inline=True
-                )
-                embed.add_field(
-                    name="Triggered by", 
-                    value=interaction.user.mention, 
-                    inline=True
-                )
-                embed.timestamp = discord.utils.utcnow()
-                
-                self.logger.info("Manual update completed successfully")
-                
-            else:
-                embed = discord.Embed(
-                    title="❌ Update Failed",
-                    description=f"Failed to trigger WiseOldMan update: {result['message']}",
-                    color=0xFF0000
-                )
-                embed.add_field(
-                    name="Error Details", 
-                    value=result.get('error', 'Unknown error'), 
-                    inline=False
-                )
-                embed.timestamp = discord.utils.utcnow()
-                
-                self.logger.error(f"Manual update failed: {result['message']}")
+            # Progress goes on a message edited at most every few seconds
+            progress_message = None
+            progress: Dict[str, str] = {}
+            last_edit = 0.0
+            # One edit in flight at a time, always sending the latest content, so edits can't land out of order
+            progress_edit: Optional[asyncio.Task] = None
+            pending_content: Optional[str] = None
+            
+            async def edit_progress():
+                nonlocal pending_content
+                while pending_content is not None:
+                    content, pending_content = pending_content, None
+                    try:
+                        await progress_message.edit(content=content)
+                    except discord.HTTPException as e:
+                        self.logger.warning(f"Failed to update progress message: {e}")
+            
+            def on_progress(group: WOMGroup, done: int, total: int):
+                nonlocal last_edit, progress_edit, pending_content
+                progress[group.name] = f"{done}/{total}"
+                if progress_message and (done == total or time.monotonic() - last_edit >= 5):
+                    last_edit = time.monotonic()
+                    if len(groups) == 1:
+                        content = f"🔄 Updated {done}/{total} stale players..."
+                    else:
+                        content = "🔄 Updated stale players: " + ", ".join(
+                            f"{group.label} {progress[group.name]}" for group in groups if group.name in progress
+                        )
+                    pending_content = content
+                    if progress_edit is None or progress_edit.done():
+                        progress_edit = asyncio.create_task(edit_progress())
+            
+            if self.bot.update_mode != "all":
+                progress_message = await self.bot.outbound.send(interaction.followup, content="🔄 Finding stale players...", wait=True)
             
-            await interaction.followup.send(embed=embed)
+            results = await self.bot.run_group_updates(groups, on_progress)
+            if progress_edit:
+                await progress_edit
+            
+            for group, result in zip(groups, results):
+                if result["success"]:
+                    embed = discord.Embed(
+                        title="✅ Update Successful",
+                        description=f"WiseOldMan update of {group.label} has been triggered successfully!",
+                        color=0x00FF00
+                    )
+                    self.bot.add_update_fields(embed, result)
+                    embed.add_field(
+                        name="Group ID", 
+                        value=group.wom_api.group_id, 
+                        inline=True
+                    )
+                    embed.add_field(
+                        name="Triggered by", 
+                        value=interaction.user.mention, 
+                        inline=True
+                    )
+                    embed.timestamp = discord.utils.utcnow()
+                    
+                    self.logger.info(f"Manual update of {group.label} completed successfully")
+                    
+                else:
+                    embed = discord.Embed(
+                        title="❌ Update Failed",
+                        description=f"Failed to trigger WiseOldMan update of {group.label}: {result['message']}",
+                        color=0xFF0000
+                    )
+                    embed.add_field(
+                        name="Error Details", 
+                        value=result.get('error', 'Unknown error'), 
+                        inline=False
+                    )
+                    embed.timestamp = discord.utils.utcnow()
+                    
+                    self.logger.error(f"Manual update of {group.label} failed: {result['message']}")
+                
+                await self.bot.outbound.send(interaction.followup, embed=embed)
             
         except Exception as e:
             error_msg = f"Unexpected error during manual update: {str(e)}"
@@ -77,17 +131,60 @@ class UpdateCommands(commands.Cog):
             )
             embed.timestamp = discord.utils.utcnow()
             
-            await interaction.followup.send(embed=embed)
+            await self.bot.outbound.send(interaction.followup, embed=embed)
+    
+    @staticmethod
+    def _group_status(group: WOMGroup, group_info: Dict[str, Any]) -> str:
+        """Connection, recent update completion and API health of one group, as field text"""
+        if group_info["success"]:
+            group_data = group_info["data"]
+            lines = [
+                f"✅ {group_data.get('name', 'Unknown')} · ID {group.wom_api.group_id} · "
+                f"{group_data.get('memberCount', 'Unknown')} members"
+            ]
+        else:
+            lines = [f"❌ Connection Failed · ID {group.wom_api.group_id}"]
+        
+        # Completion of recent updates
+        tracking = group.tracker.summary()
+        if group.tracker.active:
+            active = group.tracker.active
+            lines.append(f"🔄 Tracking current update: {active['completed']}/{active['targets'] or '?'} players refreshed")
+        if tracking:
+            last = tracking["last"]
+            started = discord.utils.format_dt(datetime.fromisoformat(last["started_at"]), "R")
+            lines.append(
+                f"Last ({last['mode']}, {started}): {last['outcome']}, {last['completed']}/{last['targets']} refreshed, "
+                f"p50 {last['p50_s']:.0f}s, p90 {last['p90_s']:.0f}s"
+            )
+            lines.append(
+                f"Last {tracking['runs']} runs: {tracking['completion_rate']:.0%} refreshed, "
+                f"median p50 {tracking['median_p50_s']:.0f}s, {tracking['failed_players']} player failures"
+            )
+        
+        # Request health per WOM endpoint since startup
+        lines += [
+            f"`{endpoint}`: {stats['requests']} requests, {stats['errors']} errors, "
+            f"{stats['retries']} retries | p50 {stats['p50_ms']:.0f} ms, p95 {stats['p95_ms']:.0f} ms"
+            for endpoint, stats in group.wom_api.get_stats().items()
+        ]
+        return "\n".join(lines)[:1024]
     
     @discord.app_commands.command(name="status", description="Check bot and WiseOldMan group status")
-    async def check_status(self, interaction: discord.Interaction):
+    @discord.app_commands.describe(group="Group to check (default: all groups)")
+    async def check_status(self, interaction: discord.Interaction, group: Optional[str] = None):
         """Check bot status and WiseOldMan group info"""
         
         await interaction.response.defer()
         
+        groups = self._select_groups(group)
+        if not groups:
+            await self.bot.outbound.send(interaction.followup, content=f"❌ Unknown group `{group}`")
+            return
+        
         try:
             # Get group info from WiseOldMan API
-            group_info = await self.wom_api.get_group_info()
+            group_infos = await asyncio.gather(*(group.wom_api.get_group_info() for group in groups))
             
             embed = discord.Embed(
                 title="🤖 Bot Status",
@@ -108,33 +205,16 @@ class UpdateCommands(commands.Cog):
             )
             
             # WiseOldMan group status
-            if group_info["success"]:
-                group_data = group_info["data"]
+            for group, group_info in zip(groups[:20], group_infos):
                 embed.add_field(
-                    name="WOM Group",
-                    value=f"✅ {group_data.get('name', 'Unknown')}",
-                    inline=True
-                )
-                embed.add_field(
-                    name="Group ID",
-                    value=self.wom_api.group_id,
-                    inline=True
-                )
-                embed.add_field(
-                    name="Member Count",
-                    value=group_data.get('memberCount', 'Unknown'),
-                    inline=True
-                )
-            else:
-                embed.add_field(
-                    name="WOM Group",
-                    value="❌ Connection Failed",
-                    inline=True
+                    name=f"WOM {group.label}",
+                    value=self._group_status(group, group_info),
+                    inline=False
                 )
             
             embed.timestamp = discord.utils.utcnow()
             
-            await interaction.followup.send(embed=embed)
+            await self.bot.outbound.send(interaction.followup, embed=embed)
             
         except Exception as e:
             self.logger.error(f"Error checking status: {str(e)}")
@@ -145,8 +225,17 @@ class UpdateCommands(commands.Cog):
                 color=0xFF0000
             )
             
-            await interaction.followup.send(embed=embed)
+            await self.bot.outbound.send(interaction.followup, embed=embed)
+    
+    @manual_update.autocomplete("group")
+    @check_status.autocomplete("group")
+    async def group_autocomplete(self, interaction: discord.Interaction, current: str):
+        return [
+            discord.app_commands.Choice(name=group.label, value=group.name)
+            for group in self.bot.groups.values()
+            if current.lower() in group.label.lower()
+        ][:25]
 
-async def setup(bot: commands.Bot, wom_api: WiseOldManAPI):
+async def setup(bot: commands.Bot):
     """Setup function to add the cog"""
-    await bot.add_cog(UpdateCommands(bot, wom_api))
\ No newline at end of file
+    await bot.add_cog(UpdateCommands(bot))
\ No newline at end of file
@@ -1,12 +1,16 @@
 import os
 import asyncio
-from datetime import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
 from dotenv import load_dotenv
 import discord
 from discord.ext import commands
 
-from bot.services.wiseoldman import WiseOldManAPI
+from bot.services.wiseoldman import WiseOldManAPI, WOMConnectionPool
 from bot.services.scheduler import TaskScheduler
+from bot.services.update_tracker import UpdateTracker
+from bot.services.groups import DEFAULT_GROUP, WOMGroup
+from bot.services.outbound import OutboundScheduler
 from bot.utils.logger import setup_logger, get_discord_handler
 from bot.commands.update import setup as setup_update_commands
 
@@ -33,25 +37,87 @@ class WOMUpdateBot(commands.Bot):
             level=os.getenv("LOG_LEVEL", "INFO")
         )
         
-        # Initialize services
-        self.wom_api = WiseOldManAPI(
-            api_key=os.getenv("WOM_API_KEY"),
-            group_id=os.getenv("WOM_GROUP_ID")
+        # Connections and request pacing shared by every group's API client
+        self.wom_pool = WOMConnectionPool(
+            requests_per_minute=int(os.getenv("WOM_REQUESTS_PER_MINUTE", 90)),
+            limit=int(os.getenv("WOM_MAX_CONNECTIONS", 10))
         )
         
+        # 'all' uses update-all; opt-in 'stale' updates only players not refreshed within STALE_AFTER_HOURS
+        self.update_mode = os.getenv("UPDATE_MODE", "all").lower()
+        self.stale_after = timedelta(hours=float(os.getenv("STALE_AFTER_HOURS", 20)))
+        self.update_concurrency = int(os.getenv("UPDATE_CONCURRENCY", 4))
+        self.max_player_updates = int(os.getenv("MAX_PLAYER_UPDATES", 0))
+        
         self.scheduler = TaskScheduler(
-            timezone=os.getenv("TIMEZONE", "Australia/Sydney")
+            timezone=os.getenv("TIMEZONE", "Australia/Sydney"),
+            state_file=os.getenv("SCHEDULER_STATE_FILE", "data/scheduler_state.json")
         )
+        # Cron expression (minute hour day month weekday) in TIMEZONE
+        self.update_schedule = os.getenv("UPDATE_SCHEDULE", "0 0 * * *")
+        
+        # Paced, ordered sends shared by every channel and followup message
+        self.outbound = OutboundScheduler()
         
         self.update_channel_id = os.getenv("UPDATE_CHANNEL_ID")
         self.update_channel = None
         
+        # Seconds between the starts of group updates that would otherwise begin together
+        self.group_stagger = float(os.getenv("GROUP_STAGGER_SECONDS", 30))
+        self.groups = self._load_groups()
+    
+    def _load_groups(self) -> Dict[str, WOMGroup]:
+        """Groups named in WOM_GROUPS, each configured by WOM_GROUP_<NAME>_* variables
+        
+        Without WOM_GROUPS the bot serves the single group in WOM_GROUP_ID. A group's
+        API_KEY, SCHEDULE and CHANNEL_ID default to WOM_API_KEY, UPDATE_SCHEDULE and
+        UPDATE_CHANNEL_ID.
+        """
+        names = [name.strip() for name in os.getenv("WOM_GROUPS", "").split(",") if name.strip()]
+        history_root, history_ext = os.path.splitext(os.getenv("UPDATE_HISTORY_FILE", "data/update_history.jsonl"))
+        
+        groups = {}
+        for index, name in enumerate(names or [DEFAULT_GROUP]):
+            if names:
+                prefix = f"WOM_GROUP_{name.upper()}_"
+                group_id = os.getenv(prefix + "ID")
+                if not group_id:
+                    raise ValueError(f"{prefix}ID is required for WOM group '{name}'")
+                api_key = os.getenv(prefix + "API_KEY", os.getenv("WOM_API_KEY"))
+                schedule = os.getenv(prefix + "SCHEDULE", self.update_schedule)
+                channel_id = os.getenv(prefix + "CHANNEL_ID", self.update_channel_id)
+                history_file = f"{history_root}_{name}{history_ext}"
+            else:
+                group_id = os.getenv("WOM_GROUP_ID")
+                api_key = os.getenv("WOM_API_KEY")
+                schedule = self.update_schedule
+                channel_id = self.update_channel_id
+                history_file = history_root + history_ext
+            
+            wom_api = WiseOldManAPI(
+                api_key=api_key,
+                group_id=group_id,
+                timeout=float(os.getenv("WOM_TIMEOUT_SECONDS", 30)),
+                max_retries=int(os.getenv("WOM_MAX_RETRIES", 3)),
+                pool=self.wom_pool
+            )
+            # Follows each update to completion and keeps a history for /status
+            tracker = UpdateTracker(
+                wom_api,
+                history_file=history_file,
+                timeout=float(os.getenv("UPDATE_TRACK_TIMEOUT_MINUTES", 30)) * 60
+            )
+            groups[name] = WOMGroup(name, wom_api, tracker, schedule, channel_id, stagger=index * self.group_stagger)
+        
+        self.logger.info(f"Serving {len(groups)} WOM group(s): {', '.join(group.label for group in groups.values())}")
+        return groups
+        
     async def setup_hook(self):
         """Setup hook called when bot is starting"""
         self.logger.info("Setting up WOM Update Bot...")
         
         # Setup commands
-        await setup_update_commands(self, self.wom_api)
+        await setup_update_commands(self)
         
         # Sync slash commands
         try:
@@ -86,18 +152,39 @@ class WOMUpdateBot(commands.Bot):
         if discord_handler and self.update_channel_id:
             discord_handler.set_bot(self, int(self.update_channel_id))
         
-        # Send startup message
-        if self.update_channel:
+        # Each group reports to its own channel, or the update channel if it has none
+        for group in self.groups.values():
+            group.channel = self.update_channel
+            if group.channel_id and group.channel_id != self.update_channel_id:
+                group.channel = self.get_channel(int(group.channel_id))
+                if not group.channel:
+                    self.logger.warning(f"Update channel with ID {group.channel_id} for {group.label} not found")
+        
+        # Start scheduler and schedule updates; a run missed while offline fires now
+        self.scheduler.start_scheduler()
+        next_updates = {
+            group.name: self.scheduler.add_job(group.job_name, group.schedule, self.scheduled_update, group)
+            for group in self.groups.values()
+        }
+        
+        # Send startup message to every channel with groups reporting to it
+        channels: Dict[Any, List[WOMGroup]] = {}
+        for group in self.groups.values():
+            if group.channel:
+                channels.setdefault(group.channel, []).append(group)
+        
+        for channel, groups in channels.items():
             embed = discord.Embed(
                 title="🤖 WOM Update Bot Started",
                 description="Bot is online and ready to handle WiseOldMan updates!",
                 color=0x00FF00
             )
-            embed.add_field(
-                name="Scheduled Updates",
-                value="Daily at 12:00 AM AEST",
-                inline=True
-            )
+            for group in groups:
+                embed.add_field(
+                    name="Scheduled Updates" if len(self.groups) == 1 else f"Scheduled Updates: {group.label}",
+                    value=f"`{group.schedule}` ({self.scheduler.timezone})\nNext: {discord.utils.format_dt(next_updates[group.name])}",
+                    inline=True
+                )
             embed.add_field(
                 name="Manual Commands",
                 value="/update - Manual update\n/status - Check status",
@@ -105,16 +192,7 @@ class WOMUpdateBot(commands.Bot):
             )
             embed.timestamp = discord.utils.utcnow()
             
-            await self.update_channel.send(embed=embed)
-        
-        # Start scheduler and schedule midnight updates
-        self.scheduler.start_scheduler()
-        midnight = time(hour=0, minute=0)  # 12:00 AM
-        await self.scheduler.schedule_daily_task(
-            "midnight_update",
-            midnight,
-            self.scheduled_update
-        )
+            await self.outbound.send(channel, embed=embed)
         
         self.logger.info("WOM Update Bot is fully ready!")
     
@@ -132,40 +210,106 @@ class WOMUpdateBot(commands.Bot):
                 description=str(error),
                 color=0xFF0000
             )
-            await self.update_channel.send(embed=embed)
+            await self.outbound.send(self.update_channel, embed=embed)
+    
+    async def run_update(self, group: WOMGroup,
+                         on_progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """Update a group in the configured mode; on_progress(done, total) applies to stale mode"""
+        started_at = datetime.now(timezone.utc)
+        
+        if self.update_mode == "all":
+            result = await group.wom_api.update_all_members()
+            # WOM only queued its outdated players; follow those through in the background
+            if result["success"]:
+                if isinstance(result["count"], int):
+                    group.tracker.start(started_at, result["count"])
+                else:
+                    self.logger.warning(f"update-all for {group.label} did not say how many players it queued; not tracking the run")
+            return result
+        
+        result = await group.wom_api.update_stale_members(
+            self.stale_after,
+            concurrency=self.update_concurrency,
+            max_updates=self.max_player_updates,
+            on_progress=on_progress
+        )
+        # Player updates complete synchronously, so the run is known as soon as it returns
+        if "stale" in result:
+            group.tracker.record(UpdateTracker.build_run(
+                "stale", started_at, result["stale"], result["durations"], len(result["failed"]),
+                "partial" if result["failed"] else "complete"
+            ))
+        return result
+    
+    async def run_group_updates(self, groups: List[WOMGroup],
+                                on_progress: Optional[Callable[[WOMGroup, int, int], None]] = None) -> List[Dict[str, Any]]:
+        """Update several groups concurrently, for manual runs
+        
+        Groups start together rather than staggered, as the shared rate limiter already
+        paces their requests and an interaction's followups expire after 15 minutes.
+        Returns one result per group, in order; a group that raises gets a failed result
+        instead of failing the others. on_progress(group, done, total) applies to stale mode.
+        """
+        async def update(group: WOMGroup) -> Dict[str, Any]:
+            progress = (lambda done, total: on_progress(group, done, total)) if on_progress else None
+            try:
+                return await self.run_update(group, progress)
+            except Exception as e:
+                self.logger.error(f"Error updating {group.label}: {str(e)}")
+                return {"success": False, "message": f"Error updating {group.label}: {str(e)}", "error": str(e)}
+        
+        return await asyncio.gather(*(update(group) for group in groups))
+    
+    @staticmethod
+    def add_update_fields(embed: discord.Embed, result: Dict[str, Any]):
+        """Add player counts from a stale-mode update to a result embed"""
+        if "stale" not in result:
+            return
+        embed.add_field(name="Members", value=result["members"], inline=True)
+        embed.add_field(name="Stale", value=result["stale"], inline=True)
+        embed.add_field(name="Updated", value=result["updated"], inline=True)
+        if result["failed"]:
+            failed = ", ".join(result["failed"][:20])
+            if len(result["failed"]) > 20:
+                failed += f" and {len(result['failed']) - 20} more"
+            embed.add_field(name=f"Failed ({len(result['failed'])})", value=failed, inline=False)
     
     def get_channel_by_id(self, channel_id: int):
         """Get channel by ID - more reliable than name lookup"""
         return self.get_channel(channel_id)
     
-    async def scheduled_update(self):
-        """Perform scheduled WiseOldMan update"""
-        self.logger.info("Starting scheduled WiseOldMan update")
+    async def scheduled_update(self, group: WOMGroup):
+        """Perform scheduled WiseOldMan update for one group"""
+        # Groups on the same schedule start apart instead of bursting together
+        if group.stagger:
+            await asyncio.sleep(group.stagger)
+        self.logger.info(f"Starting scheduled WiseOldMan update for {group.label}")
         
         try:
-            result = await self.wom_api.update_all_members()
+            result = await self.run_update(group)
             
-            if self.update_channel:
+            if group.channel:
                 if result["success"]:
                     embed = discord.Embed(
                         title="✅ Scheduled Update Complete",
                         description="Daily WiseOldMan group update completed successfully!",
                         color=0x00FF00
                     )
+                    self.add_update_fields(embed, result)
                     embed.add_field(
-                        name="Update Time",
-                        value="12:00 AM AEST (Scheduled)",
+                        name="Schedule",
+                        value=f"`{group.schedule}` ({self.scheduler.timezone})",
                         inline=True
                     )
                     embed.add_field(
                         name="Group ID",
-                        value=self.wom_api.group_id,
+                        value=group.wom_api.group_id,
                         inline=True
                     )
                 else:
                     embed = discord.Embed(
                         title="❌ Scheduled Update Failed",
-                        description=f"Daily update failed: {result['message']}",
+                        description=f"Daily update of {group.label} failed: {result['message']}",
                         color=0xFF0000
                     )
                     embed.add_field(
@@ -175,18 +319,18 @@ class WOMUpdateBot(commands.Bot):
                     )
                 
                 embed.timestamp = discord.utils.utcnow()
-                await self.update_channel.send(embed=embed)
+                await self.outbound.send(group.channel, embed=embed)
             
-            self.logger.info("Scheduled update completed")
+            self.logger.info(f"Scheduled update of {group.label} completed")
             
         except Exception as e:
-            error_msg = f"Error during scheduled update: {str(e)}"
+            error_msg = f"Error during scheduled update of {group.label}: {str(e)}"
             self.logger.error(error_msg)
             
-            if self.update_channel:
+            if group.channel:
                 embed = discord.Embed(
                     title="❌ Scheduled Update Error",
-                    description="An error occurred during the scheduled update.",
+                    description=f"An error occurred during the scheduled update of {group.label}.",
                     color=0xFF0000
                 )
                 embed.add_field(
@@ -195,12 +339,23 @@ class WOMUpdateBot(commands.Bot):
                     inline=False
                 )
                 embed.timestamp = discord.utils.utcnow()
-                await self.update_channel.send(embed=embed)
+                await self.outbound.send(group.channel, embed=embed)
     
     async def close(self):
         """Cleanup when bot is shutting down"""
         self.logger.info("Shutting down WOM Update Bot...")
         await self.scheduler.stop_scheduler()
+        for group in self.groups.values():
+            await group.tracker.stop()
+        
+        # Send buffered log records while the connection is still up
+        discord_handler = get_discord_handler(self.logger)
+        if discord_handler:
+            await discord_handler.shutdown()
+        
+        for group in self.groups.values():
+            await group.wom_api.close()
+        await self.wom_pool.close()
         await super().close()
 
 async def main():
@@ -0,0 +1,36 @@
+from typing import Optional
+from bot.services.update_tracker import UpdateTracker
+from bot.services.wiseoldman import WiseOldManAPI
+
+# Name of the group configured by WOM_GROUP_ID when WOM_GROUPS isn't set
+DEFAULT_GROUP = "default"
+
+class WOMGroup:
+    """One WiseOldMan group served by the bot
+
+    Each group has its own API client, update schedule, result channel and
+    update history. The API clients of all groups share one connection pool
+    and rate limiter.
+    """
+
+    def __init__(self, name: str, wom_api: WiseOldManAPI, tracker: UpdateTracker, schedule: str,
+                 channel_id: Optional[str] = None, stagger: float = 0.0):
+        self.name = name
+        self.wom_api = wom_api
+        self.tracker = tracker
+        self.schedule = schedule
+        self.channel_id = channel_id
+        # Delay before a scheduled update, so groups due at the same time start apart
+        self.stagger = stagger
+        self.channel = None
+
+    @property
+    def label(self) -> str:
+        if self.name == DEFAULT_GROUP:
+            return f"Group {self.wom_api.group_id}"
+        return f"{self.name} ({self.wom_api.group_id})"
+
+    @property
+    def job_name(self) -> str:
+        # The single-group job keeps its original name so its saved schedule state carries over
+        return "midnight_update" if self.name == DEFAULT_GROUP else f"update_{self.name}"
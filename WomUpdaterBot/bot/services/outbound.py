@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Dict
+
+class RateLimitBucket:
+    """Token bucket for one destination: `capacity` sends per `period` seconds"""
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.period = period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        """Wait until a send is allowed, then consume one token"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.capacity / self.period)
+            self.updated = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self.tokens) * self.period / self.capacity)
+
+class OutboundScheduler:
+    """Shared send queue for channels and interaction followups
+
+    Sends to the same destination go out in order and are paced by that
+    destination's rate-limit bucket; different destinations send concurrently.
+    """
+
+    def __init__(self, rate: int = 5, per: float = 5.0):
+        self.rate = rate
+        self.per = per
+        self.logger = logging.getLogger("wom_bot.outbound")
+        self._buckets: Dict[object, RateLimitBucket] = {}
+        self._locks: Dict[object, asyncio.Lock] = {}
+        self._latencies = deque(maxlen=500)
+        self.sent = 0
+        self.failed = 0
+
+    def _key(self, destination):
+        # Interaction followups share the application's webhook id but are limited per token
+        return getattr(destination, 'token', None) or getattr(destination, 'id', None) or id(destination)
+
+    def _prune(self):
+        # One-off destinations (expired interaction tokens) would otherwise accumulate forever
+        for key in [key for key, lock in self._locks.items() if not lock.locked()]:
+            del self._locks[key]
+            self._buckets.pop(key, None)
+
+    async def send(self, destination, content: str = None, **kwargs):
+        """Queue one message for a destination and return the sent message"""
+        key = self._key(destination)
+        if len(self._locks) > 256:
+            self._prune()
+        bucket = self._buckets.setdefault(key, RateLimitBucket(self.rate, self.per))
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        queued_at = time.monotonic()
+
+        async with lock:
+            await bucket.acquire()
+            latency = time.monotonic() - queued_at
+            self._latencies.append(latency)
+
+            try:
+                message = await destination.send(content=content, **kwargs)
+                self.sent += 1
+                self.logger.debug(f"Sent message to {getattr(destination, 'id', None)} after {latency * 1000:.0f} ms in queue")
+                return message
+            except Exception:
+                self.failed += 1
+                raise
+
+    def stats(self) -> Dict:
+        """Sent/failed counts and queue latency percentiles in milliseconds"""
+        latencies = sorted(self._latencies)
+        if not latencies:
+            return {'sent': self.sent, 'failed': self.failed, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        return {
+            'sent': self.sent,
+            'failed': self.failed,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'max_ms': latencies[-1] * 1000
+        }
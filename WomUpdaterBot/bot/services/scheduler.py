@@ -1,80 +1,272 @@
 import asyncio
+import heapq
+import json
 import logging
-from datetime import datetime, time
-from typing import Callable, Optional
+import os
+from datetime import datetime, time, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import pytz
 
+class CronSpec:
+    """A five-field cron expression: minute hour day-of-month month day-of-week
+
+    Fields accept '*', numbers, ranges ('1-5'), lists ('0,30') and steps
+    ('*/15', '0-30/10'). Day of week is 0-6 with 0 = Sunday (7 is also
+    Sunday). As in cron, when both day fields are restricted a day matching
+    either one matches.
+    """
+
+    FIELDS = [('minute', 0, 59), ('hour', 0, 23), ('day', 1, 31), ('month', 1, 12), ('weekday', 0, 7)]
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {len(parts)}: '{expression}'")
+
+        values = [self._parse_field(part, low, high, name) for part, (name, low, high) in zip(parts, self.FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = values
+        self.weekdays = {day % 7 for day in weekdays}
+        self.any_day = parts[2] == '*'
+        self.any_weekday = parts[4] == '*'
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int, name: str) -> Set[int]:
+        values = set()
+        for item in field.split(','):
+            base, _, step = item.partition('/')
+            if base == '*':
+                start, end = low, high
+            elif '-' in base:
+                start, end = (int(value) for value in base.split('-', 1))
+            else:
+                start = end = int(base)
+                if step:
+                    end = high
+            if not (low <= start <= end <= high):
+                raise ValueError(f"Cron {name} out of range {low}-{high}: '{item}'")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        # datetime.weekday() is Monday=0; cron is Sunday=0
+        day_match = day.day in self.days
+        weekday_match = (day.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day_match and weekday_match
+        return day_match or weekday_match
+
+    def next_after(self, after: datetime) -> datetime:
+        """First matching wall-clock minute strictly after a naive local datetime"""
+        candidate = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # Four years covers every valid combination, including 29 February
+        for _ in range(366 * 4):
+            if self._day_matches(candidate):
+                for hour in sorted(self.hours):
+                    if hour < candidate.hour:
+                        continue
+                    for minute in sorted(self.minutes):
+                        if hour == candidate.hour and minute < candidate.minute:
+                            continue
+                        return candidate.replace(hour=hour, minute=minute)
+            candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+        raise ValueError(f"Cron expression never matches: '{self.expression}'")
+
+class ScheduledJob:
+    def __init__(self, name: str, spec: CronSpec, func: Callable, args: tuple, kwargs: dict, catch_up: bool):
+        self.name = name
+        self.spec = spec
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.catch_up = catch_up
+        self.next_run: Optional[datetime] = None
+        self.last_run: Optional[datetime] = None
+        self.sequence = 0
+        self.task: Optional[asyncio.Task] = None
+
 class TaskScheduler:
-    """Handles automated task scheduling"""
-    
-    def __init__(self, timezone: str = "Australia/Sydney"):
+    """Runs any number of cron-scheduled jobs from one timer loop
+
+    Jobs sit in a heap ordered by their next run time and the loop sleeps
+    until the earliest one is due, so idle jobs cost nothing. Next run times
+    are computed in the scheduler's timezone and persisted to `state_file`;
+    a job whose run was missed while the bot was down fires once on startup.
+    """
+
+    def __init__(self, timezone: str = "Australia/Sydney", state_file: Optional[str] = None):
         self.timezone = pytz.timezone(timezone)
         self.logger = logging.getLogger("wom_bot.scheduler")
-        self.scheduled_tasks = {}
+        self.state_file = state_file or "data/scheduler_state.json"
+        self.jobs: Dict[str, ScheduledJob] = {}
         self.running = False
-        
+        self._heap: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+        self._wakeup = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+        self._state = self._load_state()
+
+    def _load_state(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.state_file, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable scheduler state {self.state_file}: {e}")
+            return {}
+
+    def _save_state(self):
+        try:
+            os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+            with open(self.state_file + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(self._state, f, indent=2)
+            os.replace(self.state_file + '.tmp', self.state_file)
+        except OSError as e:
+            self.logger.error(f"Failed to save scheduler state: {e}")
+
+    def _localize(self, wall_time: datetime) -> datetime:
+        """Attach the timezone to a wall-clock time, resolving DST gaps and overlaps"""
+        try:
+            return self.timezone.localize(wall_time, is_dst=None)
+        except pytz.exceptions.AmbiguousTimeError:
+            # Clocks went back: run at the first occurrence
+            return self.timezone.localize(wall_time, is_dst=True)
+        except pytz.exceptions.NonExistentTimeError:
+            # Clocks went forward past this time: run at the equivalent moment just after the gap
+            return self.timezone.normalize(self.timezone.localize(wall_time, is_dst=False))
+
+    def _next_run(self, spec: CronSpec, after: datetime) -> datetime:
+        local_after = after.astimezone(self.timezone).replace(tzinfo=None)
+        return self._localize(spec.next_after(local_after))
+
+    def _push(self, job: ScheduledJob):
+        self._sequence += 1
+        job.sequence = self._sequence
+        heapq.heappush(self._heap, (job.next_run.timestamp(), self._sequence, job.name))
+        self._wakeup.set()
+
+    def add_job(self, name: str, cron: str, task_func: Callable, *args, catch_up: bool = True, **kwargs) -> datetime:
+        """Schedule task_func by a cron expression, replacing any job with the same name
+
+        Returns the next run time. With catch_up, a run missed while the bot was
+        down (according to the persisted state) happens as soon as possible.
+        """
+        spec = CronSpec(cron)
+        job = ScheduledJob(name, spec, task_func, args, kwargs, catch_up)
+        now = datetime.now(self.timezone)
+
+        previous = self.jobs.get(name)
+        if previous and previous.task and not previous.task.done():
+            job.task = previous.task
+
+        stored = self._state.get(name, {})
+        missed = datetime.fromisoformat(stored['next_run']) if stored.get('next_run') else None
+        if stored.get('last_run'):
+            job.last_run = datetime.fromisoformat(stored['last_run'])
+
+        if catch_up and missed and missed <= now and stored.get('cron') == cron:
+            self.logger.warning(f"Task '{name}' missed its run at {missed}; running it now")
+            job.next_run = now
+        else:
+            job.next_run = self._next_run(spec, now)
+
+        self.jobs[name] = job
+        self._state[name] = {**stored, 'cron': cron, 'next_run': job.next_run.isoformat()}
+        self._save_state()
+        self._push(job)
+
+        self.logger.info(f"Scheduled task '{name}' ({cron} {self.timezone}); next run at {job.next_run}")
+        return job.next_run
+
     async def schedule_daily_task(self, task_name: str, target_time: time, task_func: Callable, *args, **kwargs):
         """Schedule a task to run daily at specified time"""
-        self.logger.info(f"Scheduling daily task '{task_name}' for {target_time} {self.timezone}")
-        
-        async def task_runner():
-            while self.running:
-                now = datetime.now(self.timezone)
-                target_datetime = datetime.combine(now.date(), target_time).replace(tzinfo=self.timezone)
-                
-                # If target time has passed today, schedule for tomorrow
-                if now >= target_datetime:
-                    target_datetime = target_datetime.replace(day=target_datetime.day + 1)
-                
-                # Calculate seconds until target time
-                sleep_seconds = (target_datetime - now).total_seconds()
-                self.logger.info(f"Next execution of '{task_name}' in {sleep_seconds:.0f} seconds at {target_datetime}")
-                
-                try:
-                    await asyncio.sleep(sleep_seconds)
-                    
-                    if self.running:  # Check if still running after sleep
-                        self.logger.info(f"Executing scheduled task: {task_name}")
-                        await task_func(*args, **kwargs)
-                        self.logger.info(f"Completed scheduled task: {task_name}")
-                        
-                except asyncio.CancelledError:
-                    self.logger.info(f"Scheduled task '{task_name}' was cancelled")
-                    break
-                except Exception as e:
-                    self.logger.error(f"Error in scheduled task '{task_name}': {str(e)}")
-                    # Continue running despite errors
-                    await asyncio.sleep(60)  # Wait 1 minute before retrying
-        
-        # Start the task runner
-        task = asyncio.create_task(task_runner())
-        self.scheduled_tasks[task_name] = task
-        
+        return self.add_job(task_name, f"{target_time.minute} {target_time.hour} * * *", task_func, *args, **kwargs)
+
+    def remove_job(self, name: str) -> bool:
+        # Its heap entry is skipped when popped
+        job = self.jobs.pop(name, None)
+        self._state.pop(name, None)
+        self._save_state()
+        return job is not None
+
+    async def _run_job(self, job: ScheduledJob, due: datetime):
+        self.logger.info(f"Executing scheduled task: {job.name}")
+        try:
+            await job.func(*job.args, **job.kwargs)
+            self.logger.info(f"Completed scheduled task: {job.name}")
+        except asyncio.CancelledError:
+            self.logger.info(f"Scheduled task '{job.name}' was cancelled")
+            raise
+        except Exception as e:
+            self.logger.error(f"Error in scheduled task '{job.name}': {str(e)}")
+
+        # Only now is the run recorded, so one interrupted by a restart is caught up
+        job.last_run = due
+        if self.jobs.get(job.name) is job:
+            self._state[job.name] = {**self._state.get(job.name, {}), 'next_run': job.next_run.isoformat(),
+                                     'last_run': due.isoformat()}
+            self._save_state()
+
+    async def _timer_loop(self):
+        while self.running:
+            self._wakeup.clear()
+            now = datetime.now(self.timezone)
+
+            while self._heap and self._heap[0][0] <= now.timestamp():
+                _, sequence, name = heapq.heappop(self._heap)
+                job = self.jobs.get(name)
+                # Entries left behind by removed or replaced jobs
+                if job is None or job.sequence != sequence:
+                    continue
+
+                due = job.next_run
+                job.next_run = self._next_run(job.spec, max(now, due))
+                self._push(job)
+
+                if job.task and not job.task.done():
+                    self.logger.warning(f"Skipping run of '{job.name}': the previous run is still going")
+                    continue
+                job.task = asyncio.create_task(self._run_job(job, due))
+                self.logger.info(f"Next execution of '{job.name}' at {job.next_run}")
+
+            timeout = self._heap[0][0] - now.timestamp() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
     def start_scheduler(self):
         """Start the scheduler"""
+        if self.running:
+            return
         self.running = True
+        self._loop_task = asyncio.create_task(self._timer_loop())
         self.logger.info("Task scheduler started")
-        
+
     async def stop_scheduler(self):
         """Stop the scheduler and cancel all tasks"""
         self.running = False
         self.logger.info("Stopping task scheduler...")
-        
-        for task_name, task in self.scheduled_tasks.items():
+
+        tasks = [task for task in [self._loop_task] + [job.task for job in self.jobs.values()] if task]
+        for task in tasks:
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            self.logger.info(f"Cancelled scheduled task: {task_name}")
-        
-        self.scheduled_tasks.clear()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._loop_task = None
         self.logger.info("Task scheduler stopped")
-        
+
     def is_running(self) -> bool:
         """Check if scheduler is running"""
         return self.running
-        
+
     def get_scheduled_tasks(self) -> list:
         """Get list of scheduled task names"""
-        return list(self.scheduled_tasks.keys())
\ No newline at end of file
+        return list(self.jobs.keys())
+
+    def next_run(self, name: str) -> Optional[datetime]:
+        job = self.jobs.get(name)
+        return job.next_run if job else None
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
+from bot.services.wiseoldman import WiseOldManAPI
+
+def percentile(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+class UpdateTracker:
+    """Follows group updates through to completion and keeps a history of runs
+
+    WOM accepts update-all immediately and refreshes its outdated players from
+    a queue, so a run is tracked by polling members' updatedAt with growing
+    intervals until as many players as were queued have refreshed, progress
+    stalls, or the timeout passes.
+    Each run's completion counts and time-to-refresh percentiles are appended
+    to a JSON Lines history file.
+    """
+
+    def __init__(self, wom_api: WiseOldManAPI, history_file: str = "data/update_history.jsonl",
+                 timeout: float = 1800.0, initial_delay: float = 15.0, max_delay: float = 300.0,
+                 stall_polls: int = 3, history_size: int = 50):
+        self.wom_api = wom_api
+        self.history_file = history_file
+        self.timeout = timeout
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.stall_polls = stall_polls
+        self.logger = logging.getLogger("wom_bot.tracker")
+        self.history = deque(self._load_history(history_size), maxlen=history_size)
+        self.active: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _load_history(self, limit: int) -> List[Dict[str, Any]]:
+        try:
+            with open(self.history_file, encoding='utf-8') as f:
+                lines = deque(f, maxlen=limit)
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            self.logger.warning(f"Could not read update history {self.history_file}: {e}")
+            return []
+
+        runs = []
+        for line in lines:
+            try:
+                runs.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return runs
+
+    def record(self, run: Dict[str, Any]):
+        """Add a finished run to the history"""
+        self.history.append(run)
+        try:
+            os.makedirs(os.path.dirname(self.history_file) or '.', exist_ok=True)
+            with open(self.history_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(run) + "\n")
+        except OSError as e:
+            self.logger.error(f"Failed to write update history: {e}")
+
+        self.logger.info(
+            f"Group {self.wom_api.group_id} update run {run['outcome']}: {run['completed']}/{run['targets']} players refreshed "
+            f"(p50 {run['p50_s']:.0f}s, p90 {run['p90_s']:.0f}s)"
+        )
+
+    @staticmethod
+    def build_run(mode: str, started_at: datetime, targets: int, durations: List[float],
+                  failed: int, outcome: str, finished: Optional[datetime] = None) -> Dict[str, Any]:
+        finished = finished or datetime.now(timezone.utc)
+        return {
+            "mode": mode,
+            "started_at": started_at.isoformat(),
+            "duration_s": round((finished - started_at).total_seconds(), 1),
+            "targets": targets,
+            "completed": len(durations),
+            "failed": failed,
+            "outcome": outcome,
+            "p50_s": round(percentile(durations, 0.50), 1),
+            "p90_s": round(percentile(durations, 0.90), 1),
+            "max_s": round(max(durations), 1) if durations else 0.0
+        }
+
+    def start(self, started_at: datetime, targets: int, usernames: Optional[Set[str]] = None, mode: str = "all"):
+        """Track an accepted update of `targets` players in the background
+
+        With usernames=None any member refreshed since started_at counts towards
+        the targets, as update-all only reports how many players it queued.
+        """
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = asyncio.create_task(self._track(started_at, targets, usernames, mode))
+
+    async def _track(self, started_at: datetime, targets: int, usernames: Optional[Set[str]], mode: str):
+        refreshed: Dict[str, float] = {}
+        self.active = {"mode": mode, "started_at": started_at, "targets": targets, "completed": 0}
+        deadline = time.monotonic() + self.timeout
+        delay = self.initial_delay
+        stalled = 0
+        outcome = "timeout"
+
+        try:
+            while targets and time.monotonic() < deadline:
+                await asyncio.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+                delay = min(self.max_delay, delay * 2)
+
+                try:
+                    players = await self.wom_api.get_group_members()
+                except Exception as e:
+                    self.logger.warning(f"Could not poll group members while tracking update: {e}")
+                    continue
+
+                before = len(refreshed)
+                for player in players:
+                    username = player.get("username")
+                    if usernames is not None and username not in usernames:
+                        continue
+                    updated_at = WiseOldManAPI._parse_timestamp(player.get("updatedAt"))
+                    if username not in refreshed and updated_at and updated_at >= started_at:
+                        refreshed[username] = (updated_at - started_at).total_seconds()
+
+                self.active.update(completed=min(len(refreshed), targets))
+                if len(refreshed) >= targets:
+                    outcome = "complete"
+                    break
+                # No new refreshes for several polls: the queue has settled short of everyone
+                stalled = stalled + 1 if len(refreshed) == before else 0
+                if stalled >= self.stall_polls:
+                    outcome = "settled"
+                    break
+
+        except asyncio.CancelledError:
+            # A newer update replaced this one, or the bot is shutting down
+            outcome = "interrupted"
+            raise
+        finally:
+            if not targets:
+                outcome = "complete"
+            self.active = None
+            # Players refreshed by someone else can push the count past the targets; keep the earliest
+            durations = sorted(refreshed.values())[:targets]
+            self.record(self.build_run(mode, started_at, targets, durations, targets - len(durations), outcome))
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def summary(self, recent: int = 10) -> Dict[str, Any]:
+        """Latest run plus completion rate, median time-to-refresh and failed players over recent runs"""
+        runs = list(self.history)[-recent:]
+        if not runs:
+            return {}
+        targets = sum(run["targets"] for run in runs)
+        return {
+            "last": runs[-1],
+            "runs": len(runs),
+            "completion_rate": sum(run["completed"] for run in runs) / targets if targets else 0.0,
+            "median_p50_s": percentile([run["p50_s"] for run in runs], 0.50),
+            "failed_players": sum(run["failed"] for run in runs)
+        }
@@ -1,58 +1,217 @@
 import aiohttp
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import random
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from bot.services.outbound import RateLimitBucket
+
+# Statuses worth retrying: rate limited, or a transient server/gateway failure
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class EndpointStats:
+    """Request counters and recent latencies for one API endpoint"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.latencies = deque(maxlen=200)
+
+    def summary(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95)
+        }
+
+class WOMConnectionPool:
+    """Connections and request pacing shared by the API clients of every group
+
+    Clients built on one pool reuse its keep-alive connections and draw from
+    one rate limiter, so groups updating at the same time can't burst past it.
+    """
+
+    def __init__(self, requests_per_minute: int = 0, limit: int = 10, burst: int = 3):
+        self.limit = limit
+        # Client-side pacing under WOM's rate limit (0 disables); 429s are still retried.
+        # The bucket holds only `burst` tokens refilling at rpm/60 per second, so a fresh
+        # start or an idle spell can't release a minute's worth of requests at once.
+        self.limiter = None
+        if requests_per_minute > 0:
+            burst = max(1, min(burst, requests_per_minute))
+            self.limiter = RateLimitBucket(burst, burst * 60.0 / requests_per_minute)
+        self._connector: Optional[aiohttp.TCPConnector] = None
+
+    def connector(self) -> aiohttp.TCPConnector:
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=60)
+        return self._connector
+
+    async def close(self):
+        if self._connector and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
 
 class WiseOldManAPI:
-    """Service class for WiseOldMan API integration"""
-    
-    def __init__(self, api_key: str, group_id: str):
+    """Service class for WiseOldMan API integration
+
+    One session is kept for the life of the bot so connections are reused
+    across calls; pass a shared `pool` to share connections and the rate
+    limiter with other groups' clients. Rate-limited (429) and transient server errors are
+    retried with jittered exponential backoff, waiting at least as long as
+    the API's Retry-After header asks.
+    """
+
+    def __init__(self, api_key: str, group_id: str, timeout: float = 30.0, max_retries: int = 3,
+                 backoff_base: float = 1.0, backoff_max: float = 30.0, max_retry_after: float = 120.0,
+                 requests_per_minute: int = 0, pool: Optional[WOMConnectionPool] = None):
         self.api_key = api_key
         self.group_id = group_id
         self.base_url = "https://api.wiseoldman.net/v2"
         self.logger = logging.getLogger("wom_bot.api")
-        
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.stats: Dict[str, EndpointStats] = {}
+        self._owns_pool = pool is None
+        self.pool = pool or WOMConnectionPool(requests_per_minute)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=self.pool.connector(),
+                connector_owner=False,
+                timeout=aiohttp.ClientTimeout(total=self.timeout, connect=10),
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+        return self._session
+
+    async def close(self):
+        """Close the session, and the pool unless it is shared"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._owns_pool:
+            await self.pool.close()
+
+    def _retry_after(self, response: aiohttp.ClientResponse) -> Optional[float]:
+        """Seconds the API asked us to wait, from Retry-After (seconds or an HTTP date)"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        # Full jitter spreads retries out; Retry-After is a floor, never shortened
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        return max(delay, retry_after) if retry_after is not None else delay
+
+    async def _request(self, method: str, path: str, endpoint: str) -> Tuple[int, Any]:
+        """Send a request with retries; returns (status, body) of the final attempt
+
+        Raises the last network error if every attempt failed without a response.
+        """
+        url = f"{self.base_url}{path}"
+        stats = self.stats.setdefault(endpoint, EndpointStats())
+
+        for attempt in range(self.max_retries + 1):
+            if self.pool.limiter:
+                await self.pool.limiter.acquire()
+            started = time.monotonic()
+            stats.requests += 1
+            retry_after = None
+            try:
+                async with self._get_session().request(method, url) as response:
+                    try:
+                        data = await response.json(content_type=None)
+                    except ValueError:
+                        data = await response.text()
+                    stats.latencies.append(time.monotonic() - started)
+
+                    if response.status not in RETRY_STATUSES:
+                        if response.status >= 400:
+                            stats.errors += 1
+                        return response.status, data
+
+                    stats.errors += 1
+                    retry_after = self._retry_after(response)
+                    if attempt == self.max_retries or (retry_after or 0) > self.max_retry_after:
+                        return response.status, data
+                    self.logger.warning(f"WOM {endpoint} returned {response.status}; retrying")
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                stats.latencies.append(time.monotonic() - started)
+                stats.errors += 1
+                if attempt == self.max_retries:
+                    raise
+                self.logger.warning(f"WOM {endpoint} request failed ({e.__class__.__name__}); retrying")
+
+            stats.retries += 1
+            await asyncio.sleep(self._backoff(attempt, retry_after))
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint request, error and retry counts with latency percentiles"""
+        return {endpoint: stats.summary() for endpoint, stats in self.stats.items()}
+
     async def update_all_members(self) -> Dict[str, Any]:
         """
         Trigger update for all members in the group
-        Returns response data or raises exception
+        Returns response data or raises exception; `count` is how many outdated
+        players WOM queued, when it says
         """
-        url = f"{self.base_url}/groups/{self.group_id}/update-all"
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         self.logger.info(f"Triggering update for WOM group {self.group_id}")
-        
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers) as response:
-                    response_data = await response.json()
-                    
-                    if response.status == 200:
-                        self.logger.info("WOM update request successful")
-                        return {
-                            "success": True,
-                            "message": "Update triggered successfully",
-                            "data": response_data
-                        }
-                    else:
-                        error_msg = f"WOM API error: {response.status} - {response_data}"
-                        self.logger.error(error_msg)
-                        return {
-                            "success": False,
-                            "message": error_msg,
-                            "status_code": response.status
-                        }
-                        
-        except aiohttp.ClientError as e:
-            error_msg = f"Network error calling WOM API: {str(e)}"
+            status, response_data = await self._request("POST", f"/groups/{self.group_id}/update-all", "update-all")
+
+            if status == 200:
+                self.logger.info("WOM update request successful")
+                return {
+                    "success": True,
+                    "message": "Update triggered successfully",
+                    "data": response_data,
+                    "count": response_data.get("count") if isinstance(response_data, dict) else None
+                }
+            else:
+                error_msg = f"WOM API error: {status} - {response_data}"
+                self.logger.error(error_msg)
+                return {
+                    "success": False,
+                    "message": error_msg,
+                    "status_code": status
+                }
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error_msg = f"Network error calling WOM API: {str(e) or e.__class__.__name__}"
             self.logger.error(error_msg)
             return {
                 "success": False,
                 "message": error_msg,
-                "error": str(e)
+                "error": str(e) or e.__class__.__name__
             }
         except Exception as e:
             error_msg = f"Unexpected error calling WOM API: {str(e)}"
@@ -62,36 +221,129 @@ class WiseOldManAPI:
                 "message": error_msg,
                 "error": str(e)
             }
-    
+
     async def get_group_info(self) -> Dict[str, Any]:
         """Get group information for verification"""
-        url = f"{self.base_url}/groups/{self.group_id}"
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    response_data = await response.json()
-                    
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "data": response_data
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "message": f"Failed to get group info: {response.status}",
-                            "status_code": response.status
-                        }
-                        
+            status, response_data = await self._request("GET", f"/groups/{self.group_id}", "group")
+
+            if status == 200:
+                return {
+                    "success": True,
+                    "data": response_data
+                }
+            else:
+                return {
+                    "success": False,
+                    "message": f"Failed to get group info: {status}",
+                    "status_code": status
+                }
+
         except Exception as e:
             return {
                 "success": False,
                 "message": f"Error getting group info: {str(e)}",
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+
+    async def get_group_members(self) -> List[Dict[str, Any]]:
+        """The group's players, with their updatedAt and lastChangedAt timestamps"""
+        result = await self.get_group_info()
+        if not result["success"]:
+            raise RuntimeError(result["message"])
+        return [membership["player"] for membership in result["data"].get("memberships", []) if membership.get("player")]
+
+    async def update_player(self, username: str) -> bool:
+        """Ask WOM to refresh one player from the hiscores"""
+        try:
+            status, response_data = await self._request("POST", f"/players/{username}", "update-player")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.warning(f"Failed to update {username}: {str(e) or e.__class__.__name__}")
+            return False
+
+        if status != 200:
+            message = response_data.get("message", status) if isinstance(response_data, dict) else status
+            self.logger.warning(f"Failed to update {username}: {message}")
+            return False
+        return True
+
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    def select_stale_players(self, players: List[Dict[str, Any]], stale_after: timedelta,
+                             max_updates: int = 0) -> List[Dict[str, Any]]:
+        """Players not updated within stale_after, most recently active first
+
+        A recent lastChangedAt means the player is playing and likely has new
+        gains; players who haven't changed in a long time go last, so a
+        max_updates cap cuts the least useful updates.
+        """
+        now = datetime.now(timezone.utc)
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+        stale = []
+        for player in players:
+            updated_at = self._parse_timestamp(player.get("updatedAt"))
+            if updated_at is None or now - updated_at >= stale_after:
+                stale.append(player)
+
+        stale.sort(key=lambda player: (self._parse_timestamp(player.get("lastChangedAt")) or oldest,
+                                       now - (self._parse_timestamp(player.get("updatedAt")) or oldest)),
+                   reverse=True)
+        return stale[:max_updates] if max_updates > 0 else stale
+
+    async def update_stale_members(self, stale_after: timedelta, concurrency: int = 4, max_updates: int = 0,
+                                   on_progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """Update only group members whose data is older than stale_after
+
+        Updates run with at most `concurrency` in flight. on_progress(done, total)
+        is called after each player. The result has the same success/message
+        keys as update_all_members, plus member, stale and updated counts, the
+        names that failed, and each successful update's duration in seconds.
+        """
+        self.logger.info(f"Updating stale members of WOM group {self.group_id} (older than {stale_after})")
+
+        try:
+            players = await self.get_group_members()
+        except Exception as e:
+            error_msg = f"Failed to fetch group members: {str(e)}"
+            self.logger.error(error_msg)
+            return {"success": False, "message": error_msg, "error": str(e)}
+
+        stale = self.select_stale_players(players, stale_after, max_updates)
+        semaphore = asyncio.Semaphore(concurrency)
+        failed: List[str] = []
+        durations: List[float] = []
+        done = 0
+
+        async def update(player: Dict[str, Any]):
+            nonlocal done
+            async with semaphore:
+                started = time.monotonic()
+                if await self.update_player(player["username"]):
+                    durations.append(time.monotonic() - started)
+                else:
+                    failed.append(player.get("displayName") or player["username"])
+            done += 1
+            if on_progress:
+                on_progress(done, len(stale))
+
+        await asyncio.gather(*(update(player) for player in stale))
+
+        updated = len(stale) - len(failed)
+        self.logger.info(f"Updated {updated}/{len(stale)} stale players ({len(players)} members, {len(failed)} failed)")
+        return {
+            # Individual players failing (e.g. renamed or banned accounts) doesn't fail the run
+            "success": updated > 0 or not stale,
+            "message": f"Updated {updated} of {len(stale)} stale players",
+            "members": len(players),
+            "stale": len(stale),
+            "updated": updated,
+            "failed": failed,
+            "durations": durations
+        }
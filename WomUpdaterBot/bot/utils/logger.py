@@ -1,47 +1,120 @@
+import asyncio
+import io
 import logging
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 import discord
 
 class DiscordLogHandler(logging.Handler):
-    """Custom log handler that sends messages to a Discord channel"""
+    """Log handler that ships WARNING+ records to a Discord channel in batches
+
+    Records are buffered and sent together every `flush_interval` seconds as
+    one code-block message, or as an attached file when they don't fit.
+    Repeats of the same message within a batch are collapsed with a count, and
+    records beyond `max_records` per batch are dropped and counted rather than
+    queued without bound. Records logged before the bot is ready are kept
+    for the first flush.
+    """
+    
+    MESSAGE_LIMIT = 2000
     
-    def __init__(self, bot: Optional[discord.Client] = None, channel_id: Optional[int] = None):
-        super().__init__()
+    def __init__(self, bot: Optional[discord.Client] = None, channel_id: Optional[int] = None,
+                 flush_interval: float = 10.0, max_records: int = 200):
+        super().__init__(level=logging.WARNING)
         self.bot = bot
         self.channel_id = channel_id
         self.channel = None
+        self.flush_interval = flush_interval
+        self.max_records = max_records
+        # message -> [first formatted line, repeat count]; insertion order is log order
+        self._buffer: Dict[str, list] = {}
+        self._dropped = 0
+        self._task: Optional[asyncio.Task] = None
+        self.sent_batches = 0
+        self.dropped_total = 0
         
     def set_bot(self, bot: discord.Client, channel_id: Optional[int] = None):
-        """Set the bot instance after initialization"""
+        """Set the bot instance after initialization and start the flush loop"""
         self.bot = bot
         if channel_id:
             self.channel_id = channel_id
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop())
         
     def emit(self, record: logging.LogRecord):
-        """Send log message to Discord channel"""
-        if not self.bot or not self.bot.is_ready():
-            return
-            
+        """Buffer a record for the next batch; never blocks or touches the network"""
         try:
-            # Get the channel if not cached
-            if not self.channel and self.channel_id:
-                self.channel = self.bot.get_channel(self.channel_id)
-            
-            if self.channel and record.levelno >= logging.WARNING:
-                # Only send WARNING and above to Discord
-                message = self.format(record)
-                # Truncate long messages
-                if len(message) > 2000:
-                    message = message[:1997] + "..."
-                
-                # Use asyncio to send message
-                import asyncio
-                asyncio.create_task(self.channel.send(f"```\n{message}\n```"))
-                
+            key = f"{record.levelname}:{record.getMessage()}"
+            entry = self._buffer.get(key)
+            if entry:
+                entry[1] += 1
+            elif len(self._buffer) < self.max_records:
+                self._buffer[key] = [self.format(record), 1]
+            else:
+                self._dropped += 1
         except Exception:
             # Don't let logging errors crash the bot
-            pass
+            self.handleError(record)
+    
+    def _take_batch(self):
+        # handle() holds self.lock while emitting, possibly from another thread
+        self.acquire()
+        try:
+            batch, dropped = list(self._buffer.values()), self._dropped
+            self._buffer, self._dropped = {}, 0
+        finally:
+            self.release()
+        return batch, dropped
+    
+    @staticmethod
+    def _render(batch: List[list], dropped: int) -> str:
+        lines = [line if count == 1 else f"{line} (x{count})" for line, count in batch]
+        if dropped:
+            lines.append(f"... {dropped} more records dropped (buffer full)")
+        return "\n".join(lines)
+    
+    async def flush_batch(self):
+        """Send everything buffered so far"""
+        if not self.bot or not self.bot.is_ready() or not self.channel_id:
+            return
+        if not self.channel:
+            self.channel = self.bot.get_channel(self.channel_id)
+            if not self.channel:
+                return
+        
+        batch, dropped = self._take_batch()
+        if not batch and not dropped:
+            return
+        
+        text = self._render(batch, dropped)
+        # Paced with the bot's other sends when it has a shared queue
+        outbound = getattr(self.bot, 'outbound', None)
+        send = (lambda **kwargs: outbound.send(self.channel, **kwargs)) if outbound else self.channel.send
+        try:
+            if len(text) + 8 <= self.MESSAGE_LIMIT:
+                await send(content=f"```\n{text}\n```")
+            else:
+                records = sum(count for _, count in batch) + dropped
+                await send(content=f"📄 {records} log records",
+                           file=discord.File(io.BytesIO(text.encode('utf-8')), filename="wom_bot_log.txt"))
+            self.sent_batches += 1
+        except Exception:
+            # Never log from here: the record would come straight back into the buffer
+            self.dropped_total += len(batch)
+        self.dropped_total += dropped
+    
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush_batch()
+    
+    async def shutdown(self):
+        """Stop the flush loop and send whatever is still buffered"""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush_batch()
 
 def setup_logger(name: str = "wom_bot", level: str = "INFO") -> logging.Logger:
     """Setup logger with console and optional Discord handlers"""